@@ -33,6 +33,7 @@ class Identifier:
       """Generates unique identifier of specified length.
       
       Generates unique identifiers using token_hex function of secrets modules.
+      Expects _lock_identity_active to be held.
       
       Parameters
       ----------
@@ -47,15 +48,10 @@ class Identifier:
       
       identifier = None
       
-      Identifier._lock_identity_active.acquire()
-      
-      try:
-         while ((not identifier)
-            or (identifier in Identifier.identity_active.keys())
-         ):
-            identifier = token_hex(identifier_length)
-      finally:
-         Identifier._lock_identity_active.release()
+      while ((not identifier)
+         or (identifier in Identifier.identity_active.keys())
+      ):
+         identifier = token_hex(identifier_length)
       
       return identifier
    
@@ -78,12 +74,17 @@ class Identifier:
          Returns unique identifier.
       """
       
-      identifier = Identifier._generate(identifier_length=identifier_length)
+      owner      = str(owner)
       
       Identifier._lock_identity_active.acquire()
       
       try:
-         Identifier.identity_active[identifier] = str(owner)
+         # Generated and mapped under single lock, keeping it unique.
+         identifier = Identifier._generate(
+            identifier_length=identifier_length,
+         )
+         
+         Identifier.identity_active[identifier] = owner
       finally:
          Identifier._lock_identity_active.release()
       
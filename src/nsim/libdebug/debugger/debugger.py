@@ -44,6 +44,8 @@ class Debugger:
       self,
       
       activate       = None,
+      stats          = False,
+      intervals      = False,
       get_object     = False,
       
       non_blocking   = False,
@@ -52,12 +54,17 @@ class Debugger:
       """Provides access to basesocket's progress mechanism.
       
       Provides acces to progress mechanism attached to basesocket and allows
-      quick tasks like activation or deactivation.
+      quick tasks like activation or deactivation, or retrieving its per-tick
+      telemetry (stats) and intervals in use (as tuned, if adaptive).
       
       Parameters
       ----------
       activate : bool, NoneType, default=None
          Alter the state of basesocket's progress mechanism.
+      stats : bool, default=False
+         Retrieve telemetry of basesocket's progress mechanism ?
+      intervals : bool, default=False
+         Retrieve intervals in use by basesocket's progress mechanism ?
       get_object : bool, default=False
          Retrieves progress mechanism object attached with basesocket.
       non_blocking : bool, default=False
@@ -71,10 +78,14 @@ class Debugger:
          Returns progress mechanism object attached to basesocket.
       bool
          Returns True on normal interation with progress mechanism's state.
+      dict
+         Returns telemetry or intervals of progress mechanism attached to
+         basesocket.
       str
          Returns progress mechanism's type (name) attached to basesocket.
       NoneType
-         Returns None if invalid configuration or parameters.
+         Returns None if invalid configuration or parameters, or telemetry
+         or intervals are not supported by progress mechanism.
       """
       
       if (not self.basesocket):
@@ -89,6 +100,16 @@ class Debugger:
                non_blocking   = non_blocking,
                thread_timeout = thread_timeout,
             ))
+         elif (stats):
+            if (not hasattr(self.basesocket._progress_mechanism, 'stats')):
+               return None
+            
+            return (self.basesocket._progress_mechanism.stats())
+         elif (intervals):
+            if (not hasattr(self.basesocket._progress_mechanism, 'intervals')):
+               return None
+            
+            return (self.basesocket._progress_mechanism.intervals())
          elif (get_object):
             return (self.basesocket._progress_mechanism)
          else:
@@ -223,19 +244,24 @@ class Debugger:
    
    def queues (
       self,
-      name       = '',
-      index      = 0,
-      sub_index  = 0,
-      state      = False,
-      contents   = False,
-      get_object = False,
+      name          = '',
+      index         =  0,
+      sub_index     =  0,
+      state         = False,
+      stats         = False,
+      contents      = False,
+      get_object    = False,
+      version       = False,
+      offset        =  0,
+      limit         = -1,
+      since_version = None,
    ):
       """Provides access to basesocket's queue buffers.
       
       Provides access to basesocket's queue buffers and allows fetching
       individual queue buffers and their data based on their name or index
-      or index and sub_index. Data can range from queue buffer's state to their
-      contents and even queue buffer objects.
+      or index and sub_index. Data can range from queue buffer's state and
+      telemetry (stats) to their contents and even queue buffer objects.
       
       Parameters
       ----------
@@ -247,10 +273,22 @@ class Debugger:
          Sub index in the queue buffer set for the details to be fetched.
       state : bool, default=False
          Retrieve current state of queue buffers attached with basesocket ?
+      stats : bool, default=False
+         Retrieve telemetry of queue buffers attached with basesocket ?
       contents : bool, default=False
          Retrieve contents of queue buffers attached with basesocket ?
       get_object : bool, default=False
          Retrieve queue buffer objects attached with basesocket ?
+      version : bool, default=False
+         Retrieve contents version of queue buffers attached with basesocket ?
+      offset : int, default=0
+         Number of data (items) to skip, while retrieving contents.
+      limit : int, default=-1
+         Maximum number of data (items) to retrieve as contents, negative for
+         all.
+      since_version : int, NoneType, default=None
+         Contents version of searched queue buffer previously retrieved, to
+         retrieve None as contents if unchanged since.
       
       Returns
       -------
@@ -258,6 +296,11 @@ class Debugger:
          Returns list of details for all queue buffers attached to basesocket.
       int
          Returns state of searched queue buffer attached to basesocket.
+      dict
+         Returns telemetry of searched queue buffer attached to basesocket.
+      object
+         Returns (window of) contents of searched queue buffer attached to
+         basesocket, None if unchanged since since_version.
       bool
          Returns True if searched queue buffer is present.
       object
@@ -326,10 +369,18 @@ class Debugger:
                if (get_object):
                   pass
                elif (contents):
-                  queue_data = (queue_data.contents())
+                  queue_data = (queue_data.contents(
+                     offset        = offset,
+                     limit         = limit,
+                     since_version = since_version,
+                  ))
                   # queue_data = (queue_data._queue.copy())
                elif (state):
                   queue_data = (queue_data.state(full=True, value=True))
+               elif (stats):
+                  queue_data = (queue_data.stats())
+               elif (version):
+                  queue_data = (queue_data.version())
                else:
                   queue_data = True
             elif (
@@ -346,7 +397,7 @@ class Debugger:
                      pass
                   elif (contents):
                      queue_data = [
-                        (queue.contents())
+                        (queue.contents(offset=offset, limit=limit))
                         # (queue._queue.copy())
                         for queue in queue_data
                      ]
@@ -355,6 +406,16 @@ class Debugger:
                         (queue.state(full=True, value=True))
                         for queue in queue_data
                      ]
+                  elif (stats):
+                     queue_data = [
+                        (queue.stats())
+                        for queue in queue_data
+                     ]
+                  elif (version):
+                     queue_data = [
+                        (queue.version())
+                        for queue in queue_data
+                     ]
                   else:
                      queue_data = True
                else:
@@ -371,8 +432,8 @@ class Debugger:
                   if (get_object)
                   else (
                      [
-                        queue[0].contents(), # up_down
-                        queue[1].contents(), # down_up
+                        queue[0].contents(offset=offset, limit=limit), # up_down
+                        queue[1].contents(offset=offset, limit=limit), # down_up
                         # queue[0]._queue.copy(), # up_down
                         # queue[1]._queue.copy(), # down_up
                      ]
@@ -385,32 +446,46 @@ class Debugger:
                         if (state)
                         else (
                            [
-                              (queue_index + 1),
-                              [  # queue_1
-                                 queue_name[0],
-                                 [
-                                    (queue_index + 1),
-                                    1,
-                                 ],
-                                 [
-                                    queue[0].state(full=True, value=True),
-                                    queue[0].state(capacity=True),
-                                    queue[0].queue_type(describe=True),
-                                 ],
-                              ],
-                              [  # queue_2
-                                 queue_name[1],
+                              queue[0].stats(), # up_down
+                              queue[1].stats(), # down_up
+                           ]
+                           if (stats)
+                           else (
+                              [
+                                 queue[0].version(), # up_down
+                                 queue[1].version(), # down_up
+                              ]
+                              if (version)
+                              else (
                                  [
                                     (queue_index + 1),
-                                    2,
-                                 ],
-                                 [
-                                    queue[1].state(full=True, value=True),
-                                    queue[1].state(capacity=True),
-                                    queue[1].queue_type(describe=True),
-                                 ],
-                              ],
-                           ]
+                                    [  # queue_1
+                                       queue_name[0],
+                                       [
+                                          (queue_index + 1),
+                                          1,
+                                       ],
+                                       [
+                                          queue[0].state(full=True, value=True),
+                                          queue[0].state(capacity=True),
+                                          queue[0].queue_type(describe=True),
+                                       ],
+                                    ],
+                                    [  # queue_2
+                                       queue_name[1],
+                                       [
+                                          (queue_index + 1),
+                                          2,
+                                       ],
+                                       [
+                                          queue[1].state(full=True, value=True),
+                                          queue[1].state(capacity=True),
+                                          queue[1].queue_type(describe=True),
+                                       ],
+                                    ],
+                                 ]
+                              )
+                           )
                         )
                      )
                   )
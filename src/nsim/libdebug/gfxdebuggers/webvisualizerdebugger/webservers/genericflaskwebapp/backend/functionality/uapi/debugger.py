@@ -320,23 +320,24 @@ class Debugger:
                Debugger.debugger.basesocket = basesocket_object
                
                data = {
-                  'index'  : index,
-                  'status' : basesocket_object._status,
-                  'state'  : (
+                  'index'        : index,
+                  'status'       : basesocket_object._status,
+                  'state'        : (
                      Debugger.debugger.progress_mechanism(
                         get_object=True,
                      ).state(
                         describe=False,
                      )
                   ),
-                  'mode'   : (
+                  'mode'         : (
                      Debugger.debugger.progress_mechanism(
                         get_object=True,
                      ).mode(
                         describe=True,
                      )
                   ),
-                  'queues' : Debugger.debugger.queues(state=True),
+                  'queues'       : Debugger.debugger.queues(state=True),
+                  'queues_stats' : Debugger.debugger.queues(stats=True),
                }
             else:
                data = dict()
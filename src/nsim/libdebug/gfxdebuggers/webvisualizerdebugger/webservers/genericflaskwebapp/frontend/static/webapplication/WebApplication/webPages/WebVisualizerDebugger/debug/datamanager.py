@@ -85,6 +85,11 @@ class DataManager:
             else
             'layers'
          ))
+         
+         if (queue):
+            DataManager.state_sockets[
+               state_socket.get('index')
+            ]['queues_stats'] = state_socket.get('queues_stats')
       
       return True
    
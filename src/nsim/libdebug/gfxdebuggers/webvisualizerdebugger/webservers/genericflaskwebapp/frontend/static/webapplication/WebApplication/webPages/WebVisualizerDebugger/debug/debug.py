@@ -766,6 +766,32 @@ class Debug:
                   )).addClass(
                      'debug-queue-slot-active'
                   )
+               
+               # debug-queue-row title (telemetry)
+               queues_stats = (state_socket.get('queues_stats') or [])
+               
+               if (queue_index >= len(queues_stats)):
+                  continue
+               
+               for row_index, queue_stats in enumerate(
+                  queues_stats[queue_index]
+               ):
+                  jquery((
+                     Debug.cardStripIdentifier
+                     + ' .debug-card-item.debug-card-item-index-{0}'.format(
+                           state_socket.get('index'),
+                        )
+                     + ' .debug-queues-slab'
+                     + '.debug-queues-slab-index-{0}'.format(
+                           (queue_index + 1),
+                        )
+                     + ' .debug-queue-row.debug-queue-row-{0}'.format(
+                           (row_index + 1),
+                        )
+                  )).attr(
+                     'title',
+                     Debug.resolve_queue_stats_str(queue_stats=queue_stats),
+                  )
       
       return None
    
@@ -824,6 +850,27 @@ class Debug:
       
       return 'invalid configuration'
    
+   def resolve_queue_stats_str (
+      event       = None,
+      queue_stats = None,
+   ):
+      if (not queue_stats):
+         return ''
+      
+      return (
+           'in: {0} / out: {1} / rejected: {2}\n'
+         + 'high watermark: {3}\n'
+         + 'mean occupancy: {4:.2f}\n'
+         + 'mean sojourn: {5:.2f} ms'
+      ).format(
+         queue_stats.get('items_in', 0),
+         queue_stats.get('items_out', 0),
+         queue_stats.get('items_rejected', 0),
+         queue_stats.get('high_watermark', 0),
+         float(queue_stats.get('occupancy_mean', 0)),
+         (float(queue_stats.get('sojourn_mean', 0)) * 1000),
+      )
+   
    def showConnectionError (reloadFunction=None):
       App.webPages.PageStructure.showConnectionError(
          body=DataManager.dataRetrieveErrorMessage,
@@ -8,6 +8,10 @@ class DoubleEndedDirectConnector:
    
    Double Ended Direct Connector (DEDC) directly connects two sockets or ends
    using queue streams and allows direct data flow between them.
+   Streams may be shared memory queue buffers (sockets' physical facing queue
+   buffers, with BaseSocket's layer_queue_kwargs queue_engine set to
+   QUEUE_ENGINE_SHARED), which are picklable, so that a connector set up with
+   streams only may run in another process, driven by calls to process().
    
    Attributes
    ----------
@@ -197,6 +201,8 @@ class DoubleEndedDirectConnector:
       Sets or unsets socket objects only if parameter is not None.
       Unsets only if parameters are False.
       Also clears notification alerts set with corresponding sockets.
+      Sockets sharing a progress mechanism are registered with only once, so
+      that links are processed once per trigger.
       
       Parameters
       ----------
@@ -232,13 +238,6 @@ class DoubleEndedDirectConnector:
                stream_end_1_out = socket_1._layer_queues[-1][0],
                stream_end_1_in  = socket_1._layer_queues[-1][1],
             )
-            
-            self._identifier_socket_1 = (
-               self._socket_1.ProgressionSystem.notification_alert(
-                  self._socket_1,
-                  callback = self._callback_notification,
-                  times    = -1,
-            ))
       
       if (socket_2 is not None):
          if (
@@ -246,7 +245,7 @@ class DoubleEndedDirectConnector:
             and self._identifier_socket_2
          ):
             self._socket_2.ProgressionSystem.notification_alert(
-               self._socket_1,
+               self._socket_2,
                identifier=self._identifier_socket_2,
                unregister=True,
             )
@@ -261,13 +260,50 @@ class DoubleEndedDirectConnector:
                stream_end_2_out = socket_2._layer_queues[-1][0],
                stream_end_2_in  = socket_2._layer_queues[-1][1],
             )
-            
-            self._identifier_socket_2 = (
-               self._socket_2.ProgressionSystem.notification_alert(
-                  self._socket_2,
-                  callback = self._callback_notification,
-                  times    = -1,
-            ))
+      
+      shared = bool(
+             self._socket_1
+         and self._socket_2
+         and (
+               self._socket_1._progress_mechanism
+            is self._socket_2._progress_mechanism
+         )
+      )
+      
+      if (
+             self._socket_1
+         and (not self._identifier_socket_1)
+      ):
+         self._identifier_socket_1 = (
+            self._socket_1.ProgressionSystem.notification_alert(
+               self._socket_1,
+               callback = self._callback_notification,
+               times    = -1,
+         ))
+      
+      if (
+             self._socket_2
+         and self._identifier_socket_2
+         and shared
+      ):
+         self._socket_2.ProgressionSystem.notification_alert(
+            self._socket_2,
+            identifier=self._identifier_socket_2,
+            unregister=True,
+         )
+         
+         self._identifier_socket_2 = None
+      elif (
+             self._socket_2
+         and (not self._identifier_socket_2)
+         and (not shared)
+      ):
+         self._identifier_socket_2 = (
+            self._socket_2.ProgressionSystem.notification_alert(
+               self._socket_2,
+               callback = self._callback_notification,
+               times    = -1,
+         ))
       
       return None
    
@@ -450,14 +486,20 @@ class DoubleEndedDirectConnector:
             )
          )
       ):
-         data                       = self._stream_end_1_out.flow_out(
-            data_length=1,
+         data                       = self._stream_end_1_out.flow_out_bytes(
+            max_len=min(
+               bytes_remaining,
+               (
+                    self._byte_rate_stream_end_1_end_2
+                  - len(self._data_end_1_end_2)
+               ),
+            ),
          )
          
          if (data):
             self._data_end_1_end_2 += data
             
-            bytes_remaining        -= 1
+            bytes_remaining        -= len(data)
             retries                 = self._retries
          else:
             retries                -= 1
@@ -485,14 +527,14 @@ class DoubleEndedDirectConnector:
          and  retries
          and (self._data_end_1_end_2)
       ):
-         data_length         = self._stream_end_2_in.flow_in(
-            data=[self._data_end_1_end_2[0]],
+         data_length         = self._stream_end_2_in.flow_in_bytes(
+            self._data_end_1_end_2[:bytes_remaining],
          )
          
          if (data_length):
-            self._data_end_1_end_2.pop(0)
+            del self._data_end_1_end_2[:data_length]
             
-            bytes_remaining -= 1
+            bytes_remaining -= data_length
             retries          = self._retries
          else:
             retries         -= 1
@@ -562,14 +604,20 @@ class DoubleEndedDirectConnector:
             )
          )
       ):
-         data                       = self._stream_end_2_out.flow_out(
-            data_length=1,
+         data                       = self._stream_end_2_out.flow_out_bytes(
+            max_len=min(
+               bytes_remaining,
+               (
+                    self._byte_rate_stream_end_2_end_1
+                  - len(self._data_end_2_end_1)
+               ),
+            ),
          )
          
          if (data):
             self._data_end_2_end_1 += data
             
-            bytes_remaining        -= 1
+            bytes_remaining        -= len(data)
             retries                 = self._retries
          else:
             retries                -= 1
@@ -597,14 +645,14 @@ class DoubleEndedDirectConnector:
          and  retries
          and (self._data_end_2_end_1)
       ):
-         data_length         = self._stream_end_1_in.flow_in(
-            data=[self._data_end_2_end_1[0]],
+         data_length         = self._stream_end_1_in.flow_in_bytes(
+            self._data_end_2_end_1[:bytes_remaining],
          )
          
          if (data_length):
-            self._data_end_2_end_1.pop(0)
+            del self._data_end_2_end_1[:data_length]
             
-            bytes_remaining -= 1
+            bytes_remaining -= data_length
             retries          = self._retries
          else:
             retries         -= 1
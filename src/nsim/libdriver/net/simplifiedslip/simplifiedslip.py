@@ -8,7 +8,11 @@ from threading import (
 
 import nsim as app
 
-class SimplifiedSLIP:
+from nsim.libhardwareinterface.queue.streampark import (
+   StreamPark as _StreamPark,
+)
+
+class SimplifiedSLIP (_StreamPark):
    """Simplified version of SLIP (protocol).
    
    Simplified / stub version of SLIP (protocol), used to demonstrate nsim's
@@ -22,7 +26,8 @@ class SimplifiedSLIP:
    _byte_rate_stream_down_out : int
       Downlink transfer rate.
    _retries : int
-      Number of retries to perform before giving up, during byte transfer.
+      Number of retries to perform upon empty lower layer's queue (stream),
+      before giving up, during downlink byte transfer.
    _stream_up_in : object
       Queue (stream) object, to upper layer, for downlink.
    _stream_up_out : object
@@ -39,6 +44,8 @@ class SimplifiedSLIP:
       Concurrency lock for uplink transfer processing.
    _lock_process_data_down_up : Lock
       Concurrency lock for downlink transfer processing.
+   _streams_parked : set
+      Queue (stream) objects transfers into are parked (see StreamPark).
    
    Methods
    -------
@@ -52,6 +59,12 @@ class SimplifiedSLIP:
       Processes uplink transfer.
    _process_data_down_up ()
       Processes downlink transfer.
+   _stream_flow_in ()
+      Pushes packet into queue (stream), parking transfer if full.
+   _stream_drops ()
+      Query whether queue (stream) drops data it can not admit.
+   _stream_park ()
+      Parks transfer upon full queue (stream), until it becomes writable.
    """
    
    # Needs heavy re-work including variable name changes, re-framing structure,
@@ -89,7 +102,9 @@ class SimplifiedSLIP:
       byte_rate_stream_down_out : int, default=60
          Downlink transfer rate.
       retries : int, default=10
-         Number of retries to perform before giving up, during byte transfer.
+         Number of retries to perform upon empty lower layer's queue (stream),
+         before giving up, during downlink byte transfer. Uplink transfers
+         park upon full queue (stream) instead.
       """
       
       self._byte_rate_stream_down_in  = abs(int(byte_rate_stream_down_in))
@@ -108,6 +123,8 @@ class SimplifiedSLIP:
       self._lock_process_data_up_down = Lock()
       self._lock_process_data_down_up = Lock()
       
+      super().__init__()
+      
       self.stream(
          stream_up_in    = stream_up_in,
          stream_up_out   = stream_up_out,
@@ -144,16 +161,20 @@ class SimplifiedSLIP:
       """
       
       if (stream_up_in is not None):
-         self._stream_up_in    = stream_up_in
+         self._stream_unpark(self._stream_up_in)
+         
+         self._stream_up_in          = stream_up_in
       
       if (stream_up_out is not None):
-         self._stream_up_out   = stream_up_out
+         self._stream_up_out         = stream_up_out
       
       if (stream_down_in is not None):
-         self._stream_down_in  = stream_down_in
+         self._stream_unpark(self._stream_down_in)
+         
+         self._stream_down_in        = stream_down_in
       
       if (stream_down_out is not None):
-         self._stream_down_out = stream_down_out
+         self._stream_down_out       = stream_down_out
       
       return None
    
@@ -165,39 +186,42 @@ class SimplifiedSLIP:
       """Processes link transfers, threading capable.
       
       Enqueues single uplink and downlink transfers if not already queued.
+      In blocking mode, runs them right away on caller's thread instead, and
+      reports whether either made progress, so that callers (like trigger's
+      until_idle binds) can repeat them until idle.
       
       Parameters
       ----------
       non_blocking : bool, default=True
          Run transfers in non-blocking mode ?
       thread_timeout : int, float, NoneType, default=None
-         Thread timeout if running in blocking mode.
+         Unused, as blocking mode runs transfers on caller's thread.
       
       Returns
       -------
       NoneType
-         Returns None.
+         Returns None in non-blocking mode.
+      bool
+         Returns True if either transfer made progress, in blocking mode.
       """
       
-      active_threads = list()
+      if (not non_blocking):
+         progress_up_down = self._process_data_up_down()
+         progress_down_up = self._process_data_down_up()
+         
+         return (progress_up_down or progress_down_up)
       
       if (not self._lock_process_data_up_down.locked()):
-         active_threads.append(Thread(
+         Thread(
             target = self._process_data_up_down,
             daemon = True,
-         ))
-         active_threads[-1].start()
+         ).start()
       
       if (not self._lock_process_data_down_up.locked()):
-         active_threads.append(Thread(
+         Thread(
             target = self._process_data_down_up,
             daemon = True,
-         ))
-         active_threads[-1].start()
-      
-      if (not non_blocking):
-         for active_thread in active_threads:
-            active_thread.join(timeout=thread_timeout)
+         ).start()
       
       return None
    
@@ -209,71 +233,70 @@ class SimplifiedSLIP:
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
       if (
             (not self._stream_up_out)
          or (not self._stream_down_in)
       ):
-         return None
+         return False
       
       self._lock_process_data_up_down.acquire()
       
       try:
-         self._process_data_stream_down_in()
+         progress = self._process_data_stream_down_in()
          
          if (self._data_up_down):
-            return None
+            return progress
          
-         data = self._stream_up_out.flow_out(data_length=1)
+         data     = self._stream_up_out.flow_out(data_length=1)
          
          if (not data):
-            return None
+            return progress
          
-         data = self._encapsulate(data[0])
+         data     = self._encapsulate(data[0])
          
          self._data_up_down.extend(data)
       finally:
          self._lock_process_data_up_down.release()
       
-      return None
+      return True
    
    def _process_data_stream_down_in (self):
       """Processes uplink transfer from internal buffer.
       
       Processes uplink transfer from internal buffer to uplink queue (stream)
-      for lower layer. If queue (stream) is already full, retries set amount
-      of times before giving up.
+      for lower layer. If queue (stream) is already full, parks transfer until
+      it becomes writable, skipping it meanwhile.
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
-      bytes_remaining = self._byte_rate_stream_down_in
-      retries         = self._retries
-      
-      while (
-              bytes_remaining
-         and  retries
-         and (self._data_up_down)
+      if (
+            (not self._data_up_down)
+         or (self._stream_parked(self._stream_down_in))
       ):
-         data_length         = self._stream_down_in.flow_in(
-            data=[self._data_up_down[0]],
-         )
-         
-         if (data_length):
-            self._data_up_down.pop(0)
-            
-            bytes_remaining -= 1
-            retries          = self._retries
-         else:
-            retries         -= 1
+         return False
       
-      return None
+      data_length        = min(
+         len(self._data_up_down),
+         self._byte_rate_stream_down_in,
+      )
+      data_length_pushed = (self._stream_down_in.flow_in_bytes(
+         self._data_up_down[:data_length],
+      ) or 0)
+      
+      del self._data_up_down[:data_length_pushed]
+      
+      if (data_length_pushed < data_length):
+         self._stream_park(self._stream_down_in)
+      
+      return bool(data_length_pushed)
    
    def _process_data_down_up (self):
       """Processes downlink transfer.
@@ -283,20 +306,20 @@ class SimplifiedSLIP:
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
       if (
             (not self._stream_up_in)
          or (not self._stream_down_out)
       ):
-         return None
+         return False
       
       self._lock_process_data_down_up.acquire()
       
       try:
-         self._process_data_stream_down_out()
+         progress = self._process_data_stream_down_out()
          
          if (
                (not self._data_down_up)
@@ -305,23 +328,30 @@ class SimplifiedSLIP:
                != flags.SPECIAL_END
             )
          ):
-            return None
-         
-         if (self._stream_up_in.state(full=True)):
-            return None
+            return progress
          
-         data = self._decapsulate(self._data_down_up)
+         if (self._stream_parked(self._stream_up_in)):
+            return progress
          
-         data_length = self._stream_up_in.flow_in(data=[data])
+         if (
+                self._stream_up_in.state(full=True)
+            and (not self._stream_drops(self._stream_up_in))
+         ):
+            self._stream_park(self._stream_up_in)
+            
+            return progress
          
-         if (not data_length):
-            return None
+         if (not self._stream_flow_in(
+            self._stream_up_in,
+            self._decapsulate(self._data_down_up),
+         )):
+            return progress
          
          self._data_down_up.clear()
       finally:
          self._lock_process_data_down_up.release()
       
-      return None
+      return True
    
    def _process_data_stream_down_out (self):
       """Processes uplink transfer to internal buffer.
@@ -332,8 +362,8 @@ class SimplifiedSLIP:
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
       bytes_remaining = self._byte_rate_stream_down_out
@@ -350,19 +380,20 @@ class SimplifiedSLIP:
             )
          )
       ):
-         data                = self._stream_down_out.flow_out(
-            data_length=1,
+         data                = self._stream_down_out.flow_out_bytes(
+            max_len   = bytes_remaining,
+            delimiter = flags.SPECIAL_END,
          )
          
          if (data):
             self._data_down_up += data
             
-            bytes_remaining -= 1
+            bytes_remaining -= len(data)
             retries          = self._retries
          else:
             retries         -= 1
       
-      return None
+      return (bytes_remaining < self._byte_rate_stream_down_out)
    
    def _encapsulate (
       self,
@@ -1,9 +1,13 @@
 from .queue import Queue as queue
+from .sharedqueue import SharedQueue as sharedqueue
+from .streampark import StreamPark as streampark
 from .flags import Flags as flags
 from .descriptors import Descriptors as descriptors
 
 __all__ = [
    'queue',
+   'sharedqueue',
+   'streampark',
    'flags',
    'descriptors',
 ]
@@ -0,0 +1,169 @@
+"""Benchmark - queue buffer storage engines.
+
+Compares linear, ring and spsc storage engines of queue buffer, for both
+normal and byte queue types, by measuring per-item dequeue and enqueue cost at
+various backlog depths.
+
+Usage::
+   
+   python -m nsim.libhardwareinterface.queue.bench
+   python -m nsim.libhardwareinterface.queue.bench --sizes 1000 100000
+"""
+
+import time
+import argparse
+
+from .queue import Queue as queue
+from .flags import Flags as flags
+
+def measure (
+   queue_type,
+   queue_engine,
+   size,
+   operations = 10000,
+):
+   """Measure queue buffer's per-item cost at specified backlog depth.
+   
+   Fills queue buffer up-to size items, then times operations single item
+   dequeues followed by as many single item enqueues, keeping backlog at
+   size throughout.
+   
+   Parameters
+   ----------
+   queue_type : int
+      Queue's buffer type.
+   queue_engine : int
+      Queue's storage engine.
+   size : int
+      Backlog depth (number of queued items).
+   operations : int, default=10000
+      Number of single item dequeues (and enqueues) to time.
+   
+   Returns
+   -------
+   dict
+      Returns fill time and per-item dequeue and enqueue time (in ns).
+   """
+   
+   operations   = max(1, min(int(operations), int(size)))
+   
+   queue_buffer = queue(
+      queue_type   = queue_type,
+      queue_engine = queue_engine,
+   )
+   
+   data         = (
+      bytes(size)
+      if (queue_type & flags.QUEUE_TYPE_BYTE)
+      else
+      [b'.'] * size
+   )
+   item         = (
+      b'.'
+      if (queue_type & flags.QUEUE_TYPE_BYTE)
+      else
+      [b'.']
+   )
+   
+   time_start   = time.perf_counter()
+   queue_buffer.flow_in(data)
+   time_fill    = time.perf_counter() - time_start
+   
+   time_start   = time.perf_counter()
+   
+   for _ in range(operations):
+      queue_buffer.flow_out(data_length=1)
+   
+   time_out     = time.perf_counter() - time_start
+   
+   time_start   = time.perf_counter()
+   
+   for _ in range(operations):
+      queue_buffer.flow_in(item)
+   
+   time_in      = time.perf_counter() - time_start
+   
+   return {
+      'fill_s'      : time_fill,
+      'flow_out_ns' : ((time_out / operations) * 1e9),
+      'flow_in_ns'  : ((time_in / operations) * 1e9),
+   }
+
+def execute (
+   sizes      = (1000, 100000, 1000000),
+   operations = 10000,
+):
+   """Run benchmark and print results as table.
+   
+   Parameters
+   ----------
+   sizes : tuple, list, default=(1000, 100000, 1000000)
+      Backlog depths to benchmark at.
+   operations : int, default=10000
+      Number of single item operations to time per measurement.
+   
+   Returns
+   -------
+   list
+      Returns list of results as [queue_type, queue_engine, size, result].
+   """
+   
+   results = list()
+   
+   print('{0:<8}{1:<8}{2:>10}{3:>12}{4:>16}{5:>16}'.format(
+      'type', 'engine', 'size', 'fill (s)', 'flow_out (ns)', 'flow_in (ns)',
+   ))
+   
+   for queue_type, queue_type_name in (
+      (flags.QUEUE_TYPE_NORMAL, 'normal'),
+      (flags.QUEUE_TYPE_BYTE,   'byte'),
+   ):
+      for size in sizes:
+         for queue_engine, queue_engine_name in (
+            (flags.QUEUE_ENGINE_LINEAR, 'linear'),
+            (flags.QUEUE_ENGINE_RING,   'ring'),
+            (flags.QUEUE_ENGINE_SPSC,   'spsc'),
+         ):
+            result = measure(
+               queue_type   = queue_type,
+               queue_engine = queue_engine,
+               size         = size,
+               operations   = operations,
+            )
+            
+            results.append([queue_type, queue_engine, size, result])
+            
+            print('{0:<8}{1:<8}{2:>10}{3:>12.4f}{4:>16.1f}{5:>16.1f}'.format(
+               queue_type_name,
+               queue_engine_name,
+               size,
+               result['fill_s'],
+               result['flow_out_ns'],
+               result['flow_in_ns'],
+            ))
+   
+   return results
+
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(
+      description='Benchmark queue buffer storage engines.',
+   )
+   parser.add_argument(
+      '--sizes',
+      nargs   = '+',
+      type    = int,
+      default = [1000, 100000, 1000000],
+      help    = 'backlog depths to benchmark at',
+   )
+   parser.add_argument(
+      '--operations',
+      type    = int,
+      default = 10000,
+      help    = 'single item operations to time per measurement',
+   )
+   parsed = parser.parse_args()
+   
+   execute(
+      sizes      = parsed.sizes,
+      operations = parsed.operations,
+   )
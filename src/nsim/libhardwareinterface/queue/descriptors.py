@@ -2,12 +2,38 @@ class Descriptors:
    """Descriptors for queue buffer.
    """
    
-   QUEUE_TYPE_NONE        = 'queue.type.none'
-   QUEUE_TYPE_NORMAL      = 'queue.type.normal'
-   QUEUE_TYPE_BYTE        = 'queue.type.byte'
+   QUEUE_TYPE_NONE              = 'queue.type.none'
+   QUEUE_TYPE_NORMAL            = 'queue.type.normal'
+   QUEUE_TYPE_BYTE              = 'queue.type.byte'
    
-   QUEUE_TYPE_SET_UNSET   = 'queue.type.set.unset'
-   QUEUE_TYPE_SET_SUCCESS = 'queue.type.set.success'
-   QUEUE_TYPE_SET_FAILURE = 'queue.type.set.failure'
+   QUEUE_TYPE_SET_UNSET         = 'queue.type.set.unset'
+   QUEUE_TYPE_SET_SUCCESS       = 'queue.type.set.success'
+   QUEUE_TYPE_SET_FAILURE       = 'queue.type.set.failure'
    
-   ERROR_CAPACITY_INVALID = 'error.capacity.invalid'
+   QUEUE_ENGINE_LINEAR          = 'queue.engine.linear'
+   QUEUE_ENGINE_RING            = 'queue.engine.ring'
+   QUEUE_ENGINE_SPSC            = 'queue.engine.spsc'
+   QUEUE_ENGINE_SHARED          = 'queue.engine.shared'
+   
+   QUEUE_ENGINE_SET_UNSET       = 'queue.engine.set.unset'
+   QUEUE_ENGINE_SET_FAILURE     = 'queue.engine.set.failure'
+   
+   QUEUE_DISCIPLINE_NONE        = 'queue.discipline.none'
+   QUEUE_DISCIPLINE_TAIL_DROP   = 'queue.discipline.tail_drop'
+   QUEUE_DISCIPLINE_HEAD_DROP   = 'queue.discipline.head_drop'
+   QUEUE_DISCIPLINE_RED         = 'queue.discipline.red'
+   
+   QUEUE_DISCIPLINE_SET_UNSET   = 'queue.discipline.set.unset'
+   QUEUE_DISCIPLINE_SET_FAILURE = 'queue.discipline.set.failure'
+   
+   QUEUE_EVENT_NONE             = 'queue.event.none'
+   QUEUE_EVENT_NON_EMPTY        = 'queue.event.non_empty'
+   QUEUE_EVENT_WRITABLE         = 'queue.event.writable'
+   QUEUE_EVENT_WATERMARK_HIGH   = 'queue.event.watermark.high'
+   QUEUE_EVENT_WATERMARK_LOW    = 'queue.event.watermark.low'
+   
+   ERROR_CAPACITY_INVALID       = 'error.capacity.invalid'
+   ERROR_CAPACITY_BYTES_INVALID = 'error.capacity.bytes.invalid'
+   ERROR_DATA_INVALID           = 'error.data.invalid'
+   ERROR_DISCIPLINE_INVALID     = 'error.discipline.invalid'
+   ERROR_WATERMARK_INVALID      = 'error.watermark.invalid'
@@ -2,6 +2,23 @@ class Flags:
    """Flags for queue buffer.
    """
    
-   QUEUE_TYPE_NONE   = 1
-   QUEUE_TYPE_NORMAL = 2
-   QUEUE_TYPE_BYTE   = 4
+   QUEUE_TYPE_NONE            =  1
+   QUEUE_TYPE_NORMAL          =  2
+   QUEUE_TYPE_BYTE            =  4
+   
+   QUEUE_ENGINE_LINEAR        =  1
+   QUEUE_ENGINE_RING          =  2
+   QUEUE_ENGINE_SPSC          =  4
+   QUEUE_ENGINE_SHARED        =  8
+   
+   QUEUE_DISCIPLINE_NONE      =  1
+   QUEUE_DISCIPLINE_TAIL_DROP =  2
+   QUEUE_DISCIPLINE_HEAD_DROP =  4
+   QUEUE_DISCIPLINE_RED       =  8
+   
+   QUEUE_EVENT_NONE           =  1
+   QUEUE_EVENT_NON_EMPTY      =  2
+   QUEUE_EVENT_WRITABLE       =  4
+   QUEUE_EVENT_WATERMARK_HIGH =  8
+   QUEUE_EVENT_WATERMARK_LOW  = 16
+   QUEUE_EVENT_ALL            = 30
@@ -1,10 +1,19 @@
 from .flags import Flags as flags
 from .descriptors import Descriptors as descriptors
+from .ringbuffer import RingBuffer
 
+import time
+import random
 from threading import (
    Lock,
    Thread,
+   Condition,
 )
+from itertools import (
+   count,
+   islice,
+)
+from collections import deque
 
 import nsim as app
 
@@ -19,35 +28,146 @@ class Queue:
    ----------
    _capacity : int
       Queue buffer capacity.
+   _capacity_bytes : int
+      Queue buffer capacity, in bytes (summed len() of queued data).
+   _capacity_bytes_wanted : int
+      Free space (in bytes) wanted by first data (item) rejected at byte
+      capacity, for next writable event, 0 if none.
    _queue_type : int
       Queue's buffer type.
+   _queue_engine : int
+      Queue's storage engine.
+   _queue_discipline : int
+      Queue's discipline, for data exceeding capacity.
+   _red_min, _red_max : int
+      RED minimum and maximum thresholds (average length).
+   _red_probability : float
+      RED maximum drop probability, at maximum threshold.
+   _red_weight : float
+      RED weight of instantaneous length in average length.
+   _red_average : float
+      RED average length (exponentially weighted).
+   _red_count : int
+      RED number of data (items) admitted since last drop.
+   _red_random : Random()
+      RED (seeded) random number generator.
    _lock_queue : Lock()
       Concurrency lock for _queue.
-   _queue : list, bytearray, NoneType
+   _condition_flow_in : Condition()
+      Concurrency condition (on _lock_queue) for space freed in _queue.
+   _condition_flow_out : Condition()
+      Concurrency condition (on _lock_queue) for data available in _queue.
+   _waiting_flow_in : int
+      Number of blocked flow_in waiting on _condition_flow_in.
+   _waiting_flow_out : int
+      Number of blocked flow_out waiting on _condition_flow_out.
+   _count_flow_in : int
+      Number of data (items) ever pushed, owned by producer (spsc engine).
+   _count_flow_out : int
+      Number of data (items) ever retrieved, owned by consumer (spsc engine).
+   _spsc_chunk : bytes, NoneType
+      Partially retrieved chunk, owned by consumer (spsc engine, byte type).
+   _spsc_offset : int
+      Retrieved length of _spsc_chunk (spsc engine, byte type).
+   _lock_consumer : Lock()
+      Concurrency lock serializing consumer side with clear() and contents(),
+      uncontended for a single consumer (spsc engine).
+   _stats_time_start : float
+      Monotonic time of queue buffer creation, for telemetry.
+   _stats_items_in, _stats_items_out : int
+      Number of data (items) enqueued and dequeued, for telemetry.
+   _stats_items_rejected, _stats_items_cleared : int
+      Number of data (items) rejected at capacity and cleared, for telemetry.
+   _stats_bytes_in, _stats_bytes_out, _stats_bytes_rejected : int
+      Size (in bytes) of data enqueued, dequeued and rejected, for telemetry.
+   _stats_bytes_cleared : int
+      Size (in bytes) of data cleared, for telemetry.
+   _stats_items_dropped, _stats_bytes_dropped : int
+      Number and size (in bytes) of data dropped by queue discipline, before
+      being enqueued (tail-drop, RED), for telemetry.
+   _stats_items_evicted, _stats_bytes_evicted : int
+      Number and size (in bytes) of enqueued data dropped by queue
+      discipline (head-drop), for telemetry.
+   _stats_high_watermark : int
+      Maximum length of queue buffer ever reached, for telemetry.
+   _stats_time_sojourn : float
+      Total time spent in queue buffer by dequeued data, for telemetry.
+   _stats_time_departed : float
+      Total time spent in queue buffer by dequeued and cleared data.
+   _stats_timestamps : deque
+      Enqueue timestamps of queued data, as (time, items) per push, appended
+      by producer before data is published.
+   _stats_timestamps_offset : int
+      Items of oldest enqueue timestamp already departed, owned by consumer.
+   _watermark_high : int
+      High watermark (length), -1 if disabled.
+   _watermark_low : int
+      Low watermark (length).
+   _watermark_above : bool
+      Has length risen to high watermark, and not yet fallen to low ?
+   _list_notification : dict
+      List of registered notification alerts, as identifier -> details.
+   _notification_sequence : count
+      Sequence of identifiers for anonymous notification alerts.
+   _lock_list_notification : Lock()
+      Concurrency lock for _list_notification and watermark state.
+   _events_pending : int
+      Events detected but not yet sent as notification alerts.
+   _queue : list, bytearray, deque, RingBuffer, NoneType
       Queue buffer store.
    
    Methods
    -------
-   __init__ (queue_type, capacity)
+   __init__ (queue_type, capacity, queue_engine, **watermarks, capacity_bytes,
+      queue_discipline, **red)
       Init queue buffer with specified configuration.
    queue_type ()
       Interact with queue's buffer type.
+   queue_engine ()
+      Query queue's storage engine.
+   queue_discipline ()
+      Interact with queue's discipline.
    state ()
       Query queue buffer's state.
    clear ()
       Clear or empty queue buffer.
+   watermark ()
+      Interact with queue buffer's high and low watermarks.
+   notification_alert ()
+      Handles registration for event based notifications.
+   stats ()
+      Query queue buffer's telemetry, as a single snapshot.
+   version ()
+      Query queue buffer's contents version.
    contents ()
       Retrieve contents of queue buffer without deleting them.
    flow_in ()
       Push data into queue buffer.
    flow_out ()
       Retrieve data from queue buffer.
+   flow_in_bytes ()
+      Push bytes into byte queue buffer, in bulk.
+   flow_out_bytes ()
+      Retrieve bytes from byte queue buffer, in bulk.
+   flow_out_into ()
+      Retrieve bytes from byte queue buffer into supplied buffer, in bulk.
    """
    
    def __init__ (
       self,
-      queue_type = flags.QUEUE_TYPE_NORMAL,
-      capacity   = -1, # un-limited
+      queue_type     = flags.QUEUE_TYPE_NORMAL,
+      capacity       = -1, # un-limited
+      queue_engine   = flags.QUEUE_ENGINE_LINEAR,
+      watermark_high = -1, # disabled
+      watermark_low  = -1,
+      capacity_bytes = -1, # un-limited
+      
+      queue_discipline = flags.QUEUE_DISCIPLINE_NONE,
+      red_min          = -1, # capacity / 4
+      red_max          = -1, # capacity * 3 / 4
+      red_probability  = 0.1,
+      red_weight       = 0.002,
+      seed             = None,
    ):
       """Init queue buffer with specified configuration.
       
@@ -57,21 +177,102 @@ class Queue:
          Queue's buffer type.
       capacity : int, default=-1
          Queue buffer capacity.
+      queue_engine : int, default=flags.QUEUE_ENGINE_LINEAR
+         Queue's storage engine, linear (list, bytearray), ring (deque,
+         circular bytearray preallocated to capacity) or spsc (lock-free
+         deque, for exactly one producer and one consumer thread at a time,
+         clear() and contents() being safe from any thread).
+      watermark_high : int, default=-1
+         High watermark (length) for notification alerts, -1 to disable.
+      watermark_low : int, default=-1
+         Low watermark (length) for notification alerts.
+      capacity_bytes : int, default=-1
+         Queue buffer capacity in bytes, as summed len() of queued data
+         (items), enforced alongside capacity. Negative for un-limited.
+      queue_discipline : int, default=flags.QUEUE_DISCIPLINE_NONE
+         Queue's discipline, for data exceeding capacity. See
+         queue_discipline().
+      red_min : int, default=-1
+         RED minimum threshold (average length), -1 for capacity / 4.
+      red_max : int, default=-1
+         RED maximum threshold (average length), -1 for capacity * 3 / 4.
+      red_probability : float, default=0.1
+         RED maximum drop probability, at maximum threshold.
+      red_weight : float, default=0.002
+         RED weight of instantaneous length in average length.
+      seed : int, NoneType, default=None
+         Seed for RED random number generator, None for un-seeded.
       
       Raises
       ------
       Exception
          *  Invalid capacity.
+         *  Invalid capacity_bytes.
+         *  Invalid queue_engine.
          *  Invalid queue_type.
+         *  Invalid watermarks.
+         *  Invalid queue_discipline or its configuration.
       """
       
-      self._capacity   = int(capacity)
+      self._capacity     = int(capacity)
+      
+      self._capacity_bytes          = int(capacity_bytes)
+      self._capacity_bytes_wanted   = 0
+      
+      self._queue_type   = flags.QUEUE_TYPE_NONE
+      self._queue_engine = queue_engine
+      
+      self._queue_discipline = flags.QUEUE_DISCIPLINE_NONE
+      self._red_min          = -1
+      self._red_max          = -1
+      self._red_probability  = 0.0
+      self._red_weight       = 0.0
+      self._red_average      = 0.0
+      self._red_count        = -1
+      self._red_random       = random.Random()
+      
+      self._lock_queue         = Lock()
+      self._condition_flow_in  = Condition(self._lock_queue)
+      self._condition_flow_out = Condition(self._lock_queue)
+      
+      self._waiting_flow_in    = 0
+      self._waiting_flow_out   = 0
+      
+      self._count_flow_in      = 0
+      self._count_flow_out     = 0
+      self._spsc_chunk         = None
+      self._spsc_offset        = 0
+      self._lock_consumer      = Lock()
       
-      self._queue_type = flags.QUEUE_TYPE_NONE
+      self._stats_time_start     = time.monotonic()
+      self._stats_items_in       = 0
+      self._stats_items_out      = 0
+      self._stats_items_rejected = 0
+      self._stats_items_cleared  = 0
+      self._stats_bytes_in       = 0
+      self._stats_bytes_out      = 0
+      self._stats_bytes_rejected = 0
+      self._stats_bytes_cleared  = 0
+      self._stats_items_dropped  = 0
+      self._stats_bytes_dropped  = 0
+      self._stats_items_evicted  = 0
+      self._stats_bytes_evicted  = 0
+      self._stats_high_watermark = 0
+      self._stats_time_sojourn   = 0.0
+      self._stats_time_departed  = 0.0
+      self._stats_timestamps     = deque()
       
-      self._lock_queue = Lock()
+      self._stats_timestamps_offset = 0
       
-      self._queue      = None
+      self._watermark_high         = -1
+      self._watermark_low          = -1
+      self._watermark_above        = False
+      self._list_notification      = dict()
+      self._notification_sequence  = count(1)
+      self._lock_list_notification = Lock()
+      self._events_pending         = 0
+      
+      self._queue        = None
       
       if (not self._capacity):
          raise Exception((
@@ -82,6 +283,28 @@ class Queue:
                self._capacity,
             )
          )
+      elif (not self._capacity_bytes):
+         raise Exception((
+                 '{0}:\n'
+               + 'capacity_bytes: {1}\n'
+            ).format(
+               descriptors.ERROR_CAPACITY_BYTES_INVALID,
+               self._capacity_bytes,
+            )
+         )
+      elif (self._queue_engine not in (
+         flags.QUEUE_ENGINE_LINEAR,
+         flags.QUEUE_ENGINE_RING,
+         flags.QUEUE_ENGINE_SPSC,
+      )):
+         raise Exception((
+                 '{0}:\n'
+               + 'queue_engine: {1}\n'
+            ).format(
+               descriptors.QUEUE_ENGINE_SET_FAILURE,
+               self._queue_engine,
+            )
+         )
       elif (not self._queue_types(
          queue_type=queue_type,
       )):
@@ -93,6 +316,20 @@ class Queue:
                queue_type,
             )
          )
+      
+      self.watermark(
+         high = watermark_high,
+         low  = watermark_low,
+      )
+      
+      self.queue_discipline(
+         queue_discipline = queue_discipline,
+         red_min          = red_min,
+         red_max          = red_max,
+         red_probability  = red_probability,
+         red_weight       = red_weight,
+         seed             = seed,
+      )
    
    def queue_type (
       self,
@@ -178,6 +415,209 @@ class Queue:
       
       return True
       
+   def queue_engine (
+      self,
+      describe = True,
+   ):
+      """Query queue's storage engine.
+      
+      Parameters
+      ----------
+      describe : bool, default=True
+         Describe queue's storage engine using descriptors ?
+      
+      Returns
+      -------
+      int
+         Returns queue's storage engine.
+      str
+         Returns description of queue's storage engine.
+      """
+      
+      queue_engine = self._queue_engine
+      
+      if (describe):
+         if (queue_engine   & flags.QUEUE_ENGINE_LINEAR):
+            queue_engine = descriptors.QUEUE_ENGINE_LINEAR
+         elif (queue_engine & flags.QUEUE_ENGINE_RING):
+            queue_engine = descriptors.QUEUE_ENGINE_RING
+         elif (queue_engine & flags.QUEUE_ENGINE_SPSC):
+            queue_engine = descriptors.QUEUE_ENGINE_SPSC
+         else:
+            queue_engine = descriptors.QUEUE_ENGINE_SET_UNSET
+      
+      return queue_engine
+   
+   def queue_discipline (
+      self,
+      queue_discipline = None,
+      red_min          = -1,
+      red_max          = -1,
+      red_probability  = 0.1,
+      red_weight       = 0.002,
+      seed             = None,
+      describe         = True,
+   ):
+      """Interact with queue's discipline.
+      
+      Queue's discipline decides the fate of data exceeding capacity (item
+      or byte capacity):
+      
+      *  none : data is rejected, flow_in reports a short length (and may
+         block, waiting for space).
+      *  tail-drop : excess (newest) data is dropped.
+      *  head-drop : oldest queued data is evicted to make room for newest,
+         not for spsc engine (as producer can not dequeue).
+      *  RED (Random Early Detection) : data is dropped early, with a
+         probability rising linearly from 0 at red_min to red_probability at
+         red_max (of exponentially weighted average length), and always
+         beyond red_max. Excess data is then tail-dropped. Decisions are per
+         item.
+      
+      Drop disciplines drop whole items (frames), hence are not for byte
+      queue buffers, whose bytes carry no frame boundaries.
+      flow_in always reports length of data pushed. With drop disciplines,
+      data not pushed was dropped, hence is not to be retried by producers.
+      Drops are counted, see state() and stats().
+      
+      Parameters
+      ----------
+      queue_discipline : int, NoneType, default=None
+         Set queue's discipline.
+      red_min : int, default=-1
+         RED minimum threshold (average length), -1 for capacity / 4.
+      red_max : int, default=-1
+         RED maximum threshold (average length), -1 for capacity * 3 / 4.
+      red_probability : float, default=0.1
+         RED maximum drop probability, at maximum threshold.
+      red_weight : float, default=0.002
+         RED weight of instantaneous length in average length.
+      seed : int, NoneType, default=None
+         Seed for RED random number generator, None for un-seeded.
+      describe : bool, default=True
+         Describe queue's discipline using descriptors ?
+      
+      Returns
+      -------
+      int
+         Returns queue's discipline.
+      str
+         Returns description of queue's discipline.
+      bool
+         Returns True on setting queue's discipline.
+      
+      Raises
+      ------
+      Exception
+         *  Invalid queue_discipline (or drop discipline for byte type).
+         *  Invalid RED configuration.
+      """
+      
+      if (queue_discipline is None):
+         queue_discipline = self._queue_discipline
+         
+         if (describe):
+            if (queue_discipline   & flags.QUEUE_DISCIPLINE_NONE):
+               queue_discipline = descriptors.QUEUE_DISCIPLINE_NONE
+            elif (queue_discipline & flags.QUEUE_DISCIPLINE_TAIL_DROP):
+               queue_discipline = descriptors.QUEUE_DISCIPLINE_TAIL_DROP
+            elif (queue_discipline & flags.QUEUE_DISCIPLINE_HEAD_DROP):
+               queue_discipline = descriptors.QUEUE_DISCIPLINE_HEAD_DROP
+            elif (queue_discipline & flags.QUEUE_DISCIPLINE_RED):
+               queue_discipline = descriptors.QUEUE_DISCIPLINE_RED
+            else:
+               queue_discipline = descriptors.QUEUE_DISCIPLINE_SET_UNSET
+         
+         return queue_discipline
+      
+      if (
+            (queue_discipline not in (
+               flags.QUEUE_DISCIPLINE_NONE,
+               flags.QUEUE_DISCIPLINE_TAIL_DROP,
+               flags.QUEUE_DISCIPLINE_HEAD_DROP,
+               flags.QUEUE_DISCIPLINE_RED,
+            ))
+         or (
+                (queue_discipline   & flags.QUEUE_DISCIPLINE_HEAD_DROP)
+            and (self._queue_engine & flags.QUEUE_ENGINE_SPSC)
+         )
+         or (
+                (not (queue_discipline & flags.QUEUE_DISCIPLINE_NONE))
+            and (self._queue_type      & flags.QUEUE_TYPE_BYTE)
+         )
+      ):
+         raise Exception((
+                 '{0}:\n'
+               + 'queue_discipline: {1}\n'
+               + 'queue_engine: {2}\n'
+               + 'queue_type: {3}\n'
+            ).format(
+               descriptors.QUEUE_DISCIPLINE_SET_FAILURE,
+               queue_discipline,
+               self._queue_engine,
+               self._queue_type,
+            )
+         )
+      
+      red_min = (
+         (self._capacity // 4)
+         if (
+                (int(red_min) < 0)
+            and (self._capacity > 0)
+         )
+         else
+         int(red_min)
+      )
+      red_max = (
+         ((self._capacity * 3) // 4)
+         if (
+                (int(red_max) < 0)
+            and (self._capacity > 0)
+         )
+         else
+         int(red_max)
+      )
+      
+      if (
+             (queue_discipline & flags.QUEUE_DISCIPLINE_RED)
+         and (
+               (red_min < 0)
+            or (red_max <= red_min)
+            or (not (0.0 <  float(red_probability) <= 1.0))
+            or (not (0.0 <  float(red_weight)      <= 1.0))
+         )
+      ):
+         raise Exception((
+                 '{0}:\n'
+               + 'red_min: {1}\n'
+               + 'red_max: {2}\n'
+               + 'red_probability: {3}\n'
+               + 'red_weight: {4}\n'
+            ).format(
+               descriptors.ERROR_DISCIPLINE_INVALID,
+               red_min,
+               red_max,
+               red_probability,
+               red_weight,
+            )
+         )
+      
+      self._lock_queue.acquire()
+      
+      try:
+         self._queue_discipline = queue_discipline
+         self._red_min          = red_min
+         self._red_max          = red_max
+         self._red_probability  = float(red_probability)
+         self._red_weight       = float(red_weight)
+         self._red_average      = 0.0
+         self._red_count        = -1
+         self._red_random       = random.Random(seed)
+      finally:
+         self._lock_queue.release()
+      
+      return True
+   
    def _queue_types (
       self,
       queue_type=flags.QUEUE_TYPE_NONE,
@@ -186,6 +626,7 @@ class Queue:
       
       Performs switch operation only if the target buffer type is not same as
       current. Can only switch to/from QUEUE_TYPE_NONE to any other type.
+      Can not switch to byte type under a drop discipline.
       
       Parameters
       ----------
@@ -207,6 +648,11 @@ class Queue:
             flags.QUEUE_TYPE_BYTE,
          )):
             return False
+         elif (
+                (queue_type & flags.QUEUE_TYPE_BYTE)
+            and (not (self._queue_discipline & flags.QUEUE_DISCIPLINE_NONE))
+         ):
+            return False
          elif (queue_type          != self._queue_type):
             if (queue_type         == flags.QUEUE_TYPE_NONE):
                try:
@@ -214,15 +660,28 @@ class Queue:
                except:
                   pass
                
-               self._queue    = None
+               self._queue          = None
+               self._count_flow_in  = 0
+               self._count_flow_out = 0
+               self._spsc_chunk     = None
+               self._spsc_offset    = 0
             elif (self._queue_type != flags.QUEUE_TYPE_NONE):
                return False
             elif (self._queue_type == flags.QUEUE_TYPE_NONE):
-               if (queue_type & flags.QUEUE_TYPE_NORMAL):
-                  self._queue = list()
-               
-               if (queue_type & flags.QUEUE_TYPE_BYTE):
-                  self._queue = bytearray()
+               if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+                  self._queue = deque()
+               elif (self._queue_engine & flags.QUEUE_ENGINE_RING):
+                  if (queue_type & flags.QUEUE_TYPE_NORMAL):
+                     self._queue = deque()
+                  
+                  if (queue_type & flags.QUEUE_TYPE_BYTE):
+                     self._queue = RingBuffer(capacity=self._capacity)
+               else:
+                  if (queue_type & flags.QUEUE_TYPE_NORMAL):
+                     self._queue = list()
+                  
+                  if (queue_type & flags.QUEUE_TYPE_BYTE):
+                     self._queue = bytearray()
             
             self._queue_type = queue_type
       finally:
@@ -237,11 +696,14 @@ class Queue:
       full     = False,
       relative = False,
       value    = False,
+      size     = False,
+      dropped  = False,
    ):
       """Query queue buffer's state.
       
       Query queue buffer's current state such as capacity, empty or full.
       Reports answers to queries only for set parameters.
+      Lock-free for spsc engine.
       
       Parameters
       ----------
@@ -255,6 +717,11 @@ class Queue:
          Report respective queries with respect to their alternative extremes.
       value : bool, default=False
          Report respective queries with exact value.
+      size : bool, default=False
+         Report respective queries in bytes, against byte capacity ?
+      dropped : bool, default=False
+         Report number of data (items) dropped (or evicted) by queue
+         discipline ? In bytes, if size.
       
       Returns
       -------
@@ -267,19 +734,36 @@ class Queue:
       """
       
       result = None
+      spsc   = bool(self._queue_engine & flags.QUEUE_ENGINE_SPSC)
       
-      self._lock_queue.acquire()
+      if (not spsc):
+         self._lock_queue.acquire()
       
       try:
-         len_queue          = len(self._queue)
-         remaining_capacity = self._capacity - len_queue
+         len_queue          = (
+            self._length_bytes()
+            if (size)
+            else (
+               self._spsc_length()
+               if (spsc)
+               else
+               len(self._queue)
+            )
+         )
+         capacity_queue     = (
+            self._capacity_bytes
+            if (size)
+            else
+            self._capacity
+         )
+         remaining_capacity = capacity_queue - len_queue
          
          if (capacity):
             result = (
                -1
-               if (self._capacity < 0)
+               if (capacity_queue < 0)
                else
-               int(self._capacity)
+               int(capacity_queue)
             )
          elif (empty):
             if (value):
@@ -311,16 +795,30 @@ class Queue:
             else:
                result = (
                   True
-                  if (not remaining_capacity)
+                  if (
+                        (not remaining_capacity)
+                     or (
+                            (self._capacity_bytes >= 0)
+                        and (self._length_bytes() >= self._capacity_bytes)
+                     )
+                  )
                   else
                   False
                )
+         elif (dropped):
+            result = (
+               (self._stats_bytes_dropped + self._stats_bytes_evicted)
+               if (size)
+               else
+               (self._stats_items_dropped + self._stats_items_evicted)
+            )
          elif (value):
             result = 0
          else:
             result = None
       finally:
-         self._lock_queue.release()
+         if (not spsc):
+            self._lock_queue.release()
       
       return result
    
@@ -338,24 +836,404 @@ class Queue:
       try:
          if (self._queue_type == flags.QUEUE_TYPE_NONE):
             return True
+         elif (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+            data = self._spsc_pull(
+               data_length = -1,
+               account     = False,
+            )
+            
+            self._stats_flow_out(
+               data_length = len(data),
+               data_bytes  = self._stats_bytes(data),
+               cleared     = True,
+            )
+            
+            if (self._waiting_flow_in):
+               self._condition_flow_in.notify_all()
          else:
-            self._queue_type.clear()
+            data_length = len(self._queue)
+            data_bytes  = self._stats_bytes(self._queue)
+            
+            self._queue.clear()
+            
+            self._stats_flow_out(
+               data_length = data_length,
+               data_bytes  = data_bytes,
+               cleared     = True,
+            )
+            
+            if (self._waiting_flow_in):
+               self._condition_flow_in.notify_all()
       finally:
          self._lock_queue.release()
       
+      if (self._events_pending):
+         self._notify()
+      
       return True
    
-   def contents (self):
+   def watermark (
+      self,
+      high = None,
+      low  = None,
+   ):
+      """Interact with queue buffer's high and low watermarks.
+      
+      Watermark events are raised with hysteresis, high upon length rising
+      to high watermark, then low upon length falling back to low watermark.
+      
+      Parameters
+      ----------
+      high : int, NoneType, default=None
+         Set high watermark (length), -1 to disable.
+      low : int, NoneType, default=None
+         Set low watermark (length), must be lower than high watermark.
+      
+      Returns
+      -------
+      list
+         Returns watermarks as [high, low].
+      
+      Raises
+      ------
+      Exception
+         Invalid watermarks.
+      """
+      
+      if (
+            (high is not None)
+         or (low  is not None)
+      ):
+         high = (
+            self._watermark_high
+            if (high is None)
+            else
+            int(high)
+         )
+         low  = (
+            self._watermark_low
+            if (low is None)
+            else
+            int(low)
+         )
+         
+         if (
+                (high >= 0)
+            and (
+                  (low  <  0)
+               or (low  >= high)
+            )
+         ):
+            raise Exception((
+                    '{0}:\n'
+                  + 'high: {1}\n'
+                  + 'low: {2}\n'
+               ).format(
+                  descriptors.ERROR_WATERMARK_INVALID,
+                  high,
+                  low,
+               )
+            )
+         
+         self._lock_list_notification.acquire()
+         
+         try:
+            self._watermark_high  = high
+            self._watermark_low   = low
+            self._watermark_above = False
+         finally:
+            self._lock_list_notification.release()
+      
+      return [self._watermark_high, self._watermark_low]
+   
+   def notification_alert (
+      self,
+      identifier   = None,
+      callback     = None,
+      unregister   = False,
+      events       = flags.QUEUE_EVENT_ALL,
+      times        = -1, # unlimited
+      immediate    = False,
+      non_blocking = False,
+   ):
+      """Handles registration for event based notifications.
+      
+      Registers or un-registers for notification alert, raised upon queue
+      buffer becoming non-empty, becoming writable (no longer at capacity,
+      with room for data last rejected at byte capacity) or crossing
+      watermarks. Callbacks are called with queue and event kwargs,
+      outside of queue's lock, by thread which caused the event.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to register callback with, else auto-generate
+         (unique within queue, never registered globally).
+      callback : callable, NoneType, default=None
+         Callback, used upon alert generation.
+      unregister : bool, default=False
+         Unregister alert bound to callback with specified identifier.
+      events : int, default=flags.QUEUE_EVENT_ALL
+         Events upon which notification alert is to be sent.
+      times : int, default=-1
+         Number of times to service alerts, upon expiry auto-unregister.
+      immediate : bool, default=False
+         Alert right away if queue buffer already is non-empty or writable,
+         as registered, instead of waiting for next transition.
+      non_blocking : bool, default=False
+         Run callback in a separate (daemon) thread ?
+      
+      Returns
+      -------
+      str
+         Returns identifier used upon successful registration.
+      bool
+         Returns success as bool on unregistration or registration, if failed.
+      """
+      
+      if (unregister):
+         if (not identifier):
+            return False
+         
+         self._lock_list_notification.acquire()
+         
+         try:
+            self._list_notification.pop(identifier, None)
+         finally:
+            self._lock_list_notification.release()
+         
+         return True
+      elif (
+            (not callback)
+         or (not callable(callback))
+      ):
+         return False
+      elif (not times):
+         return False
+      
+      # Queue-local, as registrations are frequent and short-lived (e.g.
+      # one-shot alerts upon every parked transfer).
+      identifier = (
+         identifier
+         or 'notification_alert.anonymous.{0}'.format(
+            next(self._notification_sequence),
+         )
+      )
+      
+      self._lock_list_notification.acquire()
+      
+      try:
+         if (identifier in self._list_notification):
+            return False
+         
+         self._list_notification[identifier] = [
+            int(events),
+            int(times),
+            callback,
+            bool(non_blocking),
+         ]
+         
+         if (self._watermark_high >= 0):
+            self._watermark_above = (self._length() >= self._watermark_high)
+      finally:
+         self._lock_list_notification.release()
+      
+      if (immediate):
+         length = self._length()
+         events = int(events) & (
+              (
+                 flags.QUEUE_EVENT_NON_EMPTY
+                 if (length)
+                 else
+                 0
+              )
+            | (
+                 flags.QUEUE_EVENT_WRITABLE
+                 if (
+                        (
+                              (self._capacity < 0)
+                           or (length < self._capacity)
+                        )
+                    and (
+                              (self._capacity_bytes < 0)
+                           or (
+                                 (self._capacity_bytes - self._length_bytes())
+                              >= max(1, self._capacity_bytes_wanted)
+                           )
+                        )
+                 )
+                 else
+                 0
+              )
+         )
+         
+         if (events):
+            self._notify(
+               events     = events,
+               identifier = identifier,
+            )
+      
+      return identifier
+   
+   def stats (self):
+      """Query queue buffer's telemetry, as a single snapshot.
+      
+      Reports running counters, kept cheaply on every push and retrieval,
+      without copying queue buffer's contents. Snapshot is atomic for locked
+      engines, and consistent per side (producer, consumer) for spsc engine.
+      Mean occupancy is time-weighted over queue buffer's lifetime, derived
+      from per-item sojourn times (occupancy integral equals total sojourn).
+      
+      Returns
+      -------
+      dict
+         Returns telemetry as:
+         
+         *  length : current length (items, bytes for byte type).
+         *  capacity : capacity, -1 for un-limited.
+         *  capacity_bytes, length_bytes : respective sizes in bytes.
+         *  items_in, items_out : items enqueued and dequeued.
+         *  items_rejected : items rejected at capacity.
+         *  items_cleared : items discarded by clear().
+         *  items_dropped : items dropped by queue discipline, before being
+            enqueued (tail-drop, RED).
+         *  items_evicted : enqueued items dropped by queue discipline
+            (head-drop).
+         *  bytes_in, bytes_out, bytes_rejected, bytes_cleared,
+            bytes_dropped, bytes_evicted : respective sizes in bytes.
+         *  high_watermark : maximum length ever reached.
+         *  occupancy_mean : time-weighted mean length.
+         *  sojourn_mean : mean time (s) spent by dequeued items in queue.
+         *  duration : time (s) since queue buffer creation.
+      """
+      
+      spsc = bool(self._queue_engine & flags.QUEUE_ENGINE_SPSC)
+      
+      if (not spsc):
+         self._lock_queue.acquire()
+      
+      try:
+         time_now     = time.monotonic()
+         timestamps   = self._stats_timestamps.copy()
+         
+         length       = self._length()
+         
+         time_present = sum(
+            ((time_now - timestamp) * items)
+            for timestamp, items in timestamps
+         )
+         
+         if (timestamps):
+            time_present = max(0.0, (
+                 time_present
+               - ((time_now - timestamps[0][0]) * self._stats_timestamps_offset)
+            ))
+         duration     = (time_now - self._stats_time_start)
+         
+         stats        = {
+            'length'         : length,
+            'capacity'       : self._capacity,
+            'capacity_bytes' : self._capacity_bytes,
+            'length_bytes'   : self._length_bytes(),
+            'items_in'       : self._stats_items_in,
+            'items_out'      : self._stats_items_out,
+            'items_rejected' : self._stats_items_rejected,
+            'items_cleared'  : self._stats_items_cleared,
+            'items_dropped'  : self._stats_items_dropped,
+            'items_evicted'  : self._stats_items_evicted,
+            'bytes_in'       : self._stats_bytes_in,
+            'bytes_out'      : self._stats_bytes_out,
+            'bytes_rejected' : self._stats_bytes_rejected,
+            'bytes_cleared'  : self._stats_bytes_cleared,
+            'bytes_dropped'  : self._stats_bytes_dropped,
+            'bytes_evicted'  : self._stats_bytes_evicted,
+            'high_watermark' : self._stats_high_watermark,
+            'occupancy_mean' : (
+               ((self._stats_time_departed + time_present) / duration)
+               if (duration > 0)
+               else
+               0.0
+            ),
+            'sojourn_mean'   : (
+               (self._stats_time_sojourn / self._stats_items_out)
+               if (self._stats_items_out)
+               else
+               0.0
+            ),
+            'duration'       : duration,
+         }
+      finally:
+         if (not spsc):
+            self._lock_queue.release()
+      
+      return stats
+   
+   def version (self):
+      """Query queue buffer's contents version.
+      
+      Monotonically increasing counter, advanced by every push, retrieval,
+      clear and eviction (derived from telemetry counters), so that unchanged
+      contents can be detected without copying them. Lock-free.
+      
+      Returns
+      -------
+      int
+         Returns contents version.
+      """
+      
+      return (
+           self._stats_items_in
+         + self._stats_items_out
+         + self._stats_items_cleared
+         + self._stats_items_evicted
+      )
+   
+   def contents (
+      self,
+      offset        =  0,
+      limit         = -1,
+      since_version = None,
+   ):
       """Retrieve contents of queue buffer without deleting them.
       
-      Clones queue buffer's contents and returns them without deleting.
+      Clones a window of queue buffer's contents and returns it without
+      deleting. Cost of the copy (and of holding the lock) is bounded by the
+      window, not by the backlog (offset + limit for deque based stores).
+      
+      Parameters
+      ----------
+      offset : int, default=0
+         Number of data (items, bytes for byte type) to skip from first.
+      limit : int, default=-1
+         Maximum number of data (items, bytes for byte type) to clone,
+         negative for all.
+      since_version : int, NoneType, default=None
+         Version (see version()) of caller's previous snapshot, to skip the
+         copy if contents are unchanged since. None to always copy.
       
       Returns
       -------
       object
-         Returns cloned contents of queue buffer.
+         Returns cloned window of contents of queue buffer.
+      NoneType
+         Returns None if contents are unchanged since since_version.
       """
       
+      if (
+             (since_version is not None)
+         and (since_version == self.version())
+      ):
+         return None
+      
+      offset   = max(0, int(offset))
+      limit    = int(limit)
+      stop     = (
+         None
+         if (limit < 0)
+         else
+         (offset + limit)
+      )
+      
       self._lock_queue.acquire()
       
       contents = []
@@ -363,8 +1241,21 @@ class Queue:
       try:
          if (self._queue_type == flags.QUEUE_TYPE_NONE):
             contents = []
+         elif (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+            contents = self._spsc_contents(
+               offset = offset,
+               stop   = stop,
+            )
+         elif (self._queue_engine & flags.QUEUE_ENGINE_RING):
+            if (self._queue_type & flags.QUEUE_TYPE_NORMAL):
+               contents = list(islice(self._queue, offset, stop))
+            else:
+               contents = self._queue.peek(
+                  length = limit,
+                  offset = offset,
+               )
          else:
-            contents = self._queue.copy()
+            contents = self._queue[offset:stop]
       except:
          contents = []
       finally:
@@ -375,16 +1266,25 @@ class Queue:
    def flow_in (
       self,
       data,
+      block   = False,
+      timeout = None,
    ):
       """Push data into queue buffer.
       
       Enqueues data, in order, into queue buffer until capacity is not
       exhausted.
+      In blocking mode, waits for space to be freed while at capacity, until
+      entire data is pushed or timeout.
       
       Parameters
       ----------
       data : tuple, list, bytearray, object
-         Data (list-like) to be pushed into queue buffer.
+         Data (list-like) to be pushed into queue buffer. Iterables without
+         length (e.g. generators) are consumed into a list upfront.
+      block : bool, default=False
+         Wait for space while queue buffer is at capacity ?
+      timeout : int, float, NoneType, default=None
+         Maximum duration to wait for, in blocking mode. None to wait forever.
       
       Returns
       -------
@@ -394,42 +1294,177 @@ class Queue:
          Returns None if no data supplied.
       """
       
+      # One-pass iterables are listed once, as pushes slice and measure data.
+      if (not hasattr(data, '__len__')):
+         data = list(data)
+      
       if (not data):
          return None
       
+      time_end        = (
+         None
+         if ((not block) or (timeout is None))
+         else
+         (time.monotonic() + max(0.0, float(timeout)))
+      )
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+         data_admit   = self._discipline_admit(data)
+         data_length  = self._spsc_push(data_admit)
+         
+         while (
+                block
+            and (self._queue_discipline & flags.QUEUE_DISCIPLINE_NONE)
+            and (data_length < len(data))
+         ):
+            timeout   = (
+               None
+               if (time_end is None)
+               else
+               (time_end - time.monotonic())
+            )
+            
+            if (
+                   (timeout is not None)
+               and (timeout <= 0)
+            ):
+               break
+            
+            self._spsc_wait(flow_in=True, timeout=timeout)
+            
+            data_length += self._spsc_push(data[data_length:])
+         
+         data_length  = self._discipline_excess(
+            data_admit  = data_admit,
+            data_length = data_length,
+         )
+         
+         if (
+                data_length
+            and self._waiting_flow_out
+         ):
+            self._spsc_notify(self._condition_flow_out)
+         
+         if (self._events_pending):
+            self._notify()
+         
+         return data_length
+      
       self._lock_queue.acquire()
       
       try:
-         data_length = 0
+         data_admit   = self._discipline_admit(data)
+         data_length  = self._flow_in(data_admit)
          
-         for idata in data:
+         while (
+                block
+            and (self._queue_discipline & flags.QUEUE_DISCIPLINE_NONE)
+            and (data_length < len(data))
+         ):
+            timeout   = (
+               None
+               if (time_end is None)
+               else
+               (time_end - time.monotonic())
+            )
+            
             if (
-                  (self._capacity   == -1)
-               or (len(self._queue) <  self._capacity)
+                   (timeout is not None)
+               and (timeout <= 0)
             ):
-               self._queue.append(idata)
-               
-               data_length += 1
-            else:
                break
+            
+            self._waiting_flow_in += 1
+            
+            try:
+               self._condition_flow_in.wait(timeout=timeout)
+            finally:
+               self._waiting_flow_in -= 1
+            
+            data_length += self._flow_in(data[data_length:])
+         
+         data_length  = self._discipline_excess(
+            data_admit  = data_admit,
+            data_length = data_length,
+         )
+         
+         if (
+                data_length
+            and self._waiting_flow_out
+         ):
+            self._condition_flow_out.notify_all()
       finally:
          self._lock_queue.release()
       
+      if (self._events_pending):
+         self._notify()
+      
+      return data_length
+   
+   def _flow_in (
+      self,
+      data,
+   ):
+      """Push data into queue buffer until capacity is not exhausted.
+      
+      Expects _lock_queue to be held.
+      
+      Parameters
+      ----------
+      data : tuple, list, bytearray, object
+         Data (list-like) to be pushed into queue buffer.
+      
+      Returns
+      -------
+      int
+         Returns length of data pushed.
+      """
+      
+      data_length = self._capacity_bytes_fit(
+         data        = data,
+         data_length = (
+            len(data)
+            if (self._capacity == -1)
+            else
+            max(0, min(len(data), (self._capacity - len(self._queue))))
+         ),
+      )
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_RING):
+         self._queue.extend(data[:data_length])
+      else:
+         for idata in data[:data_length]:
+            self._queue.append(idata)
+      
+      if (data_length):
+         self._stats_flow_in(
+            data_length = data_length,
+            data_bytes  = self._stats_bytes(data[:data_length]),
+         )
+      
       return data_length
    
    def flow_out (
       self,
-      data_length=1,
+      data_length = 1,
+      block       = False,
+      timeout     = None,
    ):
       """Retrieve data from queue buffer.
       
       Dequeues data, in order, from queue buffer until specified data length
       or till last item in queue.
+      In blocking mode, waits for data to arrive while queue buffer is empty,
+      until data or timeout.
       
       Parameters
       ----------
-      data_length : int
+      data_length : int, default=1
          Length (or number) of data (items) to be retrieved from queue buffer.
+      block : bool, default=False
+         Wait for data while queue buffer is empty ?
+      timeout : int, float, NoneType, default=None
+         Maximum duration to wait for, in blocking mode. None to wait forever.
       
       Returns
       -------
@@ -445,24 +1480,1347 @@ class Queue:
       if (not data_length):
          return None
       
+      if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+         if (
+                block
+            and (not self._spsc_length())
+         ):
+            self._spsc_wait(flow_in=False, timeout=timeout)
+         
+         data = self._spsc_pull(data_length=data_length)
+         
+         if (
+                data
+            and self._waiting_flow_in
+         ):
+            self._spsc_notify(self._condition_flow_in)
+         
+         if (self._events_pending):
+            self._notify()
+         
+         return data
+      
       self._lock_queue.acquire()
       
       try:
-         data = type(self._queue)()
-         
-         while (
-                 data_length
-            and (len(self._queue))
+         if (
+                block
+            and (not self._queue)
          ):
-            data_length -= 1
+            self._waiting_flow_out += 1
             
             try:
-               idata = self._queue.pop(0)
-               data.append(idata)
-            except:
-               data_length = 0
-               break
+               self._condition_flow_out.wait_for(
+                  (lambda: self._queue),
+                  timeout=timeout,
+               )
+            finally:
+               self._waiting_flow_out -= 1
+         
+         if (self._queue_engine & flags.QUEUE_ENGINE_RING):
+            data = self._flow_out_ring(data_length=data_length)
+         else:
+            data = type(self._queue)()
+            
+            while (
+                    data_length
+               and (len(self._queue))
+            ):
+               data_length -= 1
+               
+               try:
+                  idata = self._queue.pop(0)
+                  data.append(idata)
+               except:
+                  data_length = 0
+                  break
+         
+         if (data):
+            self._stats_flow_out(
+               data_length = len(data),
+               data_bytes  = self._stats_bytes(data),
+            )
+         
+         if (
+                data
+            and self._waiting_flow_in
+         ):
+            self._condition_flow_in.notify_all()
+      finally:
+         self._lock_queue.release()
+      
+      if (self._events_pending):
+         self._notify()
+      
+      return data
+   
+   def flow_in_bytes (
+      self,
+      buffer,
+   ):
+      """Push bytes into byte queue buffer, in bulk.
+      
+      Enqueues bytes, in order, into byte queue buffer until capacity is not
+      exhausted, as a single (slice) operation.
+      
+      Parameters
+      ----------
+      buffer : bytes, bytearray, memoryview
+         Bytes to be pushed into queue buffer.
+      
+      Returns
+      -------
+      int
+         Returns length of bytes pushed.
+      NoneType
+         Returns None if no bytes supplied or not a byte queue buffer.
+      """
+      
+      if (
+            (not buffer)
+         or (not (self._queue_type & flags.QUEUE_TYPE_BYTE))
+      ):
+         return None
+      
+      buffer          = memoryview(buffer).cast('B')
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+         data_admit   = self._discipline_admit(buffer)
+         data_length  = self._discipline_excess(
+            data_admit  = data_admit,
+            data_length = self._spsc_push(data_admit),
+         )
+         
+         if (
+                data_length
+            and self._waiting_flow_out
+         ):
+            self._spsc_notify(self._condition_flow_out)
+         
+         if (self._events_pending):
+            self._notify()
+         
+         return data_length
+      
+      self._lock_queue.acquire()
+      
+      try:
+         data_admit   = self._discipline_admit(buffer)
+         data_push    = self._capacity_bytes_fit(
+            data        = data_admit,
+            data_length = (
+               len(data_admit)
+               if (self._capacity == -1)
+               else
+               max(0, min(
+                  len(data_admit),
+                  (self._capacity - len(self._queue)),
+               ))
+            ),
+         )
+         
+         if (data_push):
+            self._queue.extend(data_admit[:data_push])
+            
+            self._stats_flow_in(
+               data_length = data_push,
+               data_bytes  = data_push,
+            )
+            
+            if (self._waiting_flow_out):
+               self._condition_flow_out.notify_all()
+         
+         data_length  = self._discipline_excess(
+            data_admit  = data_admit,
+            data_length = data_push,
+         )
+      finally:
+         self._lock_queue.release()
+      
+      if (self._events_pending):
+         self._notify()
+      
+      return data_length
+   
+   def flow_out_bytes (
+      self,
+      max_len   = -1,
+      delimiter = None,
+   ):
+      """Retrieve bytes from byte queue buffer, in bulk.
+      
+      Dequeues bytes, in order, from byte queue buffer until specified length
+      or till last byte in queue, as a single (slice) operation.
+      If delimiter is specified, stops right after (including) delimiter.
+      
+      Parameters
+      ----------
+      max_len : int, default=-1
+         Maximum length of bytes to be retrieved, -1 for all.
+      delimiter : int, bytes, NoneType, default=None
+         Byte after which retrieval stops, if found.
+      
+      Returns
+      -------
+      bytearray
+         Returns bytes, in-order.
+      NoneType
+         Returns None if invalid parameters or not a byte queue buffer.
+      """
+      
+      max_len = int(max_len)
+      
+      if (
+            (not max_len)
+         or (not (self._queue_type & flags.QUEUE_TYPE_BYTE))
+      ):
+         return None
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+         data    = self._spsc_pull(
+            data_length = max_len,
+            delimiter   = delimiter,
+         )
+         
+         if (
+                data
+            and self._waiting_flow_in
+         ):
+            self._spsc_notify(self._condition_flow_in)
+         
+         if (self._events_pending):
+            self._notify()
+         
+         return data
+      
+      self._lock_queue.acquire()
+      
+      try:
+         max_len = (
+            len(self._queue)
+            if ((max_len < 0) or (max_len > len(self._queue)))
+            else
+            max_len
+         )
+         
+         if (delimiter is not None):
+            index = self._queue.find(delimiter, 0, max_len)
+            
+            if (index >= 0):
+               max_len = (index + 1)
+         
+         if (self._queue_engine & flags.QUEUE_ENGINE_RING):
+            data = self._queue.read(max_len)
+         else:
+            data = self._queue[:max_len]
+            
+            del self._queue[:max_len]
+         
+         if (data):
+            self._stats_flow_out(
+               data_length = len(data),
+               data_bytes  = len(data),
+            )
+         
+         if (
+                data
+            and self._waiting_flow_in
+         ):
+            self._condition_flow_in.notify_all()
+      finally:
+         self._lock_queue.release()
+      
+      if (self._events_pending):
+         self._notify()
+      
+      return data
+   
+   def flow_out_into (
+      self,
+      buffer,
+   ):
+      """Retrieve bytes from byte queue buffer into supplied buffer, in bulk.
+      
+      Dequeues bytes, in order, from byte queue buffer into writable buffer
+      until its length or till last byte in queue, as a single (slice)
+      operation, without intermediate copies.
+      
+      Parameters
+      ----------
+      buffer : bytearray, memoryview
+         Writable buffer to retrieve bytes into.
+      
+      Returns
+      -------
+      int
+         Returns length of bytes retrieved.
+      NoneType
+         Returns None if not a byte queue buffer.
+      """
+      
+      if (not (self._queue_type & flags.QUEUE_TYPE_BYTE)):
+         return None
+      
+      buffer          = memoryview(buffer).cast('B')
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+         data            = self._spsc_pull(data_length=len(buffer))
+         data_length     = len(data)
+         
+         buffer[:data_length] = data
+         
+         if (
+                data_length
+            and self._waiting_flow_in
+         ):
+            self._spsc_notify(self._condition_flow_in)
+         
+         if (self._events_pending):
+            self._notify()
+         
+         return data_length
+      
+      self._lock_queue.acquire()
+      
+      try:
+         if (self._queue_engine & flags.QUEUE_ENGINE_RING):
+            data_length = self._queue.readinto(buffer)
+         else:
+            data_length = min(len(buffer), len(self._queue))
+            
+            buffer[:data_length] = self._queue[:data_length]
+            
+            del self._queue[:data_length]
+         
+         if (data_length):
+            self._stats_flow_out(
+               data_length = data_length,
+               data_bytes  = data_length,
+            )
+         
+         if (
+                data_length
+            and self._waiting_flow_in
+         ):
+            self._condition_flow_in.notify_all()
       finally:
          self._lock_queue.release()
       
+      if (self._events_pending):
+         self._notify()
+      
+      return data_length
+   
+   def _length (self):
+      """Query length of queue buffer, without locking.
+      
+      Returns
+      -------
+      int
+         Returns number of data (items) in queue buffer.
+      """
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_SPSC):
+         return self._spsc_length()
+      
+      try:
+         return len(self._queue)
+      except TypeError:
+         return 0
+   
+   def _length_bytes (self):
+      """Query size (in bytes) of data in queue buffer, without locking.
+      
+      Derived from telemetry counters, each written only by its owner side.
+      
+      Returns
+      -------
+      int
+         Returns size (in bytes) of data in queue buffer.
+      """
+      
+      return max(0, (
+           self._stats_bytes_in
+         - self._stats_bytes_out
+         - self._stats_bytes_cleared
+         - self._stats_bytes_evicted
+      ))
+   
+   def _capacity_bytes_fit (
+      self,
+      data,
+      data_length,
+   ):
+      """Number of leading data (items) fitting in remaining byte capacity.
+      
+      Parameters
+      ----------
+      data : tuple, list, bytes, bytearray, memoryview
+         Data (list-like) to be pushed into queue buffer.
+      data_length : int
+         Length (or number) of data (items) fitting in (item) capacity.
+      
+      Returns
+      -------
+      int
+         Returns length (or number) of data (items) fitting in both.
+      """
+      
+      if (self._capacity_bytes < 0):
+         return data_length
+      
+      available   = (self._capacity_bytes - self._length_bytes())
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         return max(0, min(data_length, available))
+      
+      data_fit    = 0
+      
+      for idata in data[:data_length]:
+         try:
+            available -= len(idata)
+         except TypeError:
+            pass
+         
+         if (available < 0):
+            break
+         
+         data_fit += 1
+      
+      return data_fit
+   
+   def _discipline_admit (
+      self,
+      data,
+   ):
+      """Apply queue discipline to data, before pushing it.
+      
+      Drops data early (RED), or evicts oldest queued data to make room for
+      data (head-drop).
+      Expects _lock_queue to be held, or producer side for spsc engine.
+      
+      Parameters
+      ----------
+      data : tuple, list, bytes, bytearray, memoryview
+         Data (list-like) to be pushed into queue buffer.
+      
+      Returns
+      -------
+      tuple, list, bytes, bytearray, memoryview
+         Returns data (list-like) admitted to be pushed.
+      """
+      
+      if (self._queue_discipline & flags.QUEUE_DISCIPLINE_RED):
+         data_admit = list()
+         length     = self._length()
+         
+         for idata in data:
+            if (self._red_drop(length + len(data_admit))):
+               self._stats_flow_dropped(
+                  data_length = 1,
+                  data_bytes  = self._stats_bytes([idata]),
+               )
+            else:
+               data_admit.append(idata)
+         
+         return data_admit
+      elif (self._queue_discipline & flags.QUEUE_DISCIPLINE_HEAD_DROP):
+         if (
+                (self._capacity >= 0)
+            and (len(data) > self._capacity)
+         ):
+            self._stats_flow_dropped(
+               data_length = (len(data) - self._capacity),
+               data_bytes  = self._stats_bytes(data[:-self._capacity]),
+            )
+            
+            data = data[(len(data) - self._capacity):]
+         
+         self._discipline_evict(
+            data_length = len(data),
+            data_bytes  = self._stats_bytes(data),
+         )
+      
       return data
+   
+   def _discipline_evict (
+      self,
+      data_length,
+      data_bytes,
+   ):
+      """Evict oldest queued data, to make room for data (head-drop).
+      
+      Evicts whole items, normal type only.
+      Expects _lock_queue to be held.
+      
+      Parameters
+      ----------
+      data_length : int
+         Length (or number) of data (items) to make room for.
+      data_bytes : int
+         Size (in bytes) of data to make room for.
+      
+      Returns
+      -------
+      int
+         Returns length (or number) of data (items) evicted.
+      """
+      
+      length       = len(self._queue)
+      evict_length = (
+         0
+         if (self._capacity < 0)
+         else
+         max(0, (length + data_length - self._capacity))
+      )
+      evict_bytes  = (
+         0
+         if (self._capacity_bytes < 0)
+         else
+         max(0, (self._length_bytes() + data_bytes - self._capacity_bytes))
+      )
+      
+      if (
+             (not evict_length)
+         and (not evict_bytes)
+      ):
+         return 0
+      
+      evicted      = 0
+      freed        = 0
+      
+      for idata in self._queue:
+         if (
+                (evicted >= evict_length)
+            and (freed   >= evict_bytes)
+         ):
+            break
+         
+         evicted  += 1
+         freed    += self._stats_bytes([idata])
+      
+      evict_length = evicted
+      evict_bytes  = freed
+      
+      if (self._queue_engine & flags.QUEUE_ENGINE_RING):
+         for _ in range(evict_length):
+            self._queue.popleft()
+      else:
+         del self._queue[:evict_length]
+      
+      if (evict_length):
+         self._stats_flow_out(
+            data_length = evict_length,
+            data_bytes  = evict_bytes,
+            evicted     = True,
+         )
+      
+      return evict_length
+   
+   def _discipline_excess (
+      self,
+      data_admit,
+      data_length,
+   ):
+      """Account admitted data not pushed at capacity, as per queue discipline.
+      
+      Excess data is rejected (none), else dropped (tail-drop).
+      Expects _lock_queue to be held, or producer side for spsc engine.
+      
+      Parameters
+      ----------
+      data_admit : tuple, list, bytes, bytearray, memoryview
+         Data (list-like) admitted by queue discipline, to be pushed.
+      data_length : int
+         Length (or number) of data (items) pushed.
+      
+      Returns
+      -------
+      int
+         Returns length of data pushed.
+      """
+      
+      if (data_length < len(data_admit)):
+         if (self._queue_discipline & flags.QUEUE_DISCIPLINE_NONE):
+            self._stats_flow_rejected(
+               data_length = (len(data_admit) - data_length),
+               data_bytes  = self._stats_bytes(data_admit[data_length:]),
+               data_wanted = self._stats_bytes(
+                  data_admit[data_length:(data_length + 1)],
+               ),
+            )
+            
+            return data_length
+         
+         self._stats_flow_dropped(
+            data_length = (len(data_admit) - data_length),
+            data_bytes  = self._stats_bytes(data_admit[data_length:]),
+         )
+      
+      return data_length
+   
+   def _red_drop (
+      self,
+      length,
+   ):
+      """Decide whether to drop data (item) early, as per RED.
+      
+      Updates average length with instantaneous length, then drops with
+      probability rising linearly between thresholds, spread uniformly
+      across admitted data (as per count since last drop).
+      
+      Parameters
+      ----------
+      length : int
+         Instantaneous length of queue buffer.
+      
+      Returns
+      -------
+      bool
+         Returns True if data should be dropped, else False.
+      """
+      
+      self._red_average = (
+           ((1.0 - self._red_weight) * self._red_average)
+         + (       self._red_weight  * length)
+      )
+      
+      if (self._red_average < self._red_min):
+         self._red_count = -1
+         
+         return False
+      elif (self._red_average >= self._red_max):
+         self._red_count = 0
+         
+         return True
+      
+      self._red_count += 1
+      
+      probability       = self._red_probability * (
+           (self._red_average - self._red_min)
+         / (self._red_max     - self._red_min)
+      )
+      probability       = (
+         (probability / (1.0 - (self._red_count * probability)))
+         if ((self._red_count * probability) < 1.0)
+         else
+         1.0
+      )
+      
+      if (self._red_random.random() < probability):
+         self._red_count = 0
+         
+         return True
+      
+      return False
+   
+   def _events_detect (
+      self,
+      length_before,
+      length_after,
+   ):
+      """Detect events due to change in length, for notification alerts.
+      
+      Accumulates detected events as pending, to be sent by _notify() once
+      queue's lock is released. No-op while no alert is registered.
+      
+      Parameters
+      ----------
+      length_before : int
+         Length of queue buffer before change.
+      length_after : int
+         Length of queue buffer after change.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      if (not self._list_notification):
+         return None
+      
+      events = 0
+      
+      if (
+             (not length_before)
+         and (    length_after)
+      ):
+         events |= flags.QUEUE_EVENT_NON_EMPTY
+      
+      if (
+             (self._capacity > 0)
+         and (length_before >= self._capacity)
+         and (length_after  <  self._capacity)
+      ):
+         events |= flags.QUEUE_EVENT_WRITABLE
+      
+      if (
+             (length_after < length_before)
+         and (self._capacity_bytes_wanted)
+         and (
+               (self._capacity_bytes - self._length_bytes())
+            >= self._capacity_bytes_wanted
+         )
+      ):
+         self._capacity_bytes_wanted = 0
+         events                     |= flags.QUEUE_EVENT_WRITABLE
+      
+      self._lock_list_notification.acquire()
+      
+      try:
+         if (self._watermark_high >= 0):
+            if (
+                   (not self._watermark_above)
+               and (length_after >= self._watermark_high)
+            ):
+               self._watermark_above = True
+               events               |= flags.QUEUE_EVENT_WATERMARK_HIGH
+            elif (
+                   (self._watermark_above)
+               and (length_after <= self._watermark_low)
+            ):
+               self._watermark_above = False
+               events               |= flags.QUEUE_EVENT_WATERMARK_LOW
+         
+         self._events_pending |= events
+      finally:
+         self._lock_list_notification.release()
+      
+      return None
+   
+   def _notify (
+      self,
+      events     = None,
+      identifier = None,
+   ):
+      """Send notification alerts for pending (or specified) events.
+      
+      Expects _lock_queue not to be held, callbacks may use queue buffer.
+      
+      Parameters
+      ----------
+      events : int, NoneType, default=None
+         Events to send alerts for, None for pending events.
+      identifier : str, NoneType, default=None
+         Send alert only to registration with identifier, None for all.
+      
+      Returns
+      -------
+      bool
+         Returns True if any alert was sent, else False.
+      """
+      
+      notification_callbacks = list()
+      
+      self._lock_list_notification.acquire()
+      
+      try:
+         if (events is None):
+            events               = self._events_pending
+            self._events_pending = 0
+         
+         for notification_identifier in list(self._list_notification.keys()):
+            if (
+                   (identifier is not None)
+               and (notification_identifier != identifier)
+            ):
+               continue
+            
+            notification = self._list_notification[notification_identifier]
+            
+            if (not (notification[0] & events)):
+               continue
+            
+            if (notification[1] > 0):
+               notification[1] -= 1
+               
+               if (not notification[1]):
+                  self._list_notification.pop(notification_identifier)
+            
+            notification_callbacks.append([
+               notification[2],
+               notification[3],
+               (notification[0] & events),
+            ])
+      finally:
+         self._lock_list_notification.release()
+      
+      for callback, non_blocking, event in notification_callbacks:
+         if (non_blocking):
+            Thread(
+               target = callback,
+               kwargs = {
+                  'queue' : self,
+                  'event' : event,
+               },
+               daemon = True,
+            ).start()
+         else:
+            callback(
+               queue = self,
+               event = event,
+            )
+      
+      return bool(notification_callbacks)
+   
+   def _stats_bytes (
+      self,
+      data,
+   ):
+      """Size (in bytes) of data, for telemetry.
+      
+      Parameters
+      ----------
+      data : tuple, list, deque, bytes, bytearray, memoryview, RingBuffer
+         Data (list-like) to be measured.
+      
+      Returns
+      -------
+      int
+         Returns size in bytes, items without length are not counted.
+      """
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         return len(data)
+      
+      data_bytes = 0
+      
+      for idata in data:
+         try:
+            data_bytes += len(idata)
+         except TypeError:
+            pass
+      
+      return data_bytes
+   
+   def _stats_flow_in (
+      self,
+      data_length,
+      data_bytes,
+      stamped     = False,
+   ):
+      """Account pushed data in telemetry.
+      
+      Expects _lock_queue to be held, or producer side for spsc engine.
+      
+      Parameters
+      ----------
+      data_length : int
+         Length (or number) of data (items) pushed.
+      data_bytes : int
+         Size (in bytes) of data pushed.
+      stamped : bool, default=False
+         Enqueue timestamp already appended, before data was published ?
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._stats_items_in += data_length
+      self._stats_bytes_in += data_bytes
+      
+      if (not stamped):
+         self._stats_timestamps.append((time.monotonic(), data_length))
+      
+      length = self._length()
+      
+      if (length > self._stats_high_watermark):
+         self._stats_high_watermark = length
+      
+      self._events_detect(
+         length_before = (length - data_length),
+         length_after  = length,
+      )
+      
+      return None
+   
+   def _stats_flow_rejected (
+      self,
+      data_length,
+      data_bytes,
+      data_wanted = 0,
+   ):
+      """Account data rejected at capacity in telemetry.
+      
+      If rejected at byte capacity (not item capacity), records free space
+      wanted by first rejected data (item), so that writable event is only
+      raised once it can be admitted.
+      Expects _lock_queue to be held, or producer side for spsc engine.
+      
+      Parameters
+      ----------
+      data_length : int
+         Length (or number) of data (items) rejected.
+      data_bytes : int
+         Size (in bytes) of data rejected.
+      data_wanted : int, default=0
+         Size (in bytes) of first data (item) rejected.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._stats_items_rejected += data_length
+      self._stats_bytes_rejected += data_bytes
+      
+      if (
+             (self._capacity_bytes >= 0)
+         and (
+               (self._capacity < 0)
+            or (self._length() < self._capacity)
+         )
+      ):
+         self._capacity_bytes_wanted = max(1, data_wanted)
+      
+      return None
+   
+   def _stats_flow_dropped (
+      self,
+      data_length,
+      data_bytes,
+   ):
+      """Account data dropped by queue discipline in telemetry.
+      
+      Expects _lock_queue to be held, or producer side for spsc engine.
+      
+      Parameters
+      ----------
+      data_length : int
+         Length (or number) of data (items) dropped.
+      data_bytes : int
+         Size (in bytes) of data dropped.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._stats_items_dropped += data_length
+      self._stats_bytes_dropped += data_bytes
+      
+      return None
+   
+   def _stats_flow_out (
+      self,
+      data_length,
+      data_bytes,
+      cleared     = False,
+      evicted     = False,
+   ):
+      """Account retrieved (or cleared, evicted) data in telemetry.
+      
+      Consumes oldest enqueue timestamps (run-length encoded per push) to
+      accumulate per-item sojourn time. Timestamps are shared with producer
+      (spsc engine), so are never mutated, progress within oldest one being
+      kept in _stats_timestamps_offset instead.
+      Expects _lock_queue to be held, or consumer side for spsc engine.
+      
+      Parameters
+      ----------
+      data_length : int
+         Length (or number) of data (items) retrieved.
+      data_bytes : int
+         Size (in bytes) of data retrieved.
+      cleared : bool, default=False
+         Data was discarded by clear(), instead of retrieved ?
+      evicted : bool, default=False
+         Data was evicted by queue discipline, instead of retrieved ?
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      time_now     = time.monotonic()
+      time_sojourn = 0.0
+      remaining    = data_length
+      
+      while (
+             remaining
+         and self._stats_timestamps
+      ):
+         timestamp     = self._stats_timestamps[0]
+         items         = min(
+            remaining,
+            (timestamp[1] - self._stats_timestamps_offset),
+         )
+         
+         time_sojourn += (items * (time_now - timestamp[0]))
+         remaining    -= items
+         
+         if ((self._stats_timestamps_offset + items) >= timestamp[1]):
+            self._stats_timestamps.popleft()
+            
+            self._stats_timestamps_offset  = 0
+         else:
+            self._stats_timestamps_offset += items
+      
+      self._stats_time_departed   += time_sojourn
+      
+      if (cleared):
+         self._stats_items_cleared += data_length
+         self._stats_bytes_cleared += data_bytes
+      elif (evicted):
+         self._stats_items_evicted += data_length
+         self._stats_bytes_evicted += data_bytes
+      else:
+         self._stats_items_out     += data_length
+         self._stats_bytes_out     += data_bytes
+         self._stats_time_sojourn  += time_sojourn
+      
+      length = self._length()
+      
+      self._events_detect(
+         length_before = (length + data_length),
+         length_after  = length,
+      )
+      
+      return None
+   
+   def _spsc_length (self):
+      """Query length of spsc engine's queue buffer, without locking.
+      
+      Derived from producer owned (_count_flow_in) and consumer owned
+      (_count_flow_out) counters, each written only by its owner.
+      
+      Returns
+      -------
+      int
+         Returns number of data (items) in queue buffer.
+      """
+      
+      return max(0, (self._count_flow_in - self._count_flow_out))
+   
+   def _spsc_push (
+      self,
+      data,
+   ):
+      """Push data into spsc engine's queue buffer, without locking.
+      
+      Producer side only, relies on GIL-atomic deque append/extend.
+      
+      Parameters
+      ----------
+      data : tuple, list, bytes, bytearray, memoryview
+         Data (list-like) to be pushed into queue buffer.
+      
+      Returns
+      -------
+      int
+         Returns length of data pushed.
+      """
+      
+      data_length = self._capacity_bytes_fit(
+         data        = data,
+         data_length = (
+            len(data)
+            if (self._capacity == -1)
+            else
+            max(0, min(len(data), (self._capacity - self._spsc_length())))
+         ),
+      )
+      
+      if (not data_length):
+         return 0
+      
+      data                 = data[:data_length]
+      
+      # Stamped before published, so that consumer never departs data
+      # ahead of its enqueue timestamp.
+      self._stats_timestamps.append((time.monotonic(), data_length))
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         self._queue.append(bytes(data))
+      else:
+         self._queue.extend(data)
+      
+      self._count_flow_in += data_length
+      
+      self._stats_flow_in(
+         data_length = data_length,
+         data_bytes  = self._stats_bytes(data),
+         stamped     = True,
+      )
+      
+      return data_length
+   
+   def _spsc_pull (
+      self,
+      data_length = 1,
+      delimiter   = None,
+      account     = True,
+   ):
+      """Retrieve data from spsc engine's queue buffer, without locking.
+      
+      Consumer side only, relies on GIL-atomic deque popleft. Byte queue
+      buffers hold pushed chunks, partially consumed chunk being owned by
+      consumer (_spsc_chunk, _spsc_offset). Holds _lock_consumer, so that
+      clear() (pulling from any thread) and contents() never interleave.
+      
+      Parameters
+      ----------
+      data_length : int, default=1
+         Length (or number) of data (items) to be retrieved, -1 for all.
+      delimiter : int, bytes, NoneType, default=None
+         Byte after which retrieval stops, if found (byte queue buffer only).
+      account : bool, default=True
+         Account retrieved data in telemetry ?
+      
+      Returns
+      -------
+      list, bytearray
+         Returns list-like sequence of data, in-order.
+      """
+      
+      self._lock_consumer.acquire()
+      
+      try:
+         if (data_length < 0):
+            data_length = self._spsc_length()
+         
+         if (self._queue_type & flags.QUEUE_TYPE_NORMAL):
+            data = list()
+            
+            try:
+               while (len(data) < data_length):
+                  data.append(self._queue.popleft())
+            except IndexError:
+               pass
+         else:
+            data = bytearray()
+            
+            while (len(data) < data_length):
+               chunk = self._spsc_chunk
+               
+               if (chunk is None):
+                  try:
+                     chunk = self._queue.popleft()
+                  except IndexError:
+                     break
+                  
+                  self._spsc_chunk  = chunk
+                  self._spsc_offset = 0
+               
+               start = self._spsc_offset
+               end   = min(len(chunk), (start + (data_length - len(data))))
+               found = False
+               
+               if (delimiter is not None):
+                  index = chunk.find(delimiter, start, end)
+                  
+                  if (index >= 0):
+                     end   = (index + 1)
+                     found = True
+               
+               data += memoryview(chunk)[start:end]
+               
+               if (end >= len(chunk)):
+                  self._spsc_chunk  = None
+                  self._spsc_offset = 0
+               else:
+                  self._spsc_offset = end
+               
+               if (found):
+                  break
+         
+         self._count_flow_out += len(data)
+         
+         if (
+                data
+            and account
+         ):
+            self._stats_flow_out(
+               data_length = len(data),
+               data_bytes  = self._stats_bytes(data),
+            )
+      finally:
+         self._lock_consumer.release()
+      
+      return data
+   
+   def _spsc_wait (
+      self,
+      flow_in = False,
+      timeout = None,
+   ):
+      """Wait for space (flow_in) or data (flow_out) in spsc engine.
+      
+      Registers as waiter before checking, so that a lock-free push or pull
+      racing with it always notifies.
+      
+      Parameters
+      ----------
+      flow_in : bool, default=False
+         Wait for space, instead of data ?
+      timeout : int, float, NoneType, default=None
+         Maximum duration to wait for. None to wait forever.
+      
+      Returns
+      -------
+      bool
+         Returns True if waited-for condition holds, else False.
+      """
+      
+      if (flow_in):
+         condition = self._condition_flow_in
+         predicate = (lambda: (
+               (self._capacity < 0)
+            or (self._spsc_length() < self._capacity)
+         ))
+      else:
+         condition = self._condition_flow_out
+         predicate = self._spsc_length
+      
+      condition.acquire()
+      
+      try:
+         if (flow_in):
+            self._waiting_flow_in  += 1
+         else:
+            self._waiting_flow_out += 1
+         
+         try:
+            return bool(condition.wait_for(predicate, timeout=timeout))
+         finally:
+            if (flow_in):
+               self._waiting_flow_in  -= 1
+            else:
+               self._waiting_flow_out -= 1
+      finally:
+         condition.release()
+   
+   def _spsc_notify (
+      self,
+      condition,
+   ):
+      """Wake up waiters blocked on specified condition, in spsc engine.
+      
+      Parameters
+      ----------
+      condition : Condition()
+         Condition to notify.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      condition.acquire()
+      
+      try:
+         condition.notify_all()
+      finally:
+         condition.release()
+      
+      return None
+   
+   def _spsc_contents (
+      self,
+      offset,
+      stop,
+   ):
+      """Clone a window of spsc engine's queue buffer, without locking.
+      
+      Holds _lock_consumer, so that consumer's partially retrieved chunk is
+      consistent with deque, and iterates live deque, which producer may
+      append to meanwhile, retrying on such a mutation and falling back to
+      iterating an (atomic) copy.
+      
+      Parameters
+      ----------
+      offset : int
+         Number of data (items, bytes for byte type) to skip from first.
+      stop : int, NoneType
+         Position to clone up-to, None for all.
+      
+      Returns
+      -------
+      list, bytearray
+         Returns cloned window of contents.
+      """
+      
+      self._lock_consumer.acquire()
+      
+      try:
+         for attempt in range(3):
+            store = (
+               self._queue
+               if (attempt < 2)
+               else
+               self._queue.copy()
+            )
+            
+            try:
+               if (self._queue_type & flags.QUEUE_TYPE_NORMAL):
+                  return list(islice(store, offset, stop))
+               
+               chunk    = self._spsc_chunk
+               contents = bytearray(
+                  b''
+                  if (chunk is None)
+                  else
+                  chunk[self._spsc_offset:]
+               )
+               
+               for chunk in store:
+                  if (
+                         (stop is not None)
+                     and (len(contents) >= stop)
+                  ):
+                     break
+                  
+                  contents += chunk
+               
+               return contents[offset:stop]
+            except RuntimeError:
+               pass
+      finally:
+         self._lock_consumer.release()
+      
+      return []
+   
+   def _flow_out_ring (
+      self,
+      data_length=1,
+   ):
+      """Retrieve data from ring engine's queue buffer.
+      
+      Dequeues data, in order, from ring engine's queue buffer in O(1) per
+      item, without shifting remaining items. Expects _lock_queue to be held.
+      
+      Parameters
+      ----------
+      data_length : int
+         Length (or number) of data (items) to be retrieved, -1 for all.
+      
+      Returns
+      -------
+      list, bytearray
+         Returns list-like sequence of data, in-order.
+      """
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         return self._queue.read(data_length)
+      
+      data_length = (
+         len(self._queue)
+         if (data_length < 0)
+         else
+         min(data_length, len(self._queue))
+      )
+      
+      if (data_length == 1):
+         return [self._queue.popleft()]
+      
+      return [
+         self._queue.popleft()
+         for _ in range(data_length)
+      ]
@@ -0,0 +1,395 @@
+class RingBuffer:
+   """Circular byte buffer.
+   
+   Preallocated circular bytearray, indexed by head and length, used as
+   storage for byte queue buffers with ring engine. Provides O(1) enqueue and
+   dequeue irrespective of backlog, with bulk transfers done as (at most two)
+   slice operations.
+   If un-limited, buffer store grows (doubles) upon exhaustion.
+   
+   Attributes
+   ----------
+   _growable : bool
+      Can buffer store grow upon exhaustion ?
+   _size : int
+      Size of buffer store.
+   _buffer : bytearray
+      Preallocated buffer store.
+   _head : int
+      Index of first (oldest) byte in buffer store.
+   _length : int
+      Number of bytes held in buffer store.
+   
+   Methods
+   -------
+   __init__ (capacity, size_initial)
+      Init ring buffer with specified configuration.
+   append ()
+      Push single byte into ring buffer.
+   extend ()
+      Push bytes into ring buffer.
+   popleft ()
+      Retrieve single byte from ring buffer.
+   read ()
+      Retrieve bytes from ring buffer.
+   readinto ()
+      Retrieve bytes from ring buffer into supplied buffer.
+   find ()
+      Find position of byte in ring buffer.
+   peek ()
+      Retrieve bytes from ring buffer without deleting them.
+   copy ()
+      Retrieve all bytes from ring buffer without deleting them.
+   clear ()
+      Clear or empty ring buffer.
+   """
+   
+   def __init__ (
+      self,
+      capacity     =   -1, # un-limited
+      size_initial = 4096,
+   ):
+      """Init ring buffer with specified configuration.
+      
+      Parameters
+      ----------
+      capacity : int, default=-1
+         Ring buffer capacity, preallocated. Negative for un-limited.
+      size_initial : int, default=4096
+         Initial size of buffer store, if un-limited.
+      """
+      
+      capacity       = int(capacity)
+      
+      self._growable = (capacity < 0)
+      self._size     = (
+         capacity
+         if (capacity > 0)
+         else
+         max(1, int(size_initial))
+      )
+      self._buffer   = bytearray(self._size)
+      self._head     = 0
+      self._length   = 0
+   
+   def __len__ (self):
+      return self._length
+   
+   def __bool__ (self):
+      return (self._length > 0)
+   
+   def _grow (
+      self,
+      length_required,
+   ):
+      """Grow buffer store to hold at-least specified length.
+      
+      Parameters
+      ----------
+      length_required : int
+         Minimum length buffer store should be able to hold.
+      
+      Returns
+      -------
+      bool
+         Returns False if buffer store can not grow, else True.
+      """
+      
+      if (length_required <= self._size):
+         return True
+      elif (not self._growable):
+         return False
+      
+      size = self._size
+      
+      while (size < length_required):
+         size *= 2
+      
+      buffer         = self.peek(self._length)
+      buffer.extend(bytes(size - self._length))
+      
+      self._buffer   = buffer
+      self._size     = size
+      self._head     = 0
+      
+      return True
+   
+   def append (
+      self,
+      value,
+   ):
+      """Push single byte into ring buffer.
+      
+      Parameters
+      ----------
+      value : int
+         Byte to be pushed.
+      
+      Raises
+      ------
+      OverflowError
+         Ring buffer is full and can not grow.
+      """
+      
+      if (
+             (self._length >= self._size)
+         and (not self._grow(self._length + 1))
+      ):
+         raise OverflowError('ringbuffer: full')
+      
+      self._buffer[(self._head + self._length) % self._size] = value
+      self._length += 1
+   
+   def extend (
+      self,
+      data,
+   ):
+      """Push bytes into ring buffer.
+      
+      Parameters
+      ----------
+      data : bytes, bytearray, memoryview, list
+         Bytes (or list of ints) to be pushed.
+      
+      Raises
+      ------
+      OverflowError
+         Ring buffer can not hold data and can not grow.
+      """
+      
+      if (not isinstance(data, (bytes, bytearray, memoryview))):
+         data     = bytes(data)
+      
+      data_length = len(data)
+      
+      if (not data_length):
+         return None
+      
+      if (
+             ((self._length + data_length) > self._size)
+         and (not self._grow(self._length + data_length))
+      ):
+         raise OverflowError('ringbuffer: full')
+      
+      tail        = (self._head + self._length) % self._size
+      first       = min(data_length, (self._size - tail))
+      
+      if (first == data_length):
+         self._buffer[tail:(tail + first)] = data
+      else:
+         data = memoryview(data)
+         
+         self._buffer[tail:(tail + first)]    = data[:first]
+         self._buffer[:(data_length - first)] = data[first:]
+      
+      self._length += data_length
+   
+   def popleft (self):
+      """Retrieve single byte from ring buffer.
+      
+      Raises
+      ------
+      IndexError
+         Ring buffer is empty.
+      
+      Returns
+      -------
+      int
+         Returns first (oldest) byte.
+      """
+      
+      if (not self._length):
+         raise IndexError('ringbuffer: empty')
+      
+      value         = self._buffer[self._head]
+      self._head    = (self._head + 1) % self._size
+      self._length -= 1
+      
+      return value
+   
+   def read (
+      self,
+      length = -1,
+   ):
+      """Retrieve bytes from ring buffer.
+      
+      Parameters
+      ----------
+      length : int, default=-1
+         Maximum number of bytes to retrieve, negative for all.
+      
+      Returns
+      -------
+      bytearray
+         Returns retrieved bytes, in-order.
+      """
+      
+      head          = self._head
+      length        = (
+         self._length
+         if ((length < 0) or (length > self._length))
+         else
+         length
+      )
+      
+      if ((head + length) <= self._size):
+         data       = self._buffer[head:(head + length)]
+      else:
+         data       = self._buffer[head:]
+         data      += self._buffer[:(length - len(data))]
+      
+      self._length -= length
+      self._head    = (
+         ((head + length) % self._size)
+         if (self._length)
+         else
+         0
+      )
+      
+      return data
+   
+   def readinto (
+      self,
+      buffer,
+   ):
+      """Retrieve bytes from ring buffer into supplied buffer.
+      
+      Parameters
+      ----------
+      buffer : bytearray, memoryview
+         Writable buffer to retrieve bytes into, up to its length.
+      
+      Returns
+      -------
+      int
+         Returns number of bytes retrieved.
+      """
+      
+      buffer        = memoryview(buffer).cast('B')
+      head          = self._head
+      length        = min(len(buffer), self._length)
+      first         = min(length, (self._size - head))
+      
+      buffer[:first]             = self._buffer[head:(head + first)]
+      
+      if (first < length):
+         buffer[first:length]    = self._buffer[:(length - first)]
+      
+      self._length -= length
+      self._head    = (
+         ((head + length) % self._size)
+         if (self._length)
+         else
+         0
+      )
+      
+      return length
+   
+   def find (
+      self,
+      value,
+      start = 0,
+      end   = None,
+   ):
+      """Find position of byte in ring buffer.
+      
+      Parameters
+      ----------
+      value : int, bytes
+         Byte to search for.
+      start : int, default=0
+         Position (from first byte) to start searching at.
+      end : int, NoneType, default=None
+         Position (from first byte) to stop searching at, None for all.
+      
+      Returns
+      -------
+      int
+         Returns position from first (oldest) byte, -1 if not found.
+      """
+      
+      end    = (
+         self._length
+         if ((end is None) or (end > self._length))
+         else
+         max(0, end)
+      )
+      start  = min(max(0, start), end)
+      head   = (self._head + start) % self._size
+      length = (end - start)
+      first  = min(length, (self._size - head))
+      
+      index  = self._buffer.find(value, head, (head + first))
+      
+      if (index >= 0):
+         return (start + (index - head))
+      elif (first < length):
+         index = self._buffer.find(value, 0, (length - first))
+         
+         if (index >= 0):
+            return (start + first + index)
+      
+      return -1
+   
+   def peek (
+      self,
+      length = -1,
+      offset =  0,
+   ):
+      """Retrieve bytes from ring buffer without deleting them.
+      
+      Parameters
+      ----------
+      length : int, default=-1
+         Maximum number of bytes to retrieve, negative for all.
+      offset : int, default=0
+         Number of bytes to skip from first (oldest) byte.
+      
+      Returns
+      -------
+      bytearray
+         Returns cloned bytes, in-order.
+      """
+      
+      offset = min(max(0, offset), self._length)
+      length = (
+         (self._length - offset)
+         if (length < 0)
+         else
+         min(length, (self._length - offset))
+      )
+      
+      start  = (self._head + offset) % self._size
+      
+      if ((start + length) <= self._size):
+         return self._buffer[start:(start + length)]
+      
+      data   = self._buffer[start:]
+      data  += self._buffer[:(length - len(data))]
+      
+      return data
+   
+   def copy (self):
+      """Retrieve all bytes from ring buffer without deleting them.
+      
+      Returns
+      -------
+      bytearray
+         Returns cloned bytes, in-order.
+      """
+      
+      return self.peek()
+   
+   def clear (self):
+      """Clear or empty ring buffer.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._head   = 0
+      self._length = 0
+      
+      return None
@@ -0,0 +1,1317 @@
+from .flags import Flags as flags
+from .descriptors import Descriptors as descriptors
+
+import time
+import struct
+from multiprocessing.shared_memory import SharedMemory
+
+class SharedQueue:
+   """Shared memory queue buffer.
+   
+   Queue buffer backed by a named shared memory ring, so that producer and
+   consumer may live in separate processes (each with its own GIL), while
+   exchanging data without pickling. Provides the same flow_in, flow_out and
+   state interface as Queue.
+   Normal queue buffers hold bytes-like items, framed with a length prefix.
+   Byte queue buffers hold a plain byte stream.
+   Lock-free, for exactly one producer and one consumer at a time: producer
+   only writes tail counters, consumer only writes head counters, each as an
+   aligned 8-byte store after the data it publishes or releases. Item counts
+   trail tail and head, so that they never report data not yet readable.
+   Blocking flow_in and flow_out poll, backing off exponentially, as there
+   is no condition to wait upon across processes. For the same reason,
+   notification alerts are not supported.
+   Picklable, unpickles (in another process) by attaching to the same
+   shared memory by name.
+   
+   Shared memory layout::
+      
+      [  0] size, queue_type, capacity, time_created
+      [ 64] tail, count_in, items_rejected, bytes_rejected, high_watermark
+      [128] head, count_out, items_cleared, bytes_cleared
+      [192] ring of size bytes
+   
+   Attributes
+   ----------
+   _shared_memory : SharedMemory
+      Shared memory segment holding header and ring.
+   _owner : bool
+      Was shared memory segment created (and should be unlinked) by self ?
+   _header : memoryview
+      View over header of shared memory segment.
+   _ring : memoryview
+      View over ring of shared memory segment.
+   _size : int
+      Size of ring, in bytes.
+   _queue_type : int
+      Queue's buffer type.
+   _capacity : int
+      Queue buffer capacity (items, bytes for byte type), -1 for un-limited.
+   
+   Methods
+   -------
+   __init__ (queue_type, capacity, size, name, create)
+      Init shared queue buffer with specified configuration.
+   name ()
+      Query name of shared memory segment, to attach from other process.
+   queue_type ()
+      Query queue's buffer type.
+   queue_engine ()
+      Query queue's storage engine.
+   queue_discipline ()
+      Interact with queue's discipline, none only.
+   state ()
+      Query queue buffer's state.
+   clear ()
+      Clear or empty queue buffer, consumer side.
+   stats ()
+      Query queue buffer's telemetry, as a single snapshot.
+   version ()
+      Query queue buffer's contents version.
+   contents ()
+      Retrieve contents of queue buffer without deleting them.
+   flow_in ()
+      Push data into queue buffer.
+   flow_out ()
+      Retrieve data from queue buffer.
+   flow_in_bytes ()
+      Push bytes into byte queue buffer, in bulk.
+   flow_out_bytes ()
+      Retrieve bytes from byte queue buffer, in bulk.
+   flow_out_into ()
+      Retrieve bytes from byte queue buffer into supplied buffer, in bulk.
+   notification_alert ()
+      Handles registration for event based notifications, unsupported.
+   close ()
+      Detach from shared memory segment.
+   unlink ()
+      Destroy shared memory segment.
+   """
+   
+   _FORMAT_CONFIG   = '<QQqd'
+   _FORMAT_PRODUCER = '<QQQQQ'
+   _FORMAT_CONSUMER = '<QQQQ'
+   _FORMAT_FRAME    = '<I'
+   
+   _OFFSET_CONFIG   =   0
+   _OFFSET_PRODUCER =  64
+   _OFFSET_CONSUMER = 128
+   _SIZE_HEADER     = 192
+   _SIZE_FRAME      = struct.calcsize(_FORMAT_FRAME)
+   
+   _NAMES_PRODUCER  = (
+      'tail',
+      'count_in',
+      'items_rejected',
+      'bytes_rejected',
+      'high_watermark',
+   )
+   _NAMES_CONSUMER  = (
+      'head',
+      'count_out',
+      'items_cleared',
+      'bytes_cleared',
+   )
+   
+   _poll_interval_min = 0.00005
+   _poll_interval_max = 0.005
+   
+   def __init__ (
+      self,
+      queue_type = flags.QUEUE_TYPE_NORMAL,
+      capacity   = -1, # un-limited
+      size       = 65536,
+      name       = None,
+      create     = True,
+   ):
+      """Init shared queue buffer with specified configuration.
+      
+      Parameters
+      ----------
+      queue_type : int, default=flags.QUEUE_TYPE_NORMAL
+         Queue's buffer type.
+      capacity : int, default=-1
+         Queue buffer capacity (items, bytes for byte type), bounded by size.
+      size : int, default=65536
+         Size of shared memory ring, in bytes (including framing).
+      name : str, NoneType, default=None
+         Name of shared memory segment, None to generate one.
+      create : bool, default=True
+         Create shared memory segment, or attach to existing one by name
+         (taking configuration from it) ?
+      
+      Raises
+      ------
+      Exception
+         *  Invalid capacity.
+         *  Invalid size.
+         *  Invalid queue_type.
+      """
+      
+      self._shared_memory = None
+      self._owner         = bool(create)
+      
+      if (create):
+         capacity = int(capacity)
+         size     = int(size)
+         
+         if (
+               (not capacity)
+            or (size <= self._SIZE_FRAME)
+         ):
+            raise Exception((
+                    '{0}:\n'
+                  + 'capacity: {1}\n'
+                  + 'size: {2}\n'
+               ).format(
+                  descriptors.ERROR_CAPACITY_INVALID,
+                  capacity,
+                  size,
+               )
+            )
+         elif (queue_type not in (
+            flags.QUEUE_TYPE_NORMAL,
+            flags.QUEUE_TYPE_BYTE,
+         )):
+            raise Exception((
+                    '{0}:\n'
+                  + 'queue_type: {1}\n'
+               ).format(
+                  descriptors.QUEUE_TYPE_SET_FAILURE,
+                  queue_type,
+               )
+            )
+         
+         self._shared_memory = SharedMemory(
+            name   = name,
+            create = True,
+            size   = (self._SIZE_HEADER + size),
+         )
+         
+         self._shared_memory.buf[:self._SIZE_HEADER] = bytes(self._SIZE_HEADER)
+         
+         struct.pack_into(
+            self._FORMAT_CONFIG,
+            self._shared_memory.buf,
+            self._OFFSET_CONFIG,
+            size,
+            queue_type,
+            capacity,
+            time.time(),
+         )
+      else:
+         try:
+            self._shared_memory = SharedMemory(
+               name   = name,
+               create = False,
+               track  = False,
+            )
+         except TypeError:
+            # (< 3.13) tracked, by the resource tracker shared with creator
+            self._shared_memory = SharedMemory(
+               name   = name,
+               create = False,
+            )
+      
+      self._header = self._shared_memory.buf[:self._SIZE_HEADER]
+      
+      size, queue_type, capacity, _ = struct.unpack_from(
+         self._FORMAT_CONFIG,
+         self._header,
+         self._OFFSET_CONFIG,
+      )
+      
+      self._size       = size
+      self._ring       = self._shared_memory.buf[
+         self._SIZE_HEADER:(self._SIZE_HEADER + size)
+      ]
+      self._queue_type = queue_type
+      self._capacity   = (
+         size
+         if (
+                (capacity < 0)
+            and (queue_type & flags.QUEUE_TYPE_BYTE)
+         )
+         else
+         capacity
+      )
+   
+   def __reduce__ (self):
+      return (
+         type(self),
+         (self._queue_type, self._capacity, self._size, self.name(), False),
+      )
+   
+   def __del__ (self):
+      try:
+         self.close()
+      except:
+         pass
+   
+   def name (self):
+      """Query name of shared memory segment, to attach from other process.
+      
+      Returns
+      -------
+      str
+         Returns name of shared memory segment.
+      """
+      
+      return self._shared_memory.name
+   
+   def queue_type (self):
+      """Query queue's buffer type.
+      
+      Returns
+      -------
+      int
+         Returns queue's buffer type.
+      """
+      
+      return self._queue_type
+   
+   def queue_engine (self):
+      """Query queue's storage engine.
+      
+      Returns
+      -------
+      int
+         Returns flags.QUEUE_ENGINE_SHARED.
+      """
+      
+      return flags.QUEUE_ENGINE_SHARED
+   
+   def queue_discipline (
+      self,
+      queue_discipline = None,
+      red_min          = -1,
+      red_max          = -1,
+      red_probability  = 0.1,
+      red_weight       = 0.002,
+      seed             = None,
+      describe         = True,
+   ):
+      """Interact with queue's discipline, none only.
+      
+      Data exceeding capacity is always rejected, as dropping would need
+      producer to dequeue. Same signature as Queue's.
+      
+      Parameters
+      ----------
+      queue_discipline : int, NoneType, default=None
+         Set queue's discipline, only flags.QUEUE_DISCIPLINE_NONE.
+      red_min, red_max, red_probability, red_weight, seed
+         Ignored.
+      describe : bool, default=True
+         Describe queue's discipline using descriptors ?
+      
+      Returns
+      -------
+      int
+         Returns flags.QUEUE_DISCIPLINE_NONE.
+      str
+         Returns description of queue's discipline.
+      bool
+         Returns True on setting queue's discipline.
+      
+      Raises
+      ------
+      Exception
+         *  Invalid queue_discipline.
+      """
+      
+      if (queue_discipline is None):
+         return (
+            descriptors.QUEUE_DISCIPLINE_NONE
+            if (describe)
+            else
+            flags.QUEUE_DISCIPLINE_NONE
+         )
+      elif (queue_discipline != flags.QUEUE_DISCIPLINE_NONE):
+         raise Exception((
+                 '{0}:\n'
+               + 'queue_discipline: {1}\n'
+               + 'queue_engine: {2}\n'
+            ).format(
+               descriptors.QUEUE_DISCIPLINE_SET_FAILURE,
+               queue_discipline,
+               flags.QUEUE_ENGINE_SHARED,
+            )
+         )
+      
+      return True
+   
+   def state (
+      self,
+      capacity = False,
+      empty    = False,
+      full     = False,
+      relative = False,
+      value    = False,
+      size     = False,
+   ):
+      """Query queue buffer's state.
+      
+      Query queue buffer's current state such as capacity, empty or full.
+      Reports answers to queries only for set parameters.
+      
+      Parameters
+      ----------
+      capacity : bool, default=False
+         Report buffer capacity ?
+      empty : bool, default=False
+         Report whether buffer is empty ?
+      full : bool, default=False
+         Report whether buffer is full ?
+      relative : bool, default=False
+         Report respective queries with respect to their alternative extremes.
+      value : bool, default=False
+         Report respective queries with exact value.
+      size : bool, default=False
+         Report respective queries in bytes (including framing), against
+         size of ring ?
+      
+      Returns
+      -------
+      int
+         Returns answer to queries as value.
+      bool
+         Returns answer to queries as True or False.
+      NoneType
+         Returns None for invalid parameters.
+      """
+      
+      tail, count_in  = self._producer()[:2]
+      head, count_out = self._consumer()[:2]
+      
+      len_queue          = max(0, (
+         (tail - head)
+         if (size)
+         else
+         (count_in - count_out)
+      ))
+      capacity_queue     = (
+         self._size
+         if (size)
+         else
+         self._capacity
+      )
+      remaining_capacity = (
+         (self._size - (tail - head))
+         if (capacity_queue < 0)
+         else
+         (capacity_queue - len_queue)
+      )
+      
+      if (capacity):
+         result = capacity_queue
+      elif (empty):
+         if (value):
+            result = remaining_capacity
+         elif (relative):
+            result = (
+               True
+               if (remaining_capacity)
+               else
+               False
+            )
+         else:
+            result = (
+               True
+               if (not len_queue)
+               else
+               False
+            )
+      elif (full):
+         if (value):
+            result = len_queue
+         elif (relative):
+            result = (
+               True
+               if (len_queue)
+               else
+               False
+            )
+         else:
+            result = (
+               True
+               if (
+                     (remaining_capacity <= 0)
+                  or ((self._size - (tail - head)) <= self._SIZE_FRAME)
+               )
+               else
+               False
+            )
+      elif (value):
+         result = 0
+      else:
+         result = None
+      
+      return result
+   
+   def clear (self):
+      """Clear or empty queue buffer, consumer side.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      self._pull(
+         data_length = -1,
+         cleared     = True,
+      )
+      
+      return True
+   
+   def stats (self):
+      """Query queue buffer's telemetry, as a single snapshot.
+      
+      Derived from shared counters, hence covers both producer and consumer
+      processes. Sojourn and occupancy are not tracked.
+      
+      Returns
+      -------
+      dict
+         Returns telemetry as:
+         
+         *  length : current length (items, bytes for byte type).
+         *  capacity : capacity, -1 for un-limited.
+         *  capacity_bytes, length_bytes : size of ring and its used bytes.
+         *  items_in, items_out : items enqueued and dequeued.
+         *  items_rejected : items rejected at capacity.
+         *  items_cleared : items discarded by clear().
+         *  bytes_in, bytes_out, bytes_rejected, bytes_cleared : respective
+            sizes in bytes (excluding framing).
+         *  high_watermark : maximum length ever reached.
+         *  duration : time (s) since shared queue buffer creation.
+      """
+      
+      (
+         tail,
+         count_in,
+         items_rejected,
+         bytes_rejected,
+         high_watermark,
+      )         = self._producer()
+      (
+         head,
+         count_out,
+         items_cleared,
+         bytes_cleared,
+      )         = self._consumer()
+      
+      framing   = (
+         self._SIZE_FRAME
+         if (self._queue_type & flags.QUEUE_TYPE_NORMAL)
+         else
+         0
+      )
+      
+      bytes_in  = (tail - (framing * count_in))
+      bytes_out = (head - (framing * count_out) - bytes_cleared)
+      
+      return {
+         'length'         : max(0, (count_in - count_out)),
+         'capacity'       : self._capacity,
+         'capacity_bytes' : self._size,
+         'length_bytes'   : (tail - head),
+         'items_in'       : count_in,
+         'items_out'      : (count_out - items_cleared),
+         'items_rejected' : items_rejected,
+         'items_cleared'  : items_cleared,
+         'bytes_in'       : bytes_in,
+         'bytes_out'      : bytes_out,
+         'bytes_rejected' : bytes_rejected,
+         'bytes_cleared'  : bytes_cleared,
+         'high_watermark' : high_watermark,
+         'duration'       : (time.time() - struct.unpack_from(
+            self._FORMAT_CONFIG,
+            self._header,
+            self._OFFSET_CONFIG,
+         )[3]),
+      }
+   
+   def version (self):
+      """Query queue buffer's contents version.
+      
+      Monotonically increasing counter, advanced by every push, retrieval and
+      clear, so that unchanged contents can be detected without copying them.
+      
+      Returns
+      -------
+      int
+         Returns contents version.
+      """
+      
+      return (self._producer()[1] + self._consumer()[1])
+   
+   def contents (
+      self,
+      offset        =  0,
+      limit         = -1,
+      since_version = None,
+   ):
+      """Retrieve contents of queue buffer without deleting them.
+      
+      Clones a window of queue buffer's contents and returns it without
+      deleting.
+      
+      Parameters
+      ----------
+      offset : int, default=0
+         Number of data (items, bytes for byte type) to skip from first.
+      limit : int, default=-1
+         Maximum number of data (items, bytes for byte type) to clone,
+         negative for all.
+      since_version : int, NoneType, default=None
+         Version (see version()) of caller's previous snapshot, to skip the
+         copy if contents are unchanged since. None to always copy.
+      
+      Returns
+      -------
+      list, bytearray
+         Returns cloned window of contents of queue buffer.
+      NoneType
+         Returns None if contents are unchanged since since_version.
+      """
+      
+      if (
+             (since_version is not None)
+         and (since_version == self.version())
+      ):
+         return None
+      
+      return self._pull(
+         data_length = int(limit),
+         consume     = False,
+         offset      = max(0, int(offset)),
+      )
+   
+   def flow_in (
+      self,
+      data,
+      block   = False,
+      timeout = None,
+   ):
+      """Push data into queue buffer.
+      
+      Enqueues data, in order, into queue buffer until capacity (or ring) is
+      not exhausted.
+      In blocking mode, polls for space to be freed while at capacity (backing
+      off exponentially, reset upon progress), until entire data is pushed or
+      timeout.
+      
+      Parameters
+      ----------
+      data : tuple, list, bytes, bytearray, memoryview
+         Data (list-like) to be pushed into queue buffer, bytes-like items
+         for normal type. Iterables without length (e.g. generators) are
+         consumed into a list upfront.
+      block : bool, default=False
+         Wait for space while queue buffer is at capacity ?
+      timeout : int, float, NoneType, default=None
+         Maximum duration to wait for, in blocking mode. None to wait forever.
+      
+      Raises
+      ------
+      Exception
+         *  Item is not bytes-like (normal type).
+      
+      Returns
+      -------
+      int
+         Returns length of data pushed.
+      NoneType
+         Returns None if no data supplied.
+      """
+      
+      # One-pass iterables are listed once, as pushes slice and measure data.
+      if (not hasattr(data, '__len__')):
+         data = list(data)
+      
+      if (not data):
+         return None
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         data         = memoryview(
+            data
+            if (isinstance(data, (bytes, bytearray, memoryview)))
+            else
+            bytes(data)
+         ).cast('B')
+      
+      time_end        = (
+         None
+         if ((not block) or (timeout is None))
+         else
+         (time.monotonic() + max(0.0, float(timeout)))
+      )
+      
+      poll_interval   = self._poll_interval_min
+      
+      data_length     = self._push(data)
+      
+      while (
+             block
+         and (data_length < len(data))
+      ):
+         if (not self._poll(
+            poll_interval = poll_interval,
+            time_end      = time_end,
+         )):
+            break
+         
+         data_pushed    = self._push(data[data_length:])
+         
+         data_length   += data_pushed
+         poll_interval  = (
+            self._poll_interval_min
+            if (data_pushed)
+            else
+            min(self._poll_interval_max, (2 * poll_interval))
+         )
+      
+      if (data_length < len(data)):
+         self._rejected(data[data_length:])
+      
+      return data_length
+   
+   def flow_out (
+      self,
+      data_length = 1,
+      block       = False,
+      timeout     = None,
+   ):
+      """Retrieve data from queue buffer.
+      
+      Dequeues data, in order, from queue buffer until specified data length
+      or till last item in queue.
+      In blocking mode, polls for data to arrive while queue buffer is empty
+      (backing off exponentially), until data or timeout.
+      
+      Parameters
+      ----------
+      data_length : int, default=1
+         Length (or number) of data (items) to be retrieved from queue buffer.
+      block : bool, default=False
+         Wait for data while queue buffer is empty ?
+      timeout : int, float, NoneType, default=None
+         Maximum duration to wait for, in blocking mode. None to wait forever.
+      
+      Returns
+      -------
+      list, bytearray
+         Returns list-like sequence of data, in-order.
+      """
+      
+      data_length = int(data_length)
+      
+      if (data_length < 0):
+         data_length = -1
+      
+      if (not data_length):
+         return None
+      
+      if (block):
+         time_end = (
+            None
+            if (timeout is None)
+            else
+            (time.monotonic() + max(0.0, float(timeout)))
+         )
+         
+         poll_interval = self._poll_interval_min
+         
+         while (self.state(empty=True)):
+            if (not self._poll(
+               poll_interval = poll_interval,
+               time_end      = time_end,
+            )):
+               break
+            
+            poll_interval = min(self._poll_interval_max, (2 * poll_interval))
+      
+      return self._pull(data_length=data_length)
+   
+   def flow_in_bytes (
+      self,
+      buffer,
+   ):
+      """Push bytes into byte queue buffer, in bulk.
+      
+      Parameters
+      ----------
+      buffer : bytes, bytearray, memoryview
+         Bytes to be pushed into queue buffer.
+      
+      Returns
+      -------
+      int
+         Returns length of bytes pushed.
+      NoneType
+         Returns None if no bytes supplied or not a byte queue buffer.
+      """
+      
+      if (
+            (not buffer)
+         or (not (self._queue_type & flags.QUEUE_TYPE_BYTE))
+      ):
+         return None
+      
+      return self.flow_in(buffer)
+   
+   def flow_out_bytes (
+      self,
+      max_len   = -1,
+      delimiter = None,
+   ):
+      """Retrieve bytes from byte queue buffer, in bulk.
+      
+      If delimiter is specified, stops right after (including) delimiter.
+      
+      Parameters
+      ----------
+      max_len : int, default=-1
+         Maximum length of bytes to be retrieved, -1 for all.
+      delimiter : int, bytes, NoneType, default=None
+         Byte after which retrieval stops, if found.
+      
+      Returns
+      -------
+      bytearray
+         Returns bytes, in-order.
+      NoneType
+         Returns None if invalid parameters or not a byte queue buffer.
+      """
+      
+      max_len = int(max_len)
+      
+      if (
+            (not max_len)
+         or (not (self._queue_type & flags.QUEUE_TYPE_BYTE))
+      ):
+         return None
+      
+      return self._pull(
+         data_length = max_len,
+         delimiter   = delimiter,
+      )
+   
+   def flow_out_into (
+      self,
+      buffer,
+   ):
+      """Retrieve bytes from byte queue buffer into supplied buffer, in bulk.
+      
+      Copies straight from shared memory ring into writable buffer.
+      
+      Parameters
+      ----------
+      buffer : bytearray, memoryview
+         Writable buffer to retrieve bytes into.
+      
+      Returns
+      -------
+      int
+         Returns length of bytes retrieved.
+      NoneType
+         Returns None if not a byte queue buffer.
+      """
+      
+      if (not (self._queue_type & flags.QUEUE_TYPE_BYTE)):
+         return None
+      
+      buffer                = memoryview(buffer).cast('B')
+      
+      tail                  = self._producer()[0]
+      head, count_out, _, _ = self._consumer()
+      
+      data_length           = min(len(buffer), (tail - head))
+      
+      self._read(
+         position = head,
+         length   = data_length,
+         buffer   = buffer,
+      )
+      
+      self._consumer_set(
+         head      = (head + data_length),
+         count_out = (count_out + data_length),
+      )
+      
+      return data_length
+   
+   def notification_alert (
+      self,
+      identifier   = None,
+      callback     = None,
+      unregister   = False,
+      events       = flags.QUEUE_EVENT_ALL,
+      times        = -1, # unlimited
+      immediate    = False,
+      non_blocking = False,
+   ):
+      """Handles registration for event based notifications, unsupported.
+      
+      Events may be caused by another process, which can not call back into
+      this one, hence registration always fails, so that callers (layers
+      parking transfers) fall back to polling state on their next process().
+      Same signature as Queue's, for drop-in use as layer queue (stream).
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to register callback with, else auto-generate.
+      callback : callable, NoneType, default=None
+         Callback, used upon alert generation.
+      unregister : bool, default=False
+         Unregister alert bound to callback with specified identifier.
+      events : int, default=flags.QUEUE_EVENT_ALL
+         Events upon which notification alert is to be sent.
+      times : int, default=-1
+         Number of times to service alerts, upon expiry auto-unregister.
+      immediate : bool, default=False
+         Alert right away if queue buffer already is non-empty or writable.
+      non_blocking : bool, default=False
+         Run callback in a separate (daemon) thread ?
+      
+      Returns
+      -------
+      bool
+         Returns True on unregistration (nothing registered), else False.
+      """
+      
+      return bool(unregister)
+   
+   def close (self):
+      """Detach from shared memory segment.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      if (self._shared_memory is not None):
+         self._header.release()
+         self._ring.release()
+         self._shared_memory.close()
+      
+      return True
+   
+   def unlink (self):
+      """Destroy shared memory segment.
+      
+      To be called once, by the creating process, after all processes have
+      closed it.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      if (
+             self._owner
+         and (self._shared_memory is not None)
+      ):
+         self._owner = False
+         self._shared_memory.unlink()
+      
+      return True
+   
+   def _poll (
+      self,
+      poll_interval,
+      time_end = None,
+   ):
+      """Sleep for a polling interval, bounded by timeout.
+      
+      Parameters
+      ----------
+      poll_interval : float
+         Polling interval, in seconds.
+      time_end : float, NoneType, default=None
+         Monotonic time to stop polling at, None to poll forever.
+      
+      Returns
+      -------
+      bool
+         Returns False if timed out, else True.
+      """
+      
+      if (time_end is not None):
+         poll_interval = min(poll_interval, (time_end - time.monotonic()))
+         
+         if (poll_interval <= 0):
+            return False
+      
+      time.sleep(poll_interval)
+      
+      return True
+   
+   def _producer (self):
+      """Query producer owned counters.
+      
+      Returns
+      -------
+      tuple
+         Returns (tail, count_in, items_rejected, bytes_rejected,
+         high_watermark).
+      """
+      
+      return struct.unpack_from(
+         self._FORMAT_PRODUCER,
+         self._header,
+         self._OFFSET_PRODUCER,
+      )
+   
+   def _consumer (self):
+      """Query consumer owned counters.
+      
+      Returns
+      -------
+      tuple
+         Returns (head, count_out, items_cleared, bytes_cleared).
+      """
+      
+      return struct.unpack_from(
+         self._FORMAT_CONSUMER,
+         self._header,
+         self._OFFSET_CONSUMER,
+      )
+   
+   def _producer_set (
+      self,
+      **counters,
+   ):
+      """Publish producer owned counters, tail first.
+      
+      Data is readable by consumer once tail is published, hence count_in
+      (and with it state()) only reports it afterwards.
+      
+      Parameters
+      ----------
+      **counters : dict
+         Counters to be updated, by name.
+      """
+      
+      for index, name in enumerate(self._NAMES_PRODUCER):
+         if (name in counters):
+            struct.pack_into(
+               '<Q',
+               self._header,
+               (self._OFFSET_PRODUCER + (8 * index)),
+               counters[name],
+            )
+   
+   def _consumer_set (
+      self,
+      **counters,
+   ):
+      """Publish consumer owned counters, head last.
+      
+      Parameters
+      ----------
+      **counters : dict
+         Counters to be updated, by name.
+      """
+      
+      for index, name in reversed(list(enumerate(self._NAMES_CONSUMER))):
+         if (name in counters):
+            struct.pack_into(
+               '<Q',
+               self._header,
+               (self._OFFSET_CONSUMER + (8 * index)),
+               counters[name],
+            )
+   
+   def _read (
+      self,
+      position,
+      length,
+      buffer = None,
+   ):
+      """Copy bytes out of ring, wrapping around its end.
+      
+      Parameters
+      ----------
+      position : int
+         Position (head counter) to read from.
+      length : int
+         Number of bytes to read.
+      buffer : memoryview, NoneType, default=None
+         Writable buffer to read into, None to allocate one.
+      
+      Returns
+      -------
+      bytearray, memoryview
+         Returns buffer holding read bytes.
+      """
+      
+      if (buffer is None):
+         buffer = bytearray(length)
+      
+      offset = (position % self._size)
+      first  = min(length, (self._size - offset))
+      
+      buffer[:first] = self._ring[offset:(offset + first)]
+      
+      if (first < length):
+         buffer[first:length] = self._ring[:(length - first)]
+      
+      return buffer
+   
+   def _write (
+      self,
+      position,
+      data,
+   ):
+      """Copy bytes into ring, wrapping around its end.
+      
+      Parameters
+      ----------
+      position : int
+         Position (tail counter) to write at.
+      data : bytes, memoryview
+         Bytes to be written.
+      """
+      
+      length = len(data)
+      offset = (position % self._size)
+      first  = min(length, (self._size - offset))
+      
+      self._ring[offset:(offset + first)] = data[:first]
+      
+      if (first < length):
+         self._ring[:(length - first)] = data[first:]
+   
+   def _push (
+      self,
+      data,
+   ):
+      """Push data into ring until capacity (or ring) is not exhausted.
+      
+      Producer side only.
+      
+      Parameters
+      ----------
+      data : list, tuple, memoryview
+         Data (list-like) to be pushed, bytes for byte type.
+      
+      Raises
+      ------
+      Exception
+         *  Item is not bytes-like (normal type).
+      
+      Returns
+      -------
+      int
+         Returns length of data pushed.
+      """
+      
+      (
+         tail,
+         count_in,
+         _,
+         _,
+         high_watermark,
+      )            = self._producer()
+      head, count_out = self._consumer()[:2]
+      
+      free         = (self._size - (tail - head))
+      room         = (
+         free
+         if (self._capacity < 0)
+         else
+         (self._capacity - (count_in - count_out))
+      )
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         data_length = max(0, min(len(data), free, room))
+         
+         self._write(tail, data[:data_length])
+         
+         tail       += data_length
+      else:
+         data_length = 0
+         
+         for item in data:
+            try:
+               item = memoryview(item).cast('B')
+            except TypeError:
+               raise Exception((
+                       '{0}:\n'
+                     + 'item: {1}\n'
+                  ).format(
+                     descriptors.ERROR_DATA_INVALID,
+                     type(item).__name__,
+                  )
+               )
+            
+            frame = (self._SIZE_FRAME + len(item))
+            
+            if (
+                  (data_length >= room)
+               or (frame > free)
+            ):
+               break
+            
+            self._write(tail, struct.pack(self._FORMAT_FRAME, len(item)))
+            self._write((tail + self._SIZE_FRAME), item)
+            
+            tail        += frame
+            free        -= frame
+            data_length += 1
+      
+      if (data_length):
+         count_in += data_length
+         
+         self._producer_set(
+            tail           = tail,
+            count_in       = count_in,
+            high_watermark = max(high_watermark, (count_in - count_out)),
+         )
+      
+      return data_length
+   
+   def _pull (
+      self,
+      data_length = 1,
+      delimiter   = None,
+      consume     = True,
+      cleared     = False,
+      offset      = 0,
+   ):
+      """Retrieve data from ring.
+      
+      Consumer side only.
+      
+      Parameters
+      ----------
+      data_length : int, default=1
+         Length (or number) of data (items) to be retrieved, -1 for all.
+      delimiter : int, bytes, NoneType, default=None
+         Byte after which retrieval stops, if found (byte queue buffer only).
+      consume : bool, default=True
+         Delete retrieved data from ring ?
+      cleared : bool, default=False
+         Account retrieved data as cleared, instead of dequeued ?
+      offset : int, default=0
+         Number of data (items, bytes for byte type) to skip first (only
+         without consume).
+      
+      Returns
+      -------
+      list, bytearray
+         Returns list-like sequence of data, in-order.
+      """
+      
+      tail                        = self._producer()[0]
+      (
+         head,
+         count_out,
+         items_cleared,
+         bytes_cleared,
+      )                           = self._consumer()
+      position                    = head
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         position  += min(offset, (tail - position))
+         length     = (
+            (tail - position)
+            if (data_length < 0)
+            else
+            min(data_length, (tail - position))
+         )
+         data       = self._read(position, length)
+         
+         if (delimiter is not None):
+            index = data.find(delimiter)
+            
+            if (index >= 0):
+               del data[(index + 1):]
+         
+         position  += len(data)
+         data_bytes = len(data)
+      else:
+         data       = list()
+         data_bytes = 0
+         
+         while (
+                offset
+            and (position < tail)
+         ):
+            offset   -= 1
+            position += (self._SIZE_FRAME + struct.unpack(
+               self._FORMAT_FRAME,
+               self._read(position, self._SIZE_FRAME),
+            )[0])
+         
+         while (
+                (position < tail)
+            and (
+                  (data_length < 0)
+               or (len(data) < data_length)
+            )
+         ):
+            (length,) = struct.unpack(
+               self._FORMAT_FRAME,
+               self._read(position, self._SIZE_FRAME),
+            )
+            
+            data.append(self._read((position + self._SIZE_FRAME), length))
+            
+            position   += (self._SIZE_FRAME + length)
+            data_bytes += length
+      
+      if (
+             consume
+         and data
+      ):
+         if (cleared):
+            self._consumer_set(
+               head          = position,
+               count_out     = (count_out + len(data)),
+               items_cleared = (items_cleared + len(data)),
+               bytes_cleared = (bytes_cleared + data_bytes),
+            )
+         else:
+            self._consumer_set(
+               head          = position,
+               count_out     = (count_out + len(data)),
+            )
+      
+      return data
+   
+   def _rejected (
+      self,
+      data,
+   ):
+      """Account data rejected at capacity, producer side.
+      
+      Parameters
+      ----------
+      data : list, tuple, memoryview
+         Data (list-like) rejected.
+      """
+      
+      _, _, items_rejected, bytes_rejected, _ = self._producer()
+      
+      data_bytes = 0
+      
+      if (self._queue_type & flags.QUEUE_TYPE_BYTE):
+         data_bytes = len(data)
+      else:
+         for item in data:
+            try:
+               data_bytes += memoryview(item).nbytes
+            except TypeError:
+               pass
+      
+      self._producer_set(
+         items_rejected = (items_rejected + len(data)),
+         bytes_rejected = (bytes_rejected + data_bytes),
+      )
@@ -0,0 +1,217 @@
+from .flags import Flags as flags
+
+class StreamPark:
+   """Mixin parking layers' transfers upon full queues (streams).
+   
+   Shared by layers (protocols, drivers) pushing into queue (stream) objects
+   from their process(). Transfer found a full queue (stream) is parked with
+   a one-shot writable notification alert, registered under a single stable
+   identifier per layer, and resumed by next process() once space frees up,
+   instead of retrying (spinning) on every one. Data dropped by queue
+   (stream), under drop disciplines, is consumed instead.
+   
+   Attributes
+   ----------
+   _streams_parked : set
+      Queue (stream) objects transfers into are parked, until writable.
+   _stream_park_identifier : str
+      Identifier of writable notification alerts registered by layer.
+   
+   Methods
+   -------
+   __init__ ()
+      Init parking state.
+   _stream_parked ()
+      Query whether transfer into queue (stream) is parked.
+   _stream_flow_in ()
+      Pushes packet into queue (stream), parking transfer if full.
+   _stream_drops ()
+      Query whether queue (stream) drops data it can not admit.
+   _stream_park ()
+      Parks transfer upon full queue (stream), until it becomes writable.
+   _stream_unpark ()
+      Unparks transfer into queue (stream), withdrawing its alert.
+   _callback_stream_writable ()
+      Unparks transfer parked upon full queue (stream).
+   """
+   
+   def __init__ (self):
+      """Init parking state.
+      
+      To be called by layer's init, before queue (stream) objects are set.
+      """
+      
+      self._streams_parked         = set()
+      self._stream_park_identifier = 'stream_park.{0}'.format(id(self))
+   
+   def _stream_parked (
+      self,
+      stream,
+   ):
+      """Query whether transfer into queue (stream) is parked.
+      
+      Parameters
+      ----------
+      stream : object
+         Queue (stream) object.
+      
+      Returns
+      -------
+      bool
+         Returns True if parked, else False.
+      """
+      
+      return (stream in self._streams_parked)
+   
+   def _stream_flow_in (
+      self,
+      stream,
+      data,
+   ):
+      """Pushes packet into queue (stream), parking transfer if full.
+      
+      Parameters
+      ----------
+      stream : object
+         Queue (stream) object.
+      data : bytearray
+         Packet to push.
+      
+      Returns
+      -------
+      bool
+         Returns True if packet was consumed (pushed, or dropped by queue
+         (stream)), else False if transfer is parked.
+      """
+      
+      if (
+             (not stream.flow_in(data=[data]))
+         and (not self._stream_drops(stream))
+      ):
+         self._stream_park(stream)
+         
+         return False
+      
+      return True
+   
+   def _stream_drops (
+      self,
+      stream,
+   ):
+      """Query whether queue (stream) drops data it can not admit.
+      
+      Under drop disciplines, data not pushed was dropped by queue (stream),
+      hence transfer is consumed, instead of parked and retried.
+      
+      Parameters
+      ----------
+      stream : object
+         Queue (stream) object.
+      
+      Returns
+      -------
+      bool
+         Returns True if queue (stream) drops data, else False.
+      """
+      
+      return (not (
+           stream.queue_discipline(describe=False)
+         & flags.QUEUE_DISCIPLINE_NONE
+      ))
+   
+   def _stream_park (
+      self,
+      stream,
+   ):
+      """Parks transfer upon full queue (stream), until it becomes writable.
+      
+      Registers one-shot writable notification alert with queue (stream), to
+      unpark transfer as soon as space frees up, so that next process()
+      resumes it. Left unparked if queue (stream) does not support
+      notification alerts (shared queue buffer, freed by another process),
+      so that transfer is retried on next process().
+      
+      Parameters
+      ----------
+      stream : object
+         Queue (stream) object, found full.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      if (stream in self._streams_parked):
+         return None
+      
+      self._streams_parked.add(stream)
+      
+      if (not stream.notification_alert(
+         identifier   = self._stream_park_identifier,
+         callback     = self._callback_stream_writable,
+         events       = flags.QUEUE_EVENT_WRITABLE,
+         times        = 1,
+         immediate    = True,
+      )):
+         self._callback_stream_writable(queue=stream)
+      
+      return None
+   
+   def _stream_unpark (
+      self,
+      stream,
+   ):
+      """Unparks transfer into queue (stream), withdrawing its alert.
+      
+      Meant for queue (stream) objects being replaced.
+      
+      Parameters
+      ----------
+      stream : object, NoneType
+         Queue (stream) object.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      if (stream in self._streams_parked):
+         stream.notification_alert(
+            identifier = self._stream_park_identifier,
+            unregister = True,
+         )
+         
+         self._streams_parked.discard(stream)
+      
+      return None
+   
+   def _callback_stream_writable (
+      self,
+      queue = None,
+      event = None,
+   ):
+      """Unparks transfer parked upon full queue (stream).
+      
+      Only flags transfer as unparked, on thread which freed space, so that
+      transfer is resumed by next process(), within progress mechanism's
+      cycle (accounted for in its ticks, blocks and idleness), rather than
+      on an ad-hoc thread.
+      
+      Parameters
+      ----------
+      queue : object, NoneType, default=None
+         Queue (stream) object, which became writable.
+      event : int, NoneType, default=None
+         Event for which the notification was sent.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._streams_parked.discard(queue)
+      
+      return None
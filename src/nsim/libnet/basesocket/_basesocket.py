@@ -1,12 +1,6 @@
 from .flags import Flags as flags
 from .descriptors import Descriptors as descriptors
 
-import time
-from threading import (
-   Event,
-   Thread,
-)
-
 import nsim as app
 
 class _BaseSocket:
@@ -49,6 +43,16 @@ class _BaseSocket:
       Timeout value, to be used by various operations.
    _status : int
       Status flag for socket's current state.
+   layer_queue_kwargs : dict
+      Configuration passed to each layer's queue buffers: capacity in items
+      and in bytes (negative for un-limited), and optionally queue_engine
+      (spsc by default, ring for application facing queue buffers),
+      queue_discipline and its RED configuration. Drop disciplines apply to
+      normal (packet) queue buffers only, byte queue buffers use none. Seed
+      is offset per queue buffer, for independent (reproducible) RED.
+      queue_engine flags.QUEUE_ENGINE_SHARED backs physical facing queue
+      buffers (those linked by DEDC) by shared memory queue buffers, sized by
+      optional size, so that other end may run in another process.
    
    Methods
    -------
@@ -78,6 +82,11 @@ class _BaseSocket:
       Sets timeout for basesocket operations.
    """
    
+   layer_queue_kwargs = {
+      'capacity'       : -1,
+      'capacity_bytes' : -1,
+   }
+   
    # _BaseSocket internal (but also public facing) lib / functions
    
    def __init__ (
@@ -215,7 +224,13 @@ class _BaseSocket:
       """Binds layers and queues for basesocket.
       
       Initializes queue buffers for intermediate layers and binds both together
-      to the basesocket.
+      to the basesocket. Each queue buffer between layers has exactly one
+      producer and one consumer layer, hence uses lock-free spsc engine.
+      Application facing queue buffers are used by any number of application
+      threads (send, sendto, recv), hence use locked ring engine instead.
+      With shared engine, physical facing queue buffers are shared memory
+      queue buffers (capacity and size only), intermediate ones use spsc.
+      Byte queue buffers, carrying no frame boundaries, never drop data.
       This is responsible for setting up layers' names and queues' names as
       well.
       
@@ -227,6 +242,8 @@ class _BaseSocket:
       
       from nsim.libhardwareinterface import queue
       
+      self._unlink_layer_queues()
+      
       for layer_queue in self._layer_queues:
          layer_queue.clear()
       
@@ -239,16 +256,81 @@ class _BaseSocket:
       ]
       layers_queue_types.append(self._layers_queue_type[-1][1].__name__)
       
-      for layers_queue_type in layers_queue_types:
-         layers_queue_type = (
+      layer_queue_kwargs = {
+         'queue_engine' : queue.flags.QUEUE_ENGINE_SPSC,
+      }
+      layer_queue_kwargs.update(self.layer_queue_kwargs)
+      
+      layer_queue_shared = bool(
+         layer_queue_kwargs['queue_engine'] & queue.flags.QUEUE_ENGINE_SHARED
+      )
+      layer_queue_size   = layer_queue_kwargs.pop('size', 65536)
+      layer_queue_seed   = layer_queue_kwargs.pop('seed', None)
+      
+      if (layer_queue_shared):
+         layer_queue_kwargs['queue_engine'] = queue.flags.QUEUE_ENGINE_SPSC
+      
+      for layer_index, layers_queue_type in enumerate(layers_queue_types):
+         layers_queue_type   = (
             queue.flags.QUEUE_TYPE_BYTE
             if (layers_queue_type == 'bytearray')
             else
             queue.flags.QUEUE_TYPE_NORMAL
          )
+         layers_queue_kwargs = dict(layer_queue_kwargs)
+         layers_queue_seeds  = (
+            (None, None)
+            if (layer_queue_seed is None)
+            else
+            (
+               (int(layer_queue_seed) + (2 * layer_index)),
+               (int(layer_queue_seed) + (2 * layer_index) + 1),
+            )
+         )
+         
+         if (layers_queue_type & queue.flags.QUEUE_TYPE_BYTE):
+            layers_queue_kwargs['queue_discipline'] = (
+               queue.flags.QUEUE_DISCIPLINE_NONE
+            )
+         
+         if (
+                (not layer_index)
+            and (layers_queue_kwargs['queue_engine']
+                 & queue.flags.QUEUE_ENGINE_SPSC)
+         ):
+            layers_queue_kwargs['queue_engine'] = queue.flags.QUEUE_ENGINE_RING
+         
+         if (
+                layer_queue_shared
+            and layer_index
+            and (layer_index == (len(layers_queue_types) - 1))
+         ):
+            self._layer_queues.append([
+               queue.sharedqueue(                      # up_to_down up_out
+                  queue_type = layers_queue_type,
+                  capacity   = layers_queue_kwargs['capacity'],
+                  size       = layer_queue_size,
+               ),
+               queue.sharedqueue(                      # down_to_up up_in
+                  queue_type = layers_queue_type,
+                  capacity   = layers_queue_kwargs['capacity'],
+                  size       = layer_queue_size,
+               ),
+            ])
+            
+            continue
+         
          self._layer_queues.append([
-            queue.queue(queue_type=layers_queue_type), # up_to_down up_out
-            queue.queue(queue_type=layers_queue_type), # down_to_up up_in
+            queue.queue(                               # up_to_down up_out
+               queue_type = layers_queue_type,
+               seed       = layers_queue_seeds[0],
+               **layers_queue_kwargs,
+            ),
+            queue.queue(                               # down_to_up up_in
+               queue_type = layers_queue_type,
+               seed       = layers_queue_seeds[1],
+               **layers_queue_kwargs,
+            ),
          ])
       
       layer_names = [
@@ -368,6 +450,7 @@ class _BaseSocket:
             self._progress_mechanism.state(
                activate=True,
                errors_raise=True,
+               owner=self,
             )
          except:
             pass
@@ -416,6 +499,7 @@ class _BaseSocket:
             self._progress_mechanism.state(
                activate=True,
                errors_raise=True,
+               owner=self,
             )
          except:
             pass
@@ -486,6 +570,7 @@ class _BaseSocket:
             self._progress_mechanism.state(
                activate=True,
                errors_raise=True,
+               owner=self,
             )
          except:
             pass
@@ -563,10 +648,34 @@ class _BaseSocket:
          self._progress_mechanism.state(
             activate=False,
             errors_raise=True,
+            owner=self,
          )
       except:
          pass
       
+      self._unlink_layer_queues()
+      
+      return None
+   
+   def _unlink_layer_queues (self):
+      """Destroys shared memory segments of shared layer queue buffers.
+      
+      Processes still attached (e.g. DEDC end in another process) keep their
+      mapping until they close it.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      from nsim.libhardwareinterface import queue
+      
+      for layer_queues in self._layer_queues:
+         for layer_queue in layer_queues:
+            if (isinstance(layer_queue, queue.sharedqueue)):
+               layer_queue.unlink()
+      
       return None
    
    def _bind_source (self, address):
@@ -732,7 +841,8 @@ class _BaseSocket:
       
       Receives data from basesocket.
       To receive, it simply fetches data from topmost queue buffer.
-      It uses timeouts to loop until data or timeout.
+      It blocks on queue buffer until data or timeout, waking as soon as data
+      arrives.
       Currently, buffer size (bufsize) is ignored.
       
       Parameters
@@ -749,70 +859,20 @@ class _BaseSocket:
       if (not (self._status & flags.STATUS_OPEN)):
          return b''
       
-      _event_timeout_wait   = Event()
-      _event_timeout_active = Event()
-      _thread_timeout_timer = None
-      timeout_interval      = 0.1
-      
-      if (self._timeout):
-         _event_timeout_wait.set()
-         _event_timeout_active.set()
-         
-         def _timeout_timer (
-            timeout               = self._timeout,
-            timeout_interval      = timeout_interval,
-            timeout_step          = 0.1,
-            _event_timeout_wait   = _event_timeout_wait,
-            _event_timeout_active = _event_timeout_active,
-         ):
-            if (timeout < 0):
-               _event_timeout_active.clear()
-               return None
-            
-            while (
-                   (timeout > 0)
-               and (_event_timeout_active.wait(timeout=0.0))
-            ):
-               time.sleep(timeout_interval)
-               timeout -= timeout_step
-            
-            _event_timeout_wait.clear()
-            _event_timeout_active.clear()
-            
-            return None
-         
-         if (self._timeout > 0):
-            _thread_timeout_timer = Thread(
-               target = _timeout_timer,
-               daemon = True,
-            )
-            _thread_timeout_timer.start()
-      else:
-         _event_timeout_wait.clear()
-      
       # bufsize is ignored for now as queue is for message, not bytes
-      retry = True
-      data  = b''
-      
-      while (retry):
-         try:
-            data = self._layer_queues[0][1].flow_out(data_length=1)
-         except:
-            data = b''
-         
-         if (data or (not _event_timeout_wait.wait(timeout=0.0))):
-            retry = False
-         else:
-            time.sleep(timeout_interval)
-      
-      _event_timeout_active.clear()
-      _event_timeout_wait.clear()
-      
-      if (_thread_timeout_timer is not None):
-         try:
-            _thread_timeout_timer.join(timeout=(timeout_interval + 0.1))
-         except:
-            pass
+      try:
+         data = self._layer_queues[0][1].flow_out(
+            data_length = 1,
+            block       = bool(self._timeout),
+            timeout     = (
+               None
+               if (self._timeout < 0)
+               else
+               self._timeout
+            ),
+         )
+      except:
+         data = b''
       
       return data
    
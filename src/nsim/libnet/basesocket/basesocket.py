@@ -2,7 +2,7 @@ from .flags import Flags as flags
 from .descriptors import Descriptors as descriptors
 from ._basesocket import _BaseSocket
 
-# import nsim as app
+import nsim as app
 
 from nsim.libprogress import trigger
 
@@ -28,6 +28,11 @@ class BaseSocket (_BaseSocket):
       Class defining currently used progression system with custom api to it.
    _progress_mechanism : object
       Progress mechanism object attached to basesocket.
+   _progress_group : object, NoneType
+      Group whose shared progress mechanism is attached, None if own.
+   _progress_binds : list
+      Identifiers layers' process methods are bound to progress mechanism
+      with.
    _sock_family : int
       Socket address family.
    _sock_type : int
@@ -57,7 +62,7 @@ class BaseSocket (_BaseSocket):
    
    Methods
    -------
-   __init__ (sock_family, sock_type, sock_proto)
+   __init__ (sock_family, sock_type, sock_proto, progress_group)
       Init basesocket with specified configurations and progress mechanism.
    basesocket ()
       Configures layers and queues for basesocket.
@@ -68,7 +73,7 @@ class BaseSocket (_BaseSocket):
    disconnect ()
       Disconnects basesocket from destination.
    close ()
-      Closes basesocket.
+      Closes basesocket, unbinding layers from shared progress mechanism.
    send ()
       Sends data to basesocket.
    sendto ()
@@ -104,21 +109,41 @@ class BaseSocket (_BaseSocket):
          Descriptors class for progress mechanism.
       init_function : callable
          Callable init method to initialize progress mechanism.
+      init_function_shared : callable
+         Callable method to retrieve progress mechanism shared within group.
+      init_group : object, NoneType
+         Default group to share progress mechanism within, None for own.
       init_args : list
          Default configuration for progress mechanism as args.
       init_kwargs : dict
-         Default configuration for progress mechanism as kwargs.
+         Default configuration for progress mechanism as kwargs. A pool
+         from executor_workers is per progress mechanism (per basesocket,
+         unless grouped), supply executor to share one across all.
+      bind_iterations : int
+         Iterations of each layer's process per trigger, -1 for unlimited. If
+         not 1, layers are processed in blocking mode until idle, draining
+         their queues within a single trigger. Unlimited if init_kwargs
+         enable interval_adaptive, so that blocks measured for tuning span
+         layers' actual work, rather than a single non-blocking pass.
       
       Methods
       -------
+      library_set ()
+         Switches progress mechanism library used for new basesockets.
       pre_init ()
          Performs pre-init configurations on basesocket object.
       post_init ()
          Performs post-init configurations on basesocket object.
       bind ()
          Custom api to bind any function to basesocket's progress mechanism.
+      unbind ()
+         Custom api to unbind layers from basesocket's progress mechanism.
       notification_alert ()
          Custom api to register for progress mechanism's notifications.
+      schedule ()
+         Custom api to schedule a callback on progress mechanism's timers.
+      cancel ()
+         Custom api to cancel a callback scheduled on progress mechanism.
       """
       
       library_name  = 'trigger'
@@ -126,7 +151,9 @@ class BaseSocket (_BaseSocket):
       flags         = trigger.flags
       descriptors   = trigger.descriptors
       
-      init_function = trigger.trigger
+      init_function        = trigger.trigger
+      init_function_shared = trigger.trigger.shared
+      init_group           = None
       
       init_args     = []
       init_kwargs   = {
@@ -154,10 +181,59 @@ class BaseSocket (_BaseSocket):
             trigger.flags.INTERVAL_EXCEED_ACTION_NOTIFY
          ),
          
+         'executor'                        : None,
+         'executor_workers'                : 0,
+         
+         'notify_workers'                  : 1,
+         
          'debug_log'                      : False,
          'debug_trace'                    : True,
       }
       
+      bind_iterations = 1
+      
+      def library_set (
+         library,
+         library_name = None,
+      ):
+         """Switches progress mechanism library used for new basesockets.
+         
+         Library is expected to provide same apis as trigger progress
+         mechanism (e.g. asynctrigger, for asyncio based progression), with
+         its class exported as library_name. Configurations (init_args and
+         init_kwargs) are left as is, since flags are shared among them.
+         
+         Parameters
+         ----------
+         library : object
+            Library object (or module) for progress mechanism.
+         library_name : str, NoneType, default=None
+            Name of library, also its class' name, None to pick from library.
+         
+         Returns
+         -------
+         NoneType
+            Returns None.
+         """
+         
+         if (library_name is None):
+            library_name = library.__name__.rsplit('.', 1)[-1]
+         
+         BaseSocket.ProgressionSystem.library_name         = library_name
+         BaseSocket.ProgressionSystem.library              = library
+         BaseSocket.ProgressionSystem.flags                = library.flags
+         BaseSocket.ProgressionSystem.descriptors          = library.descriptors
+         
+         BaseSocket.ProgressionSystem.init_function        = getattr(
+            library,
+            library_name,
+         )
+         BaseSocket.ProgressionSystem.init_function_shared = (
+            BaseSocket.ProgressionSystem.init_function.shared
+         )
+         
+         return None
+      
       def pre_init (basesocket):
          """Performs pre-init configurations on basesocket object.
          
@@ -189,9 +265,9 @@ class BaseSocket (_BaseSocket):
          basesocket object.
          Currently, binds all layers' process methods, attached to basesocket,
          to progress mechanism to automatically and centrally synchronize
-         their progression.
+         their progression, recording identifiers bound with (see unbind).
          Also, sets up progress mechanism's operation mode, but keeps it
-         disabled for later use.
+         disabled for later use, unless shared (left as is for other sharers).
          
          Parameters
          ----------
@@ -204,21 +280,49 @@ class BaseSocket (_BaseSocket):
             Returns None.
          """
          
+         iterations = BaseSocket.ProgressionSystem.bind_iterations
+         
+         if (BaseSocket.ProgressionSystem.init_kwargs.get(
+            'interval_adaptive',
+            False,
+         )):
+            iterations = -1
+         
          # Appending in reverse for better debug experience with debugger.
          for index in range((len(basesocket._layers) - 1), -1, -1):
+            identifier = app.libcommon.identifier.generate(
+               owner=(
+                  'libnet.basesocket[{0}].post_init.layer[{1}]'.format(
+                     basesocket,
+                     index,
+                  )
+               ),
+            )
+            
+            basesocket._progress_binds.append(identifier)
             basesocket._progress_mechanism.trigger_bind(
                trigger_bound_function = basesocket._layers[index].process,
+               identifier             = identifier,
+               kwargs                 = (
+                  {}
+                  if (iterations == 1)
+                  else
+                  {'non_blocking': False}
+               ),
                times_retain           = -1,
                times_recurse          = -1,
+               iterations             = iterations,
+               until_idle             = (iterations != 1),
                non_blocking           = True,
                thread_daemon          = True,
             )
          
-         basesocket._progress_mechanism.mode(
-            mode=BaseSocket.ProgressionSystem.init_kwargs['mode'],
-            activate=False,
-            non_blocking=True,
-         )
+         if (basesocket._progress_group is None):
+            basesocket._progress_mechanism.mode(
+               mode=BaseSocket.ProgressionSystem.init_kwargs['mode'],
+               activate=False,
+               non_blocking=True,
+            )
          
          return None
       
@@ -258,6 +362,33 @@ class BaseSocket (_BaseSocket):
             **kwargs,
          ))
       
+      def unbind (basesocket):
+         """Custom api to unbind layers from basesocket's progress mechanism.
+         
+         Unbinds layers' process methods bound by post_init, as per apis of
+         progress mechanism, so that a shared progress mechanism stops
+         running them once basesocket is closed.
+         
+         Parameters
+         ----------
+         basesocket : BaseSocket
+            BaseSocket object whose layers are to be unbound.
+         
+         Returns
+         -------
+         NoneType
+            Returns None.
+         """
+         
+         while (basesocket._progress_binds):
+            identifier = basesocket._progress_binds.pop()
+            
+            basesocket._progress_mechanism.trigger_unbind(identifier)
+            
+            app.libcommon.identifier.delete(identifier)
+         
+         return None
+      
       def notification_alert (
          basesocket,
          
@@ -297,10 +428,11 @@ class BaseSocket (_BaseSocket):
          """
          
          if (events is None):
-            events = (
-                 trigger.flags.INTERVAL_EVENT_TRIGGER
-               | trigger.flags.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
-               | trigger.flags.INTERVAL_EVENT_TRIGGER_FORCE
+            progress_flags = BaseSocket.ProgressionSystem.flags
+            events         = (
+                 progress_flags.INTERVAL_EVENT_TRIGGER
+               | progress_flags.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
+               | progress_flags.INTERVAL_EVENT_TRIGGER_FORCE
             )
          
          return basesocket._progress_mechanism.notification_alert(
@@ -309,10 +441,76 @@ class BaseSocket (_BaseSocket):
             events   = events,
             **kwargs,
          )
+      
+      def schedule (
+         basesocket,
+         
+         delay,
+         callback,
+          *args,
+         **kwargs,
+      ):
+         """Custom api to schedule a callback on progress mechanism's timers.
+         
+         Schedules callback to be run within basesocket's progress mechanism's
+         first tick after delay (in its system time), as per its apis. This
+         eliminates user's need to check for apis pertaining to the progress
+         mechanism specifically.
+         
+         Parameters
+         ----------
+         basesocket : BaseSocket
+            BaseSocket object whose progress mechanism is to be used.
+         delay : int, float
+            Delay (in progress mechanism's system time) until callback is due.
+         callback : callable
+            Callback, to be run once due.
+         args : list
+            Arguments to be supplied to callback.
+         kwargs : dict
+            Keyed-arguments to be supplied to callback.
+         
+         Returns
+         -------
+         int
+            Returns handle of scheduled callback.
+         bool
+            Returns False if invalid parameters.
+         """
+         
+         return basesocket._progress_mechanism.schedule(
+            delay    = delay,
+            callback = callback,
+            args     = args,
+            kwargs   = kwargs,
+         )
+      
+      def cancel (
+         basesocket,
+         
+         handle,
+      ):
+         """Custom api to cancel a callback scheduled on progress mechanism.
+         
+         Parameters
+         ----------
+         basesocket : BaseSocket
+            BaseSocket object whose progress mechanism was used to schedule.
+         handle : int
+            Handle of scheduled callback.
+         
+         Returns
+         -------
+         bool
+            Returns False if callback is not pending (run or cancelled).
+         """
+         
+         return basesocket._progress_mechanism.cancel(handle)
    
    def __init__ (
       self,
-      *args,
+       *args,
+      progress_group = None,
       **kwargs,
    ):
       """Init basesocket with specified configurations and progress mechanism.
@@ -328,20 +526,74 @@ class BaseSocket (_BaseSocket):
          Socket type.
       sock_proto : int, default=flags.SOCK_PROTO_NONE
          Socket protocol number.
+      progress_group : object, NoneType, default=None
+         Group (hashable) to share progress mechanism within, else
+         ProgressionSystem.init_group (None for basesocket's own).
       """
       
       self._progress_mechanism = None
+      self._progress_binds     = list()
+      self._progress_group     = (
+         progress_group
+         if (progress_group is not None)
+         else
+         BaseSocket.ProgressionSystem.init_group
+      )
       
       super().__init__(*args, **kwargs)
       
       BaseSocket.ProgressionSystem.pre_init(self)
-      self._progress_mechanism = BaseSocket.ProgressionSystem.init_function(
-          *BaseSocket.ProgressionSystem.init_args,
-         **BaseSocket.ProgressionSystem.init_kwargs,
-      )
+      
+      if (self._progress_group is None):
+         self._progress_mechanism = (
+            BaseSocket.ProgressionSystem.init_function(
+                *BaseSocket.ProgressionSystem.init_args,
+               **BaseSocket.ProgressionSystem.init_kwargs,
+            )
+         )
+      else:
+         self._progress_mechanism = (
+            BaseSocket.ProgressionSystem.init_function_shared(
+               self._progress_group,
+                *BaseSocket.ProgressionSystem.init_args,
+               **BaseSocket.ProgressionSystem.init_kwargs,
+            )
+         )
+      
       BaseSocket.ProgressionSystem.post_init(
          self,
       )
       
       if (self not in BaseSocket.basesocket_objects):
          BaseSocket.basesocket_objects.append(self)
+   
+   def close (self, flag=flags.SHUT_RDWR):
+      """Closes basesocket, unbinding layers from shared progress mechanism.
+      
+      Wraps base class's close method. Progress mechanism shared within a
+      group is left active for other sharers, hence layers' process methods
+      are additionally unbound from it.
+      
+      Parameters
+      ----------
+      flag : int, default=flags.SHUT_RDWR
+         Flags to mark close methods.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      opened = bool(self._status & flags.STATUS_OPEN)
+      
+      super().close(flag=flag)
+      
+      if (
+             opened
+         and (not (self._status & flags.STATUS_OPEN))
+         and (self._progress_group is not None)
+      ):
+         BaseSocket.ProgressionSystem.unbind(self)
+      
+      return None
@@ -6,9 +6,15 @@ from threading import (
    Thread,
 )
 
+import warnings
+
 import nsim as app
 
-class IPv4:
+from nsim.libhardwareinterface.queue.streampark import (
+   StreamPark as _StreamPark,
+)
+
+class IPv4 (_StreamPark):
    """Simplified version of IPv4.
    
    Stub version of IPv4, used to demonstrate nsim's basic functionality.
@@ -20,8 +26,6 @@ class IPv4:
       Source ip address, to be used.
    _ip_destination : int
       Destination's ip address.
-   _retries : int
-      Number of retries to perform before giving up, during data transfer.
    _stream_up_in : object
       Queue (stream) object, to upper layer, for downlink.
    _stream_up_out : object
@@ -38,6 +42,8 @@ class IPv4:
       Concurrency lock for uplink transfer processing.
    _lock_process_data_down_up : Lock
       Concurrency lock for downlink transfer processing.
+   _streams_parked : set
+      Queue (stream) objects transfers into are parked (see StreamPark).
    
    Methods
    -------
@@ -53,6 +59,10 @@ class IPv4:
       Processes uplink transfer.
    _process_data_down_up ()
       Processes downlink transfer.
+   _stream_flow_in ()
+      Pushes packet into queue (stream), parking transfer if full.
+   _stream_park ()
+      Parks transfer upon full queue (stream), until it becomes writable.
    """
    
    # Needs heavy re-work including variable name changes, re-framing structure,
@@ -71,7 +81,7 @@ class IPv4:
       stream_down_in  = None,
       stream_down_out = None,
       
-      retries         =  10,
+      retries         = None,
    ):
       """Init an instance of protocol with specified configurations.
       
@@ -89,14 +99,20 @@ class IPv4:
          Queue (stream) object, to lower layer, for uplink.
       stream_down_out : object, NoneType, default=None
          Queue (stream) object, from lower layer, for downlink.
-      retries : int, default=10
-         Number of retries to perform before giving up, during data transfer.
+      retries : int, NoneType, default=None
+         Deprecated and ignored, as transfers park upon full queues
+         (streams) instead of retrying.
       """
       
       self._ip_source                 = 0
       self._ip_destination            = 0
       
-      self._retries                   = abs(int(retries))
+      if (retries is not None):
+         warnings.warn(
+            'retries is deprecated and ignored',
+            DeprecationWarning,
+            stacklevel = 2,
+         )
       
       self._stream_up_in              = None
       self._stream_up_out             = None
@@ -109,6 +125,8 @@ class IPv4:
       self._lock_process_data_up_down = Lock()
       self._lock_process_data_down_up = Lock()
       
+      super().__init__()
+      
       self.stream(
          stream_up_in    = stream_up_in,
          stream_up_out   = stream_up_out,
@@ -150,16 +168,20 @@ class IPv4:
       """
       
       if (stream_up_in is not None):
-         self._stream_up_in    = stream_up_in
+         self._stream_unpark(self._stream_up_in)
+         
+         self._stream_up_in          = stream_up_in
       
       if (stream_up_out is not None):
-         self._stream_up_out   = stream_up_out
+         self._stream_up_out         = stream_up_out
       
       if (stream_down_in is not None):
-         self._stream_down_in  = stream_down_in
+         self._stream_unpark(self._stream_down_in)
+         
+         self._stream_down_in        = stream_down_in
       
       if (stream_down_out is not None):
-         self._stream_down_out = stream_down_out
+         self._stream_down_out       = stream_down_out
       
       return None
    
@@ -215,39 +237,42 @@ class IPv4:
       """Processes link transfers, threading capable.
       
       Enqueues single uplink and downlink transfers if not already queued.
+      In blocking mode, runs them right away on caller's thread instead, and
+      reports whether either made progress, so that callers (like trigger's
+      until_idle binds) can repeat them until idle.
       
       Parameters
       ----------
       non_blocking : bool, default=True
          Run transfers in non-blocking mode ?
       thread_timeout : int, float, NoneType, default=None
-         Thread timeout if running in blocking mode.
+         Unused, as blocking mode runs transfers on caller's thread.
       
       Returns
       -------
       NoneType
-         Returns None.
+         Returns None in non-blocking mode.
+      bool
+         Returns True if either transfer made progress, in blocking mode.
       """
       
-      active_threads = list()
+      if (not non_blocking):
+         progress_up_down = self._process_data_up_down()
+         progress_down_up = self._process_data_down_up()
+         
+         return (progress_up_down or progress_down_up)
       
       if (not self._lock_process_data_up_down.locked()):
-         active_threads.append(Thread(
+         Thread(
             target = self._process_data_up_down,
             daemon = True,
-         ))
-         active_threads[-1].start()
+         ).start()
       
       if (not self._lock_process_data_down_up.locked()):
-         active_threads.append(Thread(
+         Thread(
             target = self._process_data_down_up,
             daemon = True,
-         ))
-         active_threads[-1].start()
-      
-      if (not non_blocking):
-         for active_thread in active_threads:
-            active_thread.join(timeout=thread_timeout)
+         ).start()
       
       return None
    
@@ -259,68 +284,66 @@ class IPv4:
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
       if (
             (not self._stream_up_out)
          or (not self._stream_down_in)
       ):
-         return None
+         return False
       
       self._lock_process_data_up_down.acquire()
       
       try:
-         self._process_data_stream_down_in()
+         progress = self._process_data_stream_down_in()
          
          if (self._data_up_down):
-            return None
+            return progress
          
-         data = self._stream_up_out.flow_out(data_length=1)
+         data     = self._stream_up_out.flow_out(data_length=1)
          
          if (not data):
-            return None
+            return progress
          
-         data = self._encapsulate(data[0])
+         data     = self._encapsulate(data[0])
          
          self._data_up_down.extend(data)
       finally:
          self._lock_process_data_up_down.release()
       
-      return None
+      return True
    
    def _process_data_stream_down_in (self):
       """Processes uplink transfer from internal buffer.
       
       Processes uplink transfer from internal buffer to uplink queue (stream)
-      for lower layer. If queue (stream) is already full, retries set amount
-      of times before giving up.
+      for lower layer. If queue (stream) is already full, parks transfer until
+      it becomes writable, skipping it meanwhile.
+      Data dropped by queue (stream), under drop disciplines, is not retried.
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
-      retries         = self._retries
-      
-      while (
-              retries
-         and (self._data_up_down)
+      if (
+            (not self._data_up_down)
+         or (self._stream_parked(self._stream_down_in))
       ):
-         data_length         = self._stream_down_in.flow_in(
-            data=[self._data_up_down.copy()],
-         )
-         
-         if (data_length):
-            self._data_up_down.clear()
-            
-            retries          = self._retries
-         else:
-            retries         -= 1
+         return False
       
-      return None
+      if (not self._stream_flow_in(
+         self._stream_down_in,
+         self._data_up_down.copy(),
+      )):
+         return False
+      
+      self._data_up_down.clear()
+      
+      return True
    
    def _process_data_down_up (self):
       """Processes downlink transfer.
@@ -330,68 +353,66 @@ class IPv4:
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
       if (
             (not self._stream_up_in)
          or (not self._stream_down_out)
       ):
-         return None
+         return False
       
       self._lock_process_data_down_up.acquire()
       
       try:
-         self._process_data_stream_up_in()
+         progress = self._process_data_stream_up_in()
          
          if (self._data_down_up):
-            return None
+            return progress
          
-         data = self._stream_down_out.flow_out(data_length=1)
+         data     = self._stream_down_out.flow_out(data_length=1)
          
          if (not data):
-            return None
+            return progress
          
-         data = self._decapsulate(data[0])
+         data     = self._decapsulate(data[0])
          
          self._data_down_up.extend(data)
       finally:
          self._lock_process_data_down_up.release()
       
-      return None
+      return True
    
    def _process_data_stream_up_in (self):
       """Processes downlink transfer from internal buffer.
       
       Processes downlink transfer from internal buffer to downlink queue
-      (stream) for upper layer. If queue (stream) is already full, retries set
-      amount of times before giving up.
+      (stream) for upper layer. If queue (stream) is already full, parks
+      transfer until it becomes writable, skipping it meanwhile.
+      Data dropped by queue (stream), under drop disciplines, is not retried.
       
       Returns
       -------
-      NoneType
-         Returns None.
+      bool
+         Returns True if transfer made progress, else False.
       """
       
-      retries         = self._retries
-      
-      while (
-              retries
-         and (self._data_down_up)
+      if (
+            (not self._data_down_up)
+         or (self._stream_parked(self._stream_up_in))
       ):
-         data_length         = self._stream_up_in.flow_in(
-            data=[self._data_down_up.copy()],
-         )
-         
-         if (data_length):
-            self._data_down_up.clear()
-            
-            retries          = self._retries
-         else:
-            retries         -= 1
+         return False
       
-      return None
+      if (not self._stream_flow_in(
+         self._stream_up_in,
+         self._data_down_up.copy(),
+      )):
+         return False
+      
+      self._data_down_up.clear()
+      
+      return True
    
    def _encapsulate (
       self,
@@ -3,3 +3,15 @@
 This package contains progress mechanisms which can be used to synchronize
 program operations and centrally control or monitor them as needed.
 """
+
+# Imported eagerly, so that asyncio binds to system's socket module before
+# libsysmodules overrides it.
+from . import (
+   trigger,
+   asynctrigger,
+)
+
+__all__ = [
+   'trigger',
+   'asynctrigger',
+]
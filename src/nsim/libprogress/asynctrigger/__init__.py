@@ -0,0 +1,9 @@
+from .asynctrigger import AsyncTrigger as asynctrigger
+from .flags import Flags as flags
+from .descriptors import Descriptors as descriptors
+
+__all__ = [
+   'asynctrigger',
+   'flags',
+   'descriptors',
+]
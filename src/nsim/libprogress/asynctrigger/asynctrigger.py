@@ -0,0 +1,2640 @@
+from .flags import Flags as flags
+from .descriptors import Descriptors as descriptors
+from ..trigger.timingwheel import TimingWheel as timingwheel
+
+import asyncio
+import inspect
+from threading import (
+   Lock,
+   Event,
+   Thread,
+)
+from concurrent.futures import (
+   Future,
+   ThreadPoolExecutor,
+)
+from functools import partial
+
+import nsim as app
+
+class AsyncTrigger:
+   """Asyncio trigger progress mechanism.
+   
+   Provides simultaneous, controlled activation of functions at specified
+   time or interval in order to streamline program's progression, like
+   trigger progress mechanism, but runs entirely on a single asyncio event
+   loop instead of a thread per function.
+   Bound functions may be coroutine functions, run as tasks upon each
+   trigger, and coroutines wait for next trigger with ``await wait()``.
+   System's state is only ever touched on its event loop, hence needs no
+   locking; interactions from other threads are handed over to the loop.
+   
+   Attributes
+   ----------
+   trigger_shared : dict
+      Mapping of group names to trigger systems shared within those groups.
+   _lock_trigger_shared : Lock
+      Concurrency lock for trigger_shared.
+   _interval_min : float
+      Minimum duration before next trigger can run.
+   _interval_max : float
+      Duration after which max exceed event is fired.
+   _interval_critical : float
+      Duration after which critical exceed event is fired.
+   _clock_interval : float
+      Duration after which clock is updated.
+   _clock_step : float
+      Amount by which clock is updated.
+   _interval_exceed_action_min : int
+      Exceed action for min interval exceed.
+   _interval_exceed_action_max : int
+      Exceed action for max interval exceed.
+   _interval_exceed_action_critical : int
+      Exceed action for critical interval exceed.
+   _executor : Executor, NoneType
+      Executor running bound (non coroutine) functions, None for loop.
+   _executor_workers : int
+      Number of workers of executor, if inited by system.
+   _executor_owned : bool
+      Executor inited by system (not supplied), to be shut down by it ?
+   _loop : AbstractEventLoop
+      Event loop system runs on.
+   _thread_loop : Thread, NoneType
+      Thread running event loop, if owned by system.
+   _list_notification : dict
+      List of callbacks registered for notification.
+   _list_blocking : dict
+      List of identifiers holding block for next trigger event.
+   _list_waiting : list
+      List of identifiers waiting for next trigger event.
+   _list_transit : list
+      List of identifiers past trigger, yet to block or wait, in virtual mode.
+   _list_bound : dict
+      List of functions bound for execution, upon each trigger.
+   _list_owner : list
+      List of owners holding system active, for shared systems.
+   _mode : int
+      Current execution mode.
+   _mode_next : int, NoneType
+      Next execution mode, to be activated on switch.
+   _active : bool
+      System's state.
+   _trigger_pending : int
+      Number of manually enqueued triggers.
+   _trigger_force : bool
+      Force next trigger, overriding active blocks ?
+   _trigger_force_pre_min : bool
+      Force next trigger, before minimum duration ?
+   _trigger_flush : bool
+      Hold (flush) triggers ?
+   _future_trigger : Future
+      Future resolved upon next trigger, awaited by waits.
+   _event_wake : Event, NoneType
+      Asyncio event waking clock upon change of trigger conditions.
+   _task_clock : Task, NoneType
+      Task of active clock.
+   _clock_time : float
+      Current system time (elapsed) since last trigger.
+   _clock_epoch : float
+      System time accumulated until last clock reset.
+   _timer_wheel : TimingWheel
+      Timing wheel of scheduled timers, keyed on system time.
+   _clock_active : bool
+      Clock's state.
+   _clock_events : int
+      Exceed events fired since last trigger.
+   _error_error : bool
+      Active errors.
+   _error_raisable : bool
+      Active raisable errors.
+   _error_time : float
+      Instantaneous time at last error.
+   _error_description : str
+      Description of active errors.
+   
+   Methods
+   -------
+   __init__ (mode, **intervals, **clock_resolution, **exceed_actions, loop)
+      Init trigger system with specified configurations.
+   shared ()
+      Retrieve trigger system shared within group, init if not existing.
+   loop ()
+      Retrieve event loop system runs on.
+   state ()
+      Interact with system's state.
+   mode ()
+      Interact with system's operation mode.
+   notification_alert ()
+      Handles registration for event based notfications.
+   trigger_bind ()
+      Binds functions (or coroutine functions) for automated execution.
+   trigger_unbind ()
+      Unbinds function bound to system with specified identifier.
+   wait ()
+      Wait for next trigger event to occur (coroutine).
+   block ()
+      Add a block preventing next trigger event, until released.
+   release ()
+      Release the block for next trigger event.
+   schedule ()
+      Schedule a callback, to be run within first tick after delay.
+   cancel ()
+      Cancel a scheduled callback.
+   notify ()
+      Send a manual notification alert to all registered receivers.
+   trigger_force ()
+      Force activate next trigger, overriding active blocks.
+   trigger_flush ()
+      Flush queued triggers.
+   trigger ()
+      Manually enqueue a trigger.
+   """
+   
+   trigger_shared       = dict() # {
+                                 #    group: asynctrigger,
+                                 # }
+   _lock_trigger_shared = Lock()
+   
+   def __init__ (
+      self,
+      
+      mode                            = flags.MODE_NONE,
+      
+      interval_trigger_activation     =  0.1,
+      interval_trigger                =  0.2,
+      interval_min                    =  1,
+      interval_max                    =  4,
+      interval_critical               = 10,
+      interval_trigger_auto_add       = 20,
+      
+      retries_trigger_auto_add        =  3,
+      
+      clock_interval                  =  0.2,
+      clock_step                      =  0.2,
+      
+      interval_exceed_action_min      = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+      interval_exceed_action_max      = flags.INTERVAL_EXCEED_ACTION_NOTIFY,
+      interval_exceed_action_critical = (
+           flags.INTERVAL_EXCEED_ACTION_NOTIFY
+         | flags.INTERVAL_EXCEED_ACTION_ERROR_RAISE
+         | flags.INTERVAL_EXCEED_ACTION_HALT
+      ),
+      
+      executor                        = None,
+      executor_workers                =  0,
+      
+      notify_workers                  =  1,
+      
+      loop                            = None,
+      
+      timer_slots                     = 64,
+      timer_levels                    =  4,
+      
+      debug_log                       = False,
+      debug_trace                     = True,
+   ):
+      """Init trigger system with specified configurations.
+      
+      Takes same configuration as trigger progress mechanism, so that either
+      can be used alike. Trigger's pre-active and active durations, and auto
+      trigger queuing, have no counterpart here (waits are resolved at once
+      and clock never loses its trigger), hence are accepted but unused.
+      
+      Parameters
+      ----------
+      mode : int, default=flags.MODE_NONE
+         Mode to queue for next activation.
+      interval_trigger_activation : int, float, default=0.1
+         Unused, accepted for compatibility.
+      interval_trigger : int, float, default=0.2
+         Unused, accepted for compatibility.
+      interval_min : int, float, default=1.0
+         Minimum duration before next trigger can run.
+      interval_max : int, float, default=4.0
+         Duration after which max exceed event is fired.
+      interval_critical : int, float, default=10
+         Duration after which critical exceed event is fired.
+      interval_trigger_auto_add : int, float, default=20
+         Unused, accepted for compatibility.
+      retries_trigger_auto_add : int, default=3
+         Unused, accepted for compatibility.
+      clock_interval : int, float, default=0.2
+         Duration after which clock is updated.
+      clock_step : int, float, default=0.2
+         Amount by which clock is updated.
+      interval_exceed_action_min : int, default=IGNORE
+         Exceed action for min interval exceed.
+      interval_exceed_action_max : int, default=NOTIFY
+         Exceed action for max interval exceed.
+      interval_exceed_action_critical : int, default=(IGNORE|NOTIFY|HALT)
+         Exceed action for critical interval exceed.
+      executor : Executor, NoneType, default=None
+         Executor to run bound (non coroutine) functions on, else run on
+         event loop itself.
+      executor_workers : int, default=0
+         Number of workers for ThreadPoolExecutor to init, if no executor is
+         supplied. Zero to run bound functions on event loop itself. Pool is
+         shut down upon each deactivation (replaced by a new one, whose
+         threads start upon use), supplied executor never is.
+      notify_workers : int, default=1
+         Unused, accepted for compatibility (callbacks run on event loop).
+      loop : AbstractEventLoop, NoneType, default=None
+         Event loop to run on, else init one on a dedicated thread.
+      timer_slots : int, default=64
+         Slots of each level of timing wheel backing schedule, a power of
+         two. Wheel's resolution is clock_step.
+      timer_levels : int, default=4
+         Levels of timing wheel, spanning timer_slots ** timer_levels steps.
+      
+      Raises
+      ------
+      Exception
+         *  Non positive intervals.
+         *  Non increasing intervals.
+         *  Negative executor workers.
+         *  Closed event loop.
+         *  Timer slots not a power of two, or non positive timer levels.
+      """
+      
+      self._interval_min                    = abs(float(interval_min))
+      self._interval_max                    = abs(float(interval_max))
+      self._interval_critical               = abs(float(interval_critical))
+      
+      self._clock_interval                  = abs(float(clock_interval))
+      self._clock_step                      = abs(float(clock_step))
+      
+      executor_workers                      = int(executor_workers)
+      
+      if (not (
+         0
+         <  self._interval_min
+         <= self._interval_max
+         <= self._interval_critical
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'interval_min     : {1}\n'
+              + 'interval_max     : {2}\n'
+              + 'interval_critical: {3}\n'
+            ).format(
+               descriptors.ERROR_INTERVALS_NOT_MONOTONIC,
+               self._interval_min,
+               self._interval_max,
+               self._interval_critical,
+         ))
+      elif (not (
+         0
+         <  self._clock_step
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'clock_step: {1}\n'
+            ).format(
+               descriptors.ERROR_CLOCK_STEP_INVALID,
+               self._clock_step,
+         ))
+      elif (not (
+         0
+         <= executor_workers
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'executor_workers: {1}\n'
+            ).format(
+               descriptors.ERROR_EXECUTOR_WORKERS_INVALID,
+               executor_workers,
+         ))
+      elif (
+             (loop is not None)
+         and loop.is_closed()
+      ):
+         raise Exception((
+                 '{0}::\n'
+              + 'loop: {1}\n'
+            ).format(
+               descriptors.ERROR_LOOP_INVALID,
+               loop,
+         ))
+      
+      self._interval_exceed_action_min      = interval_exceed_action_min
+      self._interval_exceed_action_max      = interval_exceed_action_max
+      self._interval_exceed_action_critical = interval_exceed_action_critical
+      
+      self._executor_workers                = executor_workers
+      self._executor_owned                  = (
+             (executor is None)
+         and bool(executor_workers)
+      )
+      
+      if (executor is not None):
+         self._executor                     = executor
+      elif (executor_workers):
+         self._executor                     = ThreadPoolExecutor(
+            max_workers        = executor_workers,
+            thread_name_prefix = 'libprogress.asynctrigger',
+         )
+      else:
+         self._executor                     = None
+      
+      self._list_notification               = dict() # {
+                                                     #    id: [
+                                                     #       events,
+                                                     #       times, # -1 : ULD
+                                                     #       callback,
+                                                     #    ],
+                                                     # }
+      self._list_blocking                   = dict() # {
+                                                     #    id: times_retain
+                                                     #           # -1 : ULD
+                                                     # }
+      self._list_waiting                    = list() # [
+                                                     #    id,
+                                                     #    id,
+                                                     # ]
+      self._list_transit                    = list() # [
+                                                     #    id,
+                                                     #    id,
+                                                     # ]
+      self._list_bound                      = dict() # {
+                                                     #    id: [
+                                                     #       function,
+                                                     #       args,
+                                                     #       kwargs,
+                                                     #       times_retain,
+                                                     #       times_recurse,
+                                                     #                # -1 : ULD
+                                                     #       future,
+                                                     #       unbound, # Event
+                                                     #       generated,
+                                                     #       iterations,
+                                                     #                # -1 : ULD
+                                                     #       until_idle,
+                                                     #    ],
+                                                     # }
+      self._list_owner                      = list() # [
+                                                     #    owner,
+                                                     #    owner,
+                                                     # ]
+      
+      if (mode not in (
+         flags.MODE_NONE,
+         flags.MODE_AUTO,
+         flags.MODE_MANUAL,
+         flags.MODE_HYBRID,
+         flags.MODE_AUTO_VIRTUAL,
+         flags.MODE_HYBRID_VIRTUAL,
+      )):
+         mode = flags.MODE_NONE
+      
+      self._mode                            = flags.MODE_NONE
+      self._mode_next                       = mode
+      
+      self._active                          = False
+      
+      self._trigger_pending                 = 0
+      self._trigger_force                   = False
+      self._trigger_force_pre_min           = False
+      self._trigger_flush                   = False
+      
+      self._event_wake                      = None
+      self._task_clock                      = None
+      
+      self._clock_time                      = 0.0
+      self._clock_epoch                     = 0.0
+      self._clock_active                    = False
+      self._clock_events                    = flags.INTERVAL_EVENT_NONE
+      
+      self._timer_wheel                     = timingwheel(
+         resolution = self._clock_step,
+         slots      = timer_slots,
+         levels     = timer_levels,
+      )
+      
+      self._error_error                     = False
+      self._error_raisable                  = False
+      self._error_time                      = 0.0
+      self._error_description               = ''
+      
+      self._thread_loop                     = None
+      
+      if (loop is not None):
+         self._loop                         = loop
+      else:
+         self._loop                         = asyncio.new_event_loop()
+         
+         loop_running                       = Event()
+         
+         self._thread_loop                  = Thread(
+            target = self._loop_run,
+            args   = [loop_running],
+            daemon = True,
+         )
+         self._thread_loop.start()
+         
+         loop_running.wait()
+      
+      self._future_trigger                  = self._loop.create_future()
+   
+   @classmethod
+   def shared (
+      cls,
+      group = 'default',
+       *args,
+      **kwargs,
+   ):
+      """Retrieve trigger system shared within group, init if not existing.
+      
+      Lets many users (like basesockets) drive their functions off a single
+      trigger system, and a single event loop, instead of one system each.
+      Configuration is only used upon init, i.e. first retrieval for group.
+      Users are expected to activate and deactivate shared system through
+      state with owner set, so that it is kept active while any owner is.
+      
+      Parameters
+      ----------
+      group : object, default='default'
+         Group (hashable) within which trigger system is shared.
+      args : list
+         Configuration for trigger system's init as args.
+      kwargs : dict
+         Configuration for trigger system's init as kwargs.
+      
+      Returns
+      -------
+      AsyncTrigger
+         Returns trigger system shared within group.
+      """
+      
+      cls._lock_trigger_shared.acquire()
+      
+      try:
+         if (group not in cls.trigger_shared):
+            cls.trigger_shared[group] = cls(*args, **kwargs)
+         
+         return cls.trigger_shared[group]
+      finally:
+         cls._lock_trigger_shared.release()
+   
+   def loop (self):
+      """Retrieve event loop system runs on.
+      
+      Coroutines waiting on system (see wait) are to be run on this loop,
+      e.g. via asyncio.run_coroutine_threadsafe from other threads.
+      
+      Returns
+      -------
+      AbstractEventLoop
+         Returns system's event loop.
+      """
+      
+      return self._loop
+   
+   def _loop_run (
+      self,
+      loop_running,
+   ):
+      """Run system's own event loop, on its dedicated thread.
+      
+      Parameters
+      ----------
+      loop_running : Event
+         Event to be set once loop is running.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      asyncio.set_event_loop(self._loop)
+      
+      self._loop.call_soon(loop_running.set)
+      self._loop.run_forever()
+      
+      return None
+   
+   def _loop_current (self):
+      """Check whether system's state can be touched from current thread.
+      
+      Returns
+      -------
+      bool
+         Returns True if running on system's event loop, or if it is not
+         running at all, else False.
+      """
+      
+      if (not self._loop.is_running()):
+         return True
+      
+      try:
+         return (asyncio.get_running_loop() is self._loop)
+      except RuntimeError:
+         return False
+   
+   def _loop_call (
+      self,
+      function,
+       *args,
+      non_blocking   = False,
+      thread_timeout = None,
+      **kwargs,
+   ):
+      """Run function on system's event loop, from any thread.
+      
+      Runs function right away if already on event loop, else hands it over
+      to event loop and (unless non_blocking) waits for its result.
+      
+      Parameters
+      ----------
+      function : callable
+         Function to run.
+      args : list
+         Args to be supplied to function.
+      non_blocking : bool, default=False
+         Return right away, instead of waiting for function's result ?
+      thread_timeout : int, float, NoneType, default=None
+         Timeout for waiting if running in blocking mode.
+      kwargs : dict
+         Kwargs to be supplied to function.
+      
+      Raises
+      ------
+      Exception
+         Exceptions as raised by function.
+      
+      Returns
+      -------
+      object
+         Returns function's return value, else True if non_blocking.
+      """
+      
+      if (self._loop_current()):
+         return function(*args, **kwargs)
+      
+      future = Future()
+      
+      self._loop.call_soon_threadsafe(partial(
+         self._loop_execute,
+         future,
+         function,
+         args,
+         kwargs,
+      ))
+      
+      if (non_blocking):
+         return True
+      
+      return future.result(timeout=thread_timeout)
+   
+   def _loop_execute (
+      self,
+      future,
+      function,
+      args,
+      kwargs,
+   ):
+      """Run function handed over to event loop, setting its future.
+      
+      Parameters
+      ----------
+      future : Future
+         Future to set function's result or exception with.
+      function : callable
+         Function to run.
+      args : tuple, list
+         Args to be supplied to function.
+      kwargs : dict
+         Kwargs to be supplied to function.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      try:
+         future.set_result(function(*args, **kwargs))
+      except BaseException as error:
+         future.set_exception(error)
+      
+      return None
+   
+   def _identifier_validate (
+      self,
+      identifier      = None,
+      required        = True,
+      force_use       = False,
+      regenerate      = False,
+      list_validation = [],
+      owner           = None,
+   ):
+      """Validates and/or regerates identifiers as required.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to use, else auto-generate.
+      required : bool, default=True
+         Is identifier required for process ? If not, bypass process.
+      regenerate : bool, default=False
+         Allow identifier regeneration upon in-validity of supplied one.
+      force_use : bool, default=False
+         Force use supplied identifier even if in-valid, overriding existing.
+      list_validation : tuple, list, default=[]
+         List to utilize for checking uniqueness with.
+      owner : str, NoneType, default=None
+         Owner for regenerated identifier, else auto-generate as anonymous.
+      
+      Returns
+      -------
+      tuple
+         Returns tuple containing supplied or new identifier and validity.
+      """
+      
+      if (not required):
+         return (identifier, True)
+      
+      regenerate_identity = False
+      
+      if (identifier in list_validation):
+         if (regenerate):
+            regenerate_identity = True
+         elif (force_use):
+            regenerate_identity = False
+         else:
+            return (identifier, False)
+      
+      if ((not identifier) or (regenerate_identity)):
+         identifier = app.libcommon.identifier.generate(
+            owner=(owner or (
+               'libprogress.asynctrigger[{0}].anonymous'.format(
+                  self,
+               )
+            )),
+         )
+      
+      return (identifier, True)
+   
+   def state (
+      self,
+      activate       = None,
+      reactivate     = None,
+      non_blocking   = False,
+      thread_timeout = None,
+      errors         = False,
+      errors_raise   = False,
+      describe       = True,
+      owner          = None,
+   ):
+      """Interact with system's state.
+      
+      Activation and deactivation on behalf of an owner are reference counted,
+      for shared systems - system is activated by first owner (if inactive)
+      and deactivated only by last one, others merely register or unregister
+      themselves. Without owner, system is activated or deactivated anyway.
+      
+      Parameters
+      ----------
+      activate : bool, NoneType, default=None
+         Set True or False to activate or deactivate system.
+      reactivate : bool, NoneType, default=None
+         Set True to re-activate system.
+      non_blocking : bool, default=False
+         Run current interaction in non-blocking mode ?
+      thread_timeout : int, float, NoneType, default=None
+         Thread timeout if running in blocking mode.
+      errors : bool, default=False
+         Surface active errors ?
+      errors_raise : bool, default=False
+         Surface active errors along with raisable ones ?
+      describe : bool, default=True
+         Describe system state using descriptors ?
+      owner : object, NoneType, default=None
+         Owner on whose behalf system is to be activated or deactivated.
+      
+      Raises
+      ------
+      Exception
+         Exceptions are raised if errors or errors_raise is set, if occurred.
+      
+      Returns
+      -------
+      str
+         Returns description of system's active state.
+      bool
+         Returns system's active state, else True on normal run.
+      """
+      
+      error_raisable       = None
+      
+      if (errors or errors_raise):
+         error_raisable    = self._loop_call(
+            self._errors,
+            finalize        = True,
+            return_raisable = errors_raise,
+         )
+      
+      if (activate is not None):
+         self._loop_call(
+            self._state_owner,
+            activate        = bool(activate),
+            owner           = owner,
+            non_blocking    = non_blocking,
+            thread_timeout  = thread_timeout,
+         )
+         
+         error_raisable    = self._loop_call(
+            self._errors,
+            finalize        = True,
+            return_raisable = errors_raise,
+         )
+      elif (reactivate):
+         self._loop_call(
+            self._modes_activate,
+            mode            = (self._mode if (self._active) else None),
+            non_blocking    = non_blocking,
+            thread_timeout  = thread_timeout,
+         )
+      elif (errors or errors_raise):
+         if (error_raisable is not None):
+            raise (error_raisable)
+      else:
+         active            = self._active
+         
+         if (describe):
+            active         = (
+               descriptors.STATE_ACTIVE
+               if (active)
+               else
+               descriptors.STATE_INACTIVE
+            )
+         
+         return active
+      
+      if (error_raisable is not None):
+         raise (error_raisable)
+      
+      return True
+   
+   def _state_owner (
+      self,
+      activate,
+      owner = None,
+   ):
+      """Activate or deactivate system on behalf of owner.
+      
+      Parameters
+      ----------
+      activate : bool
+         Activate or deactivate system.
+      owner : object, NoneType, default=None
+         Owner on whose behalf system is to be activated or deactivated.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      owners           = [
+         owner_active
+         for owner_active in self._list_owner
+         if (
+                (owner_active is not owner)
+            and (activate or (owner is not None))
+         )
+      ]
+      
+      if (
+             activate
+         and (owner is not None)
+      ):
+         owners.append(owner)
+      
+      if (
+            (owner is None)
+         or (activate and (not self._active))
+         or ((not activate) and (not owners))
+      ):
+         if (activate):
+            self._modes_activate()
+         else:
+            self._modes(
+               mode = flags.MODE_NONE,
+            )
+      
+      self._list_owner = owners
+      
+      return True
+   
+   def mode (
+      self,
+      mode           = None,
+      activate       = None,
+      non_blocking   = False,
+      thread_timeout = None,
+      describe       = True,
+      ignore_active  = True,
+   ):
+      """Interact with system's operation mode.
+      
+      Parameters
+      ----------
+      mode : int, NoneType, default=None
+         Execution mode, either to activate or queue for next activation.
+      activate : bool, NoneType, default=None
+         Set True or False to activate or deactivate execution mode.
+      non_blocking : bool, default=False
+         Run current interaction in non-blocking mode ?
+      thread_timeout : int, float, NoneType, default=None
+         Thread timeout if running in blocking mode.
+      describe : bool, default=True
+         Describe system mode using descriptors ?
+      ignore_active : bool, default=True
+         Describe system's valid working mode, ignoring system's state.
+      
+      Returns
+      -------
+      int
+         Returns system's currently active execution mode.
+      str
+         Returns description of system's currently active execution mode.
+      bool
+         Returns True on normal run.
+      """
+      
+      if (mode not in (
+         flags.MODE_NONE,
+         flags.MODE_AUTO,
+         flags.MODE_MANUAL,
+         flags.MODE_HYBRID,
+         flags.MODE_AUTO_VIRTUAL,
+         flags.MODE_HYBRID_VIRTUAL,
+      )):
+         mode = None
+      
+      if (mode is not None):
+         self._mode_next     = mode
+      
+      if (activate):
+         self._loop_call(
+            self._modes_activate,
+            mode              = mode,
+            non_blocking      = non_blocking,
+            thread_timeout    = thread_timeout,
+         )
+      elif (activate is False):
+         self._loop_call(
+            self._modes,
+            mode              = flags.MODE_NONE,
+            non_blocking      = non_blocking,
+            thread_timeout    = thread_timeout,
+         )
+      else:
+         mode                = self._mode
+         
+         if (
+                 ignore_active
+            and (not self._active)
+         ):
+            mode             = self._mode_next
+         
+         if (describe):
+            if (mode        == flags.MODE_NONE):
+               mode          = descriptors.MODE_NONE
+            elif (mode      == flags.MODE_AUTO):
+               mode          = descriptors.MODE_AUTO
+            elif (mode      == flags.MODE_MANUAL):
+               mode          = descriptors.MODE_MANUAL
+            elif (mode      == flags.MODE_HYBRID):
+               mode          = descriptors.MODE_HYBRID
+            elif (mode      == flags.MODE_AUTO_VIRTUAL):
+               mode          = descriptors.MODE_AUTO_VIRTUAL
+            elif (mode      == flags.MODE_HYBRID_VIRTUAL):
+               mode          = descriptors.MODE_HYBRID_VIRTUAL
+            else:
+               mode          = descriptors.MODE_SET_UNSET
+         elif (mode is None):
+            mode             = flags.MODE_NONE
+         
+         return mode
+      
+      return True
+   
+   def _modes_activate (
+      self,
+      mode = None,
+   ):
+      """(Re-)Activate system's operation mode.
+      
+      Deactivates system first, if active.
+      
+      Parameters
+      ----------
+      mode : int, NoneType, default=None
+         Execution mode, to activate. Use None for next queued mode.
+      
+      Returns
+      -------
+      bool
+         Returns switch's success.
+      """
+      
+      if (self._active):
+         self._modes(
+            mode = flags.MODE_NONE,
+         )
+      
+      return self._modes(
+         mode = mode,
+      )
+   
+   def _modes (
+      self,
+      mode = flags.MODE_NONE,
+   ):
+      """Switch system's operation mode.
+      
+      Performs switch operation only if the target mode is not active.
+      Can only switch to/from MODE_NONE to any other mode.
+      
+      Parameters
+      ----------
+      mode : int, NoneType, default=flags.MODE_NONE
+         Execution mode, to switch to. Use None to switch to next queued mode.
+      
+      Returns
+      -------
+      bool
+         Returns switch's success.
+      """
+      
+      if (mode is None):
+         mode = self._mode_next
+      
+      if (mode not in (
+         flags.MODE_NONE,
+         flags.MODE_AUTO,
+         flags.MODE_MANUAL,
+         flags.MODE_HYBRID,
+         flags.MODE_AUTO_VIRTUAL,
+         flags.MODE_HYBRID_VIRTUAL,
+      )):
+         return False
+      elif (mode           == self._mode):
+         return True
+      elif (mode           == flags.MODE_NONE):
+         self._mode_next               = self._mode
+         
+         self._clock_active            = False
+         
+         if (self._task_clock is not None):
+            self._task_clock.cancel()
+         
+         self._task_clock              = None
+         self._event_wake              = None
+         
+         self._trigger_pending         = 0
+         self._trigger_force           = False
+         self._trigger_force_pre_min   = False
+         self._trigger_flush           = False
+         
+         self._list_transit.clear()
+         
+         # Not waited for, as running functions complete onto event loop.
+         if (self._executor_owned):
+            self._executor.shutdown(wait=False)
+            
+            self._executor             = ThreadPoolExecutor(
+               max_workers        = self._executor_workers,
+               thread_name_prefix = 'libprogress.asynctrigger',
+            )
+         
+         self._active                  = False
+      elif (self._mode     != flags.MODE_NONE):
+         return False
+      else:
+         self._errors(
+            reset = True,
+         )
+         
+         self._trigger_force           = True
+         
+         if (mode          & flags.MODE_AUTO):
+            self._clock_epoch         += self._clock_time
+            self._clock_time           = 0.0
+            self._clock_events         = flags.INTERVAL_EVENT_NONE
+            self._clock_active         = True
+            
+            self._trigger_force_pre_min = True
+            
+            self._task_clock           = self._loop.create_task(
+               self._clock(),
+            )
+         
+         self._active                  = True
+      
+      self._mode                       = mode
+      
+      return True
+   
+   def notification_alert (
+      self,
+      identifier          = None,
+      callback            = None,
+      unregister          = False,
+      events              = flags.INTERVAL_EVENT_ALL,
+      times               = -1, # unlimited
+      identity_regenerate = False,
+      identity_force_use  = False,
+   ):
+      """Handles registration for event based notfications.
+      
+      Callbacks are run on event loop; coroutine functions as tasks.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to register with, else auto-generate.
+      callback : callable, NoneType, default=None
+         Callback (or coroutine function), used upon alert generation.
+      unregister : bool, default=False
+         Unregister identifier from notification alerts.
+      events : int, default=flags.INTERVAL_EVENT_ALL
+         Events upon which notification alert is to be sent.
+      times : int, default=-1
+         Times to send notification alerts, remove upon expiry.
+      identity_regenerate : bool, default=False
+         Allow identifier regeneration upon in-validity of supplied one.
+      identity_force_use : bool, default=False
+         Force use supplied identifier even if in-valid, overriding existing.
+      
+      Returns
+      -------
+      str
+         Returns identifier used upon successful registration.
+      bool
+         Returns success as bool on unregistration or registration, if failed.
+      """
+      
+      if (unregister):
+         if (not identifier):
+            return False
+         
+         self._loop_call(
+            self._list_notification.pop,
+            identifier,
+            None,
+         )
+         
+         return True
+      elif ((not callback)
+         or (not callable(callback))
+      ):
+         return False
+      elif (not times):
+         return False
+      
+      return self._loop_call(
+         self._notification_alert,
+         identifier          = identifier,
+         callback            = callback,
+         events              = events,
+         times               = int(times),
+         identity_regenerate = identity_regenerate,
+         identity_force_use  = identity_force_use,
+      )
+   
+   def _notification_alert (
+      self,
+      identifier          = None,
+      callback            = None,
+      events              = flags.INTERVAL_EVENT_ALL,
+      times               = -1, # unlimited
+      identity_regenerate = False,
+      identity_force_use  = False,
+   ):
+      """Registers callback for event based notfications, on event loop.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to register with, else auto-generate.
+      callback : callable, NoneType, default=None
+         Callback (or coroutine function), used upon alert generation.
+      events : int, default=flags.INTERVAL_EVENT_ALL
+         Events upon which notification alert is to be sent.
+      times : int, default=-1
+         Times to send notification alerts, remove upon expiry.
+      identity_regenerate : bool, default=False
+         Allow identifier regeneration upon in-validity of supplied one.
+      identity_force_use : bool, default=False
+         Force use supplied identifier even if in-valid, overriding existing.
+      
+      Returns
+      -------
+      str
+         Returns identifier used upon successful registration.
+      bool
+         Returns False if registration failed.
+      """
+      
+      identifier, proceed = self._identifier_validate(
+         identifier      = identifier,
+         required        = True,
+         force_use       = identity_force_use,
+         regenerate      = identity_regenerate,
+         list_validation = self._list_notification.keys(),
+         owner           = (
+            'libprogress.asynctrigger[{0}].notification_alert.anonymous'.format(
+               self,
+            )
+         ),
+      )
+      
+      if (not proceed):
+         return False
+      
+      self._list_notification[identifier] = [
+         events,
+         times,
+         callback,
+      ]
+      
+      return identifier
+   
+   def trigger_bind (
+      self,
+      
+      trigger_bound_function,
+      args           = [],
+      kwargs         = {},
+      
+      identifier     = None,
+      times_retain   = -1,
+      times_recurse  = -1,
+      
+      iterations     = 1,
+      until_idle     = False,
+      
+      non_blocking   = True,
+      thread_timeout = None,
+      thread_daemon  = True,
+   ):
+      """Binds functions (or coroutine functions) for automated execution.
+      
+      Allows trigger_bound_function's repeated execution upon each trigger,
+      with block held on its behalf until completion. Coroutine functions are
+      run as tasks on event loop, others on executor (if any) or right on
+      event loop, hence are expected not to block for long.
+      Function may run multiple iterations per trigger, within a single block,
+      stopping early with until_idle once it returns a falsy value.
+      
+      Parameters
+      ----------
+      trigger_bound_function : callable
+         Function (or coroutine function) to be bound for execution.
+      args : tuple, list, default=[]
+         Args to be supplied to trigger_bound_function during execution.
+      kwargs : dict, default={}
+         Kwargs to be supplied to trigger_bound_function during execution.
+      identifier : str, NoneType, default=None
+         Custom identifier for binding and blocks, else auto-generate.
+      times_retain : int, default=-1
+         Times to force-retain block for next trigger, remove upon expiry.
+      times_recurse : int, default=-1
+         Number of times to execute function, upon expiry auto-unbound.
+      iterations : int, default=1
+         Iterations of function per trigger, -1 for unlimited (requires
+         until_idle).
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
+      non_blocking : bool, default=True
+         Return right away, instead of waiting for function to be unbound ?
+         Ignored on event loop itself.
+      thread_timeout : int, float, NoneType, default=None
+         Timeout for waiting if running in blocking mode.
+      thread_daemon : bool, default=True
+         Unused, accepted for compatibility.
+      
+      Returns
+      -------
+      bool
+         Returns False if invalid parameters, True or unbound status.
+      """
+      
+      times_recurse = int(times_recurse)
+      iterations    = int(iterations)
+      until_idle    = bool(until_idle)
+      
+      if (
+            (not iterations)
+         or ((iterations < 0) and (not until_idle))
+      ):
+         return False
+      
+      if (not times_recurse):
+         return True
+      
+      event_unbound = Event()
+      
+      if (not self._loop_call(
+         self._trigger_bind,
+         trigger_bound_function = trigger_bound_function,
+         args                   = args,
+         kwargs                 = kwargs,
+         identifier             = identifier,
+         times_retain           = times_retain,
+         times_recurse          = times_recurse,
+         iterations             = max(-1, iterations),
+         until_idle             = until_idle,
+         event_unbound          = event_unbound,
+      )):
+         return False
+      
+      if (
+             (not non_blocking)
+         and (not self._loop_current())
+      ):
+         return event_unbound.wait(timeout=thread_timeout)
+      
+      return True
+   
+   def _trigger_bind (
+      self,
+      
+      trigger_bound_function,
+      args           = [],
+      kwargs         = {},
+      
+      identifier     = None,
+      times_retain   = -1,
+      times_recurse  = -1,
+      
+      iterations     = 1,
+      until_idle     = False,
+      
+      event_unbound  = None,
+   ):
+      """Binds functions for automated execution, on event loop.
+      
+      Parameters
+      ----------
+      trigger_bound_function : callable
+         Function (or coroutine function) to be bound for execution.
+      args : tuple, list, default=[]
+         Args to be supplied to trigger_bound_function during execution.
+      kwargs : dict, default={}
+         Kwargs to be supplied to trigger_bound_function during execution.
+      identifier : str, NoneType, default=None
+         Custom identifier for binding and blocks, else auto-generate.
+      times_retain : int, default=-1
+         Times to force-retain block for next trigger, remove upon expiry.
+      times_recurse : int, default=-1
+         Number of times to execute function, upon expiry auto-unbound.
+      iterations : int, default=1
+         Iterations of function per trigger, -1 for unlimited.
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
+      event_unbound : Event, NoneType, default=None
+         Event to be set once function is unbound.
+      
+      Returns
+      -------
+      str
+         Returns identifier function is bound with.
+      """
+      
+      identifier_bound, proceed = self._identifier_validate(
+         identifier      = identifier,
+         required        = True,
+         regenerate      = True,
+         list_validation = self._list_bound.keys(),
+         owner           = (
+            'libprogress.asynctrigger[{0}].trigger_bind.anonymous'.format(
+               self,
+            )
+         ),
+      )
+      
+      self._list_bound[identifier_bound] = [
+         trigger_bound_function,
+         args,
+         kwargs,
+         int(times_retain),
+         max(-1, int(times_recurse)),
+         None,
+         (event_unbound or Event()),
+         (identifier_bound != identifier),
+         iterations,
+         until_idle,
+      ]
+      
+      return identifier_bound
+   
+   def trigger_unbind (
+      self,
+      identifier,
+   ):
+      """Unbinds function bound to system with specified identifier.
+      
+      Function is not run again: it has its times_recurse expired, being
+      unbound at once, or upon completion if still running.
+      
+      Parameters
+      ----------
+      identifier : str
+         Custom identifier function is bound with.
+      
+      Returns
+      -------
+      bool
+         Returns True if a function was bound with identifier, else False.
+      """
+      
+      return self._loop_call(
+         self._trigger_unbind,
+         identifier = identifier,
+      )
+   
+   def _trigger_unbind (
+      self,
+      identifier,
+   ):
+      """Unbinds function bound with specified identifier, on event loop.
+      
+      Parameters
+      ----------
+      identifier : str
+         Custom identifier function is bound with.
+      
+      Returns
+      -------
+      bool
+         Returns True if a function was bound with identifier, else False.
+      """
+      
+      bound = self._list_bound.get(identifier)
+      
+      if (bound is None):
+         return False
+      
+      bound[4] = 0
+      
+      # Else unbound upon completion, see _trigger_submit_done.
+      if (
+            (bound[5] is None)
+         or bound[5].done()
+      ):
+         self._list_bound.pop(identifier)
+         
+         if (bound[7]):
+            app.libcommon.identifier.delete(identifier)
+         
+         bound[6].set()
+      
+      return True
+   
+   async def wait (
+      self,
+      identifier          = None,
+      identity_regenerate = False,
+      identity_force_use  = False,
+   ):
+      """Wait for next trigger event to occur.
+      
+      Coroutine, to be awaited on system's event loop (see loop).
+      Waits are meant to ensure that all dependent functions wait for trigger
+      event to start their tasks, providing synchronized progress.
+      This should be called before starting task, even before calling block.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to use while waiting, else auto-generate.
+      identity_regenerate : bool, default=False
+         Allow identifier regeneration upon in-validity of supplied one.
+      identity_force_use : bool, default=False
+         Force use supplied identifier even if in-valid, overriding existing.
+      
+      Raises
+      ------
+      Exception
+         Awaited on another event loop.
+      
+      Returns
+      -------
+      bool
+         Returns False if invalid parameters.
+      str
+         Returns identifier used while waiting, upon success.
+      """
+      
+      if (not self._loop_current()):
+         raise Exception((
+                 '{0}::\n'
+              + 'loop: {1}\n'
+            ).format(
+               descriptors.ERROR_LOOP_INVALID,
+               asyncio.get_running_loop(),
+         ))
+      
+      identifier, proceed = self._identifier_validate(
+         identifier      = identifier,
+         required        = True,
+         force_use       = identity_force_use,
+         regenerate      = identity_regenerate,
+         list_validation = self._list_waiting,
+         owner           = (
+            'libprogress.asynctrigger[{0}].wait.anonymous'.format(
+               self,
+            )
+         ),
+      )
+      
+      if (not proceed):
+         return False
+      
+      if (identifier in self._list_transit):
+         self._list_transit.remove(identifier)
+         self._trigger_wake()
+      
+      self._list_waiting.append(identifier)
+      
+      try:
+         await asyncio.shield(self._future_trigger)
+      finally:
+         try:
+            self._list_waiting.remove(identifier)
+         except:
+            pass
+      
+      return identifier
+   
+   def block (
+      self,
+      identifier          = None,
+      times_retain        = -1, # unlimited
+      identity_regenerate = False,
+      identity_force_use  = False,
+   ):
+      """Add a block preventing next trigger event, until released.
+      
+      Blocks are a means to ensure that all dependent functions are activated
+      simultaneously (in sync).
+      Blocks are registered by appending identifier to blocking list.
+      This should be called before starting task, right after wait is over.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to use for block, else auto-generate.
+      times_retain : int, default=-1
+         Times to force-retain block for next trigger, remove upon expiry.
+      identity_regenerate : bool, default=False
+         Allow identifier regeneration upon in-validity of supplied one.
+      identity_force_use : bool, default=False
+         Force use supplied identifier even if in-valid, overriding existing.
+      
+      Returns
+      -------
+      bool
+         Returns False if invalid parameters.
+      str
+         Returns identifier for block added.
+      """
+      
+      return self._loop_call(
+         self._block,
+         identifier          = identifier,
+         times_retain        = int(times_retain),
+         identity_regenerate = identity_regenerate,
+         identity_force_use  = identity_force_use,
+      )
+   
+   def _block (
+      self,
+      identifier          = None,
+      times_retain        = -1, # unlimited
+      identity_regenerate = False,
+      identity_force_use  = False,
+   ):
+      """Add a block preventing next trigger event, on event loop.
+      
+      Parameters
+      ----------
+      identifier : str, NoneType, default=None
+         Custom identifier to use for block, else auto-generate.
+      times_retain : int, default=-1
+         Times to force-retain block for next trigger, remove upon expiry.
+      identity_regenerate : bool, default=False
+         Allow identifier regeneration upon in-validity of supplied one.
+      identity_force_use : bool, default=False
+         Force use supplied identifier even if in-valid, overriding existing.
+      
+      Returns
+      -------
+      bool
+         Returns False if invalid parameters.
+      str
+         Returns identifier for block added.
+      """
+      
+      identifier, proceed = self._identifier_validate(
+         identifier      = identifier,
+         required        = True,
+         force_use       = identity_force_use,
+         regenerate      = identity_regenerate,
+         list_validation = self._list_blocking.keys(),
+         owner           = (
+            'libprogress.asynctrigger[{0}].block.anonymous'.format(
+               self,
+            )
+         ),
+      )
+      
+      if (not proceed):
+         return False
+      
+      self._list_blocking[identifier] = times_retain
+      
+      if (identifier in self._list_transit):
+         self._list_transit.remove(identifier)
+      
+      return identifier
+   
+   def release (
+      self,
+      identifier,
+   ):
+      """Release the block for next trigger event.
+      
+      Blocks are released by removing identifiers from blocking list.
+      This should be called after completion of task.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier to used for block to be released.
+      
+      Returns
+      -------
+      bool
+         Returns False if invalid parameters.
+      str
+         Returns identifier mapped to block, upon successful removal.
+      """
+      
+      if (not identifier):
+         return False
+      
+      self._loop_call(
+         self._release,
+         identifier,
+      )
+      
+      return identifier
+   
+   def _release (
+      self,
+      identifier,
+   ):
+      """Release the block for next trigger event, on event loop.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier to used for block to be released.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._list_blocking.pop(identifier, None)
+      
+      if (not self._list_blocking):
+         self._trigger_wake()
+      
+      return None
+   
+   def schedule (
+      self,
+      delay,
+      callback,
+      args     = [],
+      kwargs   = {},
+   ):
+      """Schedule a callback, to be run within first tick after delay.
+      
+      Timers are kept on a hierarchical timing wheel (see TimingWheel) keyed
+      on system time (clock time, accumulated across triggers), with O(1)
+      scheduling and cancellation. Due callbacks (or coroutine functions,
+      run as tasks) are run upon each trigger, on event loop. As system time
+      only elapses on clock, timers only come due in automatic modes.
+      
+      Parameters
+      ----------
+      delay : int, float
+         Delay (in system time) after which callback is due.
+      callback : callable
+         Callback (or coroutine function), to be run once due.
+      args : tuple, list, default=[]
+         Args to be supplied to callback.
+      kwargs : dict, default={}
+         Kwargs to be supplied to callback.
+      
+      Returns
+      -------
+      int
+         Returns handle of scheduled callback (see cancel).
+      bool
+         Returns False if invalid parameters.
+      """
+      
+      if (
+            (not callable(callback))
+         or (delay < 0)
+      ):
+         return False
+      
+      return self._timer_wheel.schedule(
+         time_due = (self._clock_epoch + self._clock_time + delay),
+         callback = callback,
+         args     = args,
+         kwargs   = kwargs,
+      )
+   
+   def cancel (
+      self,
+      handle,
+   ):
+      """Cancel a scheduled callback.
+      
+      Parameters
+      ----------
+      handle : int
+         Handle of scheduled callback.
+      
+      Returns
+      -------
+      bool
+         Returns False if callback is not pending (run or cancelled).
+      """
+      
+      return self._timer_wheel.cancel(handle)
+   
+   def _timer_fire (self):
+      """Run scheduled callbacks due by current system time, on event loop.
+      
+      Exceptions raised by callbacks are consumed, so that trigger proceeds.
+      
+      Returns
+      -------
+      int
+         Returns number of callbacks run.
+      """
+      
+      expired = self._timer_wheel.advance(
+         self._clock_epoch + self._clock_time,
+      )
+      
+      for callback, args, kwargs in expired:
+         try:
+            result = callback(*args, **kwargs)
+            
+            if (inspect.isawaitable(result)):
+               asyncio.ensure_future(
+                  result,
+                  loop = self._loop,
+               )
+         except:
+            pass
+      
+      return len(expired)
+   
+   def notify (self, *args, **kwargs):
+      """Send a manual notification alert to all registered receivers.
+      
+      Sends notification alerts to all registered receivers whose registered
+      events matches currently active events.
+      
+      Parameters
+      ----------
+      event : int, default=flags.INTERVAL_EVENT_NONE
+         Event for which the notification has to be triggered.
+      event_time : int, float, default=0.0
+         Instantaneous time for event.
+      event_description : str, default=descriptors.INTERVAL_EVENT_NONE
+         Description for event for which notification has to be triggered.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      kwargs.pop('non_blocking', None)
+      kwargs.pop('thread_timeout', None)
+      
+      return self._loop_call(self._notify, *args, **kwargs)
+   
+   def _notify (
+      self,
+      event             = flags.INTERVAL_EVENT_NONE,
+      event_time        = 0.0,
+      event_description = descriptors.INTERVAL_EVENT_NONE,
+   ):
+      """Send a notification alert to all registered receivers, on event loop.
+      
+      Schedules callbacks of all registered receivers whose registered events
+      matches specified events on event loop; coroutine functions as tasks.
+      
+      Parameters
+      ----------
+      event : int, default=flags.INTERVAL_EVENT_NONE
+         Event for which the notification has to be triggered.
+      event_time : int, float, default=0.0
+         Instantaneous time for event.
+      event_description : str, default=descriptors.INTERVAL_EVENT_NONE
+         Description for event for which notification has to be triggered.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      notification_callbacks = list()
+      
+      for identifier, notification in list(self._list_notification.items()):
+         if (not (
+                (notification[0] & event)
+            and notification[1]
+         )):
+            continue
+         
+         if (notification[1] > 0):
+            notification[1] -= 1 #    limited
+            
+            if (not notification[1]):
+               self._list_notification.pop(identifier, None)
+         
+         notification_callbacks.append(notification[2])
+      
+      for callback in notification_callbacks:
+         callback_kwargs = {
+            'clock_time'        : self._clock_time,
+            'event'             : event,
+            'event_time'        : event_time,
+            'event_description' : event_description,
+         }
+         
+         if (inspect.iscoroutinefunction(callback)):
+            self._loop.create_task(callback(**callback_kwargs))
+         else:
+            self._loop.call_soon(partial(callback, **callback_kwargs))
+      
+      return True
+   
+   def trigger_force (
+      self,
+      force         = None,
+      force_pre_min = None,
+   ):
+      """Force activate next trigger, overriding active blocks.
+      
+      Used to force fire a trigger even if a task is blocking.
+      
+      Parameters
+      ----------
+      force : bool, NoneType, default=None
+         If bool, enable or disable trigger's normal force state.
+      force_pre_min : bool, NoneType, default=None
+         If bool, enable or disable trigger's pre-min force state.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      return self._loop_call(
+         self._trigger_state,
+         force         = force,
+         force_pre_min = force_pre_min,
+      )
+   
+   def trigger_flush (
+      self,
+      flush         = None,
+      flush_pre_min = None,
+   ):
+      """Flush queued triggers.
+      
+      Used to cancel queued triggers if the need arise. Flushing drops
+      manually enqueued triggers and holds further ones until disabled,
+      while pre-min flushing cancels pending pre-min force.
+      
+      Parameters
+      ----------
+      flush : bool, NoneType, default=None
+         If bool, enable or disable trigger's normal flush state.
+      flush_pre_min : bool, NoneType, default=None
+         If True, cancel trigger's pre-min force state.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      return self._loop_call(
+         self._trigger_state,
+         flush         = flush,
+         force_pre_min = (False if (flush_pre_min) else None),
+      )
+   
+   def _trigger_state (
+      self,
+      force         = None,
+      force_pre_min = None,
+      flush         = None,
+   ):
+      """Alter trigger's force and flush states, on event loop.
+      
+      Parameters
+      ----------
+      force : bool, NoneType, default=None
+         If bool, enable or disable trigger's normal force state.
+      force_pre_min : bool, NoneType, default=None
+         If bool, enable or disable trigger's pre-min force state.
+      flush : bool, NoneType, default=None
+         If bool, enable or disable trigger's normal flush state.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      if (force is not None):
+         self._trigger_force         = bool(force)
+      
+      if (force_pre_min is not None):
+         self._trigger_force_pre_min = bool(force_pre_min)
+      
+      if (flush):
+         self._trigger_pending       = 0
+      
+      if (flush is not None):
+         self._trigger_flush         = bool(flush)
+      
+      self._trigger_wake()
+      
+      return True
+   
+   def trigger (self, non_blocking=True, thread_timeout=None):
+      """Manually enqueue a trigger.
+      
+      Parameters
+      ----------
+      non_blocking : bool, default=True
+         Return right away, instead of waiting for trigger to be enqueued ?
+      thread_timeout : int, float, NoneType, default=None
+         Timeout for waiting if running in blocking mode.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      return self._loop_call(
+         self._trigger_enqueue,
+         non_blocking   = non_blocking,
+         thread_timeout = thread_timeout,
+      )
+   
+   def _trigger_enqueue (self):
+      """Manually enqueue a trigger, on event loop.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      self._trigger_pending += 1
+      
+      self._trigger_wake()
+      
+      return True
+   
+   def _trigger_wake (self):
+      """Re-evaluate trigger's conditions, upon their change.
+      
+      Wakes clock if active, else checks whether (manual) trigger is due.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      if (self._clock_active):
+         if (self._event_wake is not None):
+            self._event_wake.set()
+      else:
+         self._trigger_check()
+      
+      return True
+   
+   def _trigger_check (self):
+      """Fire trigger, if due.
+      
+      Trigger is due once minimum duration is achieved (or pre-min forced)
+      in automatic modes, or if enqueued in manual modes, and then fired
+      when no task is blocking (or forced), unless flushed.
+      
+      Returns
+      -------
+      bool
+         Returns True if trigger fired, else False.
+      """
+      
+      if (
+            (not self._active)
+         or self._trigger_flush
+      ):
+         return False
+      
+      due_auto          = bool(
+             self._clock_active
+         and (
+               (self._clock_time >= self._interval_min)
+            or self._trigger_force_pre_min
+         )
+      )
+      due_manual        = bool(
+             (self._mode & flags.MODE_MANUAL)
+         and self._trigger_pending
+      )
+      
+      if (not (due_auto or due_manual)):
+         return False
+      
+      event             =       flags.INTERVAL_EVENT_TRIGGER
+      event_description = descriptors.INTERVAL_EVENT_TRIGGER
+      
+      if (self._list_blocking):
+         if (not self._trigger_force):
+            return False
+         
+         self._trigger_force = False
+         
+         event            |= flags.INTERVAL_EVENT_TRIGGER_FORCE
+         event_description = app.libcommon.descriptoroperations.combine(
+            event_description,
+            descriptors.INTERVAL_EVENT_TRIGGER_FORCE,
+         )
+         
+         for identifier, times_retain in list(self._list_blocking.items()):
+            if (times_retain < 0):
+               self._list_blocking[identifier]  = -1
+            elif (times_retain > 0):
+               self._list_blocking[identifier] -=  1
+            else:
+               self._list_blocking.pop(identifier)
+      
+      if (
+             due_auto
+         and (self._clock_time < self._interval_min)
+      ):
+         event            |= flags.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
+         event_description = app.libcommon.descriptoroperations.combine(
+            event_description,
+            descriptors.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE,
+         )
+      
+      if (due_auto):
+         self._trigger_force_pre_min = False
+      else:
+         self._trigger_pending      -= 1
+      
+      self._trigger_fire(
+         event             = event,
+         event_description = event_description,
+      )
+      
+      return True
+   
+   def _trigger_fire (
+      self,
+      event             =       flags.INTERVAL_EVENT_TRIGGER,
+      event_description = descriptors.INTERVAL_EVENT_TRIGGER,
+   ):
+      """Processes individual trigger and handles post-trigger.
+      
+      Resolves waits, submits bound functions, sends notifications and
+      resets clock.
+      
+      Parameters
+      ----------
+      event : int, default=flags.INTERVAL_EVENT_TRIGGER
+         Event for trigger.
+      event_description : str, default=descriptors.INTERVAL_EVENT_TRIGGER
+         Description of event for trigger.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      future_trigger       = self._future_trigger
+      self._future_trigger = self._loop.create_future()
+      
+      if (self._mode & flags.MODE_VIRTUAL):
+         self._list_transit.extend(self._list_waiting)
+      
+      future_trigger.set_result(True)
+      
+      self._timer_fire()
+      
+      self._trigger_submit()
+      
+      self._notify(
+         event             = event,
+         event_time        = self._clock_time,
+         event_description = event_description,
+      )
+      
+      self._clock_epoch   += self._clock_time
+      self._clock_time     = 0.0
+      self._clock_events   = flags.INTERVAL_EVENT_NONE
+      
+      self._errors(
+         reset             = True,
+      )
+      
+      return True
+   
+   def _trigger_submit (self):
+      """Submits bound functions, upon trigger.
+      
+      Holds a block on behalf of each bound function (not still running from
+      an earlier trigger) and runs it, with completion acting as release (see
+      _trigger_submit_done).
+      
+      Returns
+      -------
+      int
+         Returns number of functions submitted.
+      """
+      
+      submitted = 0
+      
+      for identifier, bound in self._list_bound.items():
+         if (
+                (not bound[4])
+            or ((bound[5] is not None) and (not bound[5].done()))
+         ):
+            continue
+         
+         if (bound[4] > 0):
+            bound[4] -= 1
+         
+         self._list_blocking[identifier] = bound[3]
+         
+         bound[5]   = (
+            self._trigger_execute(
+               function = bound[0],
+               args     = bound[1],
+               kwargs   = bound[2],
+            )
+            if (bound[8] == 1)
+            else
+            self._loop.create_task(self._trigger_iterate(
+               function   = bound[0],
+               args       = bound[1],
+               kwargs     = bound[2],
+               iterations = bound[8],
+               until_idle = bound[9],
+            ))
+         )
+         bound[5].add_done_callback(partial(
+            self._trigger_submit_done,
+            identifier,
+         ))
+         
+         submitted += 1
+      
+      return submitted
+   
+   async def _trigger_iterate (
+      self,
+      function,
+      args       = [],
+      kwargs     = {},
+      iterations = 1,
+      until_idle = False,
+   ):
+      """Iterate function (or coroutine function) within a single trigger.
+      
+      Runs function up-to iterations times (unlimited if -1), one after the
+      other as per its kind (see _trigger_execute), stopping early with
+      until_idle as soon as it returns a falsy value.
+      
+      Parameters
+      ----------
+      function : callable
+         Function (or coroutine function) to iterate.
+      args : tuple, list, default=[]
+         Args to be supplied to function.
+      kwargs : dict, default={}
+         Kwargs to be supplied to function.
+      iterations : int, default=1
+         Iterations of function, -1 for unlimited.
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
+      
+      Returns
+      -------
+      object
+         Returns function's last return value.
+      """
+      
+      result         = None
+      
+      while (iterations):
+         iterations -= 1
+         
+         if (iterations < 0):
+            iterations = -1
+         
+         result      = await self._trigger_execute(
+            function = function,
+            args     = args,
+            kwargs   = kwargs,
+         )
+         
+         if (
+                until_idle
+            and (not result)
+         ):
+            break
+      
+      return result
+   
+   def _trigger_execute (
+      self,
+      function,
+      args   = [],
+      kwargs = {},
+   ):
+      """Run function (or coroutine function) as per its kind.
+      
+      Parameters
+      ----------
+      function : callable
+         Function (or coroutine function) to run.
+      args : tuple, list, default=[]
+         Args to be supplied to function.
+      kwargs : dict, default={}
+         Kwargs to be supplied to function.
+      
+      Returns
+      -------
+      Future
+         Returns (asyncio) future, done upon function's completion.
+      """
+      
+      if (inspect.iscoroutinefunction(function)):
+         return self._loop.create_task(function(*args, **kwargs))
+      elif (self._executor is not None):
+         return self._loop.run_in_executor(
+            self._executor,
+            partial(function, *args, **kwargs),
+         )
+      
+      future = self._loop.create_future()
+      
+      self._loop.call_soon(partial(
+         self._trigger_execute_loop,
+         future,
+         function,
+         args,
+         kwargs,
+      ))
+      
+      return future
+   
+   def _trigger_execute_loop (
+      self,
+      future,
+      function,
+      args,
+      kwargs,
+   ):
+      """Run function right on event loop, setting its future.
+      
+      Awaitable return values (e.g. of partials of coroutine functions) are
+      run as tasks, with future done upon their completion instead.
+      
+      Parameters
+      ----------
+      future : Future
+         (Asyncio) future to set function's result or exception with.
+      function : callable
+         Function to run.
+      args : tuple, list
+         Args to be supplied to function.
+      kwargs : dict
+         Kwargs to be supplied to function.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      try:
+         result = function(*args, **kwargs)
+      except Exception as error:
+         future.set_exception(error)
+         
+         return None
+      
+      if (inspect.isawaitable(result)):
+         asyncio.ensure_future(
+            result,
+            loop = self._loop,
+         ).add_done_callback(partial(
+            self._trigger_execute_done,
+            future,
+         ))
+      else:
+         future.set_result(result)
+      
+      return None
+   
+   def _trigger_execute_done (
+      self,
+      future,
+      future_awaited,
+   ):
+      """Transfer awaited result (or exception) to function's future.
+      
+      Parameters
+      ----------
+      future : Future
+         (Asyncio) future of function.
+      future_awaited : Future
+         (Asyncio) future of function's awaitable return value.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      if (future_awaited.cancelled()):
+         future.cancel()
+      elif (future_awaited.exception() is not None):
+         future.set_exception(future_awaited.exception())
+      else:
+         future.set_result(future_awaited.result())
+      
+      return None
+   
+   def _trigger_submit_done (
+      self,
+      identifier,
+      future,
+   ):
+      """Receive point (callback) for completion of submitted function.
+      
+      Releases block held on behalf of function, and unbinds it if its
+      times_recurse has expired.
+      Exceptions raised by function are consumed, as with trigger progress
+      mechanism's bound functions.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier function is bound with.
+      future : Future
+         (Asyncio) future of completed function.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      if (not future.cancelled()):
+         future.exception()
+      
+      bound = self._list_bound.get(identifier)
+      
+      if (
+             (bound is not None)
+         and (bound[5] is future)
+         and (not bound[4])
+      ):
+         self._list_bound.pop(identifier)
+         
+         if (bound[7]):
+            app.libcommon.identifier.delete(identifier)
+         
+         bound[6].set()
+      
+      self._release(identifier)
+      
+      return None
+   
+   async def _clock (self):
+      """Processes clock related and core functionality for trigger system.
+      
+      Core clock functionality for automatic operation modes, run as task.
+      Fires trigger when due, fires exceed events, and steps clock forward
+      every clock_interval, drift-free against event loop's time; woken in
+      between upon change of trigger conditions (see _trigger_wake).
+      In virtual mode, steps clock forward right away whenever idle (see
+      _clock_idle), decoupling clock from wall time.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._event_wake = asyncio.Event()
+      time_due         = self._loop.time() + self._clock_interval
+      
+      while (self._clock_active):
+         self._trigger_check()
+         self._clock_exceed()
+         
+         if (not self._clock_active):
+            break
+         
+         if (
+                (self._mode & flags.MODE_VIRTUAL)
+            and self._clock_idle()
+         ):
+            await asyncio.sleep(0)
+         else:
+            timeout    = time_due - self._loop.time()
+            
+            if (timeout > 0):
+               self._event_wake.clear()
+               
+               handle  = self._loop.call_later(timeout, self._event_wake.set)
+               
+               try:
+                  await self._event_wake.wait()
+               finally:
+                  handle.cancel()
+               
+               if (self._loop.time() < time_due):
+                  continue
+            else:
+               await asyncio.sleep(0)
+            
+            time_due  += self._clock_interval
+            
+            if (time_due < self._loop.time()):
+               time_due = self._loop.time() + self._clock_interval
+         
+         self._clock_time += self._clock_step
+      
+      return None
+   
+   def _clock_idle (self):
+      """Check whether virtual clock can step forward without sleeping.
+      
+      System is idle when no block is held and no waiter is in transit
+      between trigger and block.
+      
+      Returns
+      -------
+      bool
+         Returns True if clock can step forward right away.
+      """
+      
+      return (
+             (not self._list_blocking)
+         and (not self._list_transit)
+      )
+   
+   def _clock_exceed (self):
+      """Fire exceed events, once per trigger, upon exceeding intervals.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      for interval, event, event_description in (
+         (
+            self._interval_min,
+            flags.INTERVAL_EVENT_EXCEED_MIN,
+            descriptors.INTERVAL_EVENT_EXCEED_MIN,
+         ),
+         (
+            self._interval_max,
+            flags.INTERVAL_EVENT_EXCEED_MAX,
+            descriptors.INTERVAL_EVENT_EXCEED_MAX,
+         ),
+         (
+            self._interval_critical,
+            flags.INTERVAL_EVENT_EXCEED_CRITICAL,
+            descriptors.INTERVAL_EVENT_EXCEED_CRITICAL,
+         ),
+      ):
+         if (
+                (self._clock_time >= interval)
+            and (not (self._clock_events & event))
+         ):
+            self._clock_events |= event
+            
+            self._clock_interval_exceed_action(
+               event             = event,
+               event_description = event_description,
+            )
+      
+      return None
+   
+   def _clock_interval_exceed_action (
+      self,
+      event             =       flags.INTERVAL_EVENT_NONE,
+      event_description = descriptors.INTERVAL_EVENT_NONE,
+   ):
+      """Process system's interval exceed actions.
+      
+      Performs actions based on exceed events.
+      
+      Parameters
+      ----------
+      event : int, default=flags.INTERVAL_EVENT_NONE
+         Event to be processed.
+      event_description : str, default=descriptors.INTERVAL_EVENT_NONE
+         Description of event to be processed.
+      
+      Returns
+      -------
+      NoneType
+         Returns None on no-action required.
+      bool
+         Returns True on successful actions.
+      """
+      
+      interval_exceed_actions     = flags.INTERVAL_EXCEED_ACTION_NONE
+      
+      if (event & flags.INTERVAL_EVENT_EXCEED_MIN):
+         interval_exceed_actions  = self._interval_exceed_action_min
+      elif (event & flags.INTERVAL_EVENT_EXCEED_MAX):
+         interval_exceed_actions  = self._interval_exceed_action_max
+      elif (event & flags.INTERVAL_EVENT_EXCEED_CRITICAL):
+         interval_exceed_actions  = self._interval_exceed_action_critical
+      else:
+         return None
+      
+      if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_NONE):
+         return None
+      
+      if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_NOTIFY):
+         self._notify(
+            event                  = event,
+            event_time             = self._clock_time,
+            event_description      = event_description,
+         )
+      
+      if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_TRIGGER_FORCE):
+         self._trigger_force      = True
+      
+      if (interval_exceed_actions & (
+           flags.INTERVAL_EXCEED_ACTION_ERROR_RAISE
+         | flags.INTERVAL_EXCEED_ACTION_HALT
+      )):
+         self._errors(
+            error_description      = descriptors.ERROR_INTERVAL_EXCEEDED,
+            combine                = True,
+         )
+         self._errors(
+            error_description      = event_description,
+            combine                = True,
+         )
+      
+      if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_ERROR_RAISE):
+         self._errors(
+            raisable               = True,
+         )
+      
+      if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_HALT):
+         self._modes(
+            mode                   = flags.MODE_NONE,
+         )
+      
+      return True
+   
+   def _errors (
+      self,
+      error_description = None,
+      reset             = False,
+      raisable          = None,
+      combine           = False,
+      finalize          = False,
+      return_raisable   = False,
+   ):
+      """Interact with system's error states, on event loop.
+      
+      Parameters
+      ----------
+      error_description : str, default=None
+         Description of error to be marked.
+      reset : bool, default=False
+         Reset errors' state.
+      raisable : bool, NoneType, default=None
+         Mark or unmark errors as raisable.
+      combine : bool, default=False
+         Combine specified error description with currently active ones.
+      finalize : bool, default=False
+         Finalize currently active errors, for final use, and return.
+      return_raisable : bool, default=False
+         Return raisable active errors, if exists.
+      
+      Returns
+      -------
+      NoneType
+         Return None if no errors or un-raisable errors during finalize.
+      Exception
+         Returns raisable Exception with current error state upon finalize.
+      bool
+         Returns errors' presence, else True.
+      """
+      
+      if (reset):
+         self._error_error       = False
+         self._error_raisable    = False
+         self._error_time        = 0.0
+         self._error_description = ''
+      elif (raisable is not None):
+         self._error_raisable    = bool(raisable)
+      elif (combine):
+         self._error_error       = True
+         self._error_time        = self._clock_time
+         self._error_description = (
+            app.libcommon.descriptoroperations.combine(
+               self._error_description,
+               error_description,
+            )
+         )
+      elif (finalize):
+         if (not self._error_error):
+            return None
+         
+         if (not (self._error_raisable or return_raisable)):
+            return None
+         
+         return (Exception((
+                 'ERROR:\n{0}\nValues:\n'
+              + 'clock_time: {1}\n'
+              + 'error_time: {2}\n'
+            ).format(
+               '\n'.join(
+                  app.libcommon.descriptoroperations.extract(
+                     self._error_description,
+                  )
+               ),
+               self._clock_time,
+               self._error_time,
+         )))
+      else:
+         return (self._error_error)
+      
+      return True
@@ -0,0 +1,10 @@
+from ..trigger.descriptors import Descriptors as _Descriptors
+
+class Descriptors (_Descriptors):
+   """Descriptors for asyncio trigger progress mechanism.
+   
+   Shares trigger progress mechanism's descriptors, so that either can be
+   interacted with alike.
+   """
+   
+   ERROR_LOOP_INVALID                   = 'error.loop.invalid'
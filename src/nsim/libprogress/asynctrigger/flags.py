@@ -0,0 +1,10 @@
+from ..trigger.flags import Flags as _Flags
+
+class Flags (_Flags):
+   """Flags for asyncio trigger progress mechanism.
+   
+   Shares trigger progress mechanism's flags (same values), so that either
+   can be configured alike.
+   """
+   
+   pass
@@ -1,9 +1,11 @@
 from .trigger import Trigger as trigger
+from .timingwheel import TimingWheel as timingwheel
 from .flags import Flags as flags
 from .descriptors import Descriptors as descriptors
 
 __all__ = [
    'trigger',
+   'timingwheel',
    'flags',
    'descriptors',
 ]
@@ -0,0 +1,601 @@
+"""Benchmark - trigger tick throughput.
+
+Measures trigger system's tick rate, per-tick latency percentiles, CPU usage
+and threads used, as number of bound functions, notification subscribers and
+blocking identifiers grows, for each execution mode. Bound functions run
+either on dedicated threads or on an executor (thread pool). Intervals are
+kept minimal, so that ticks are only limited by execution overhead; manual
+triggers are enqueued back-to-back by a driver thread.
+
+Results are printed as JSON (or as table), for tracking regressions. With
+--check, regression checks are run instead, exiting non-zero upon failure.
+
+Usage::
+   
+   python -m nsim.libprogress.trigger.bench
+   python -m nsim.libprogress.trigger.bench --modes auto --functions 10 100
+   python -m nsim.libprogress.trigger.bench --workers 0 8 --table
+   python -m nsim.libprogress.trigger.bench --check
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .trigger import Trigger as trigger
+from .timingwheel import TimingWheel as timingwheel
+from .flags import Flags as flags
+
+MODES = {
+   'auto'           : flags.MODE_AUTO,
+   'manual'         : flags.MODE_MANUAL,
+   'hybrid'         : flags.MODE_HYBRID,
+   'auto_virtual'   : flags.MODE_AUTO_VIRTUAL,
+   'hybrid_virtual' : flags.MODE_HYBRID_VIRTUAL,
+}
+
+def percentile (
+   values,
+   fraction,
+):
+   """Nearest-rank percentile of values.
+   
+   Parameters
+   ----------
+   values : list
+      Sorted values.
+   fraction : float
+      Percentile, as fraction (0.0 - 1.0).
+   
+   Returns
+   -------
+   float
+      Returns percentile, 0.0 if no values.
+   """
+   
+   if (not values):
+      return 0.0
+   
+   return values[min(
+      (len(values) - 1),
+      max(0, (int(round(fraction * len(values))) - 1)),
+   )]
+
+def measure (
+   functions        = 1,
+   executor_workers = 0,
+   duration         = 1.0,
+   mode             = flags.MODE_AUTO,
+   subscribers      = 0,
+   blockers         = 0,
+   interval         = 0.0001,
+):
+   """Measure trigger system's tick throughput for specified load.
+   
+   Binds as many no-op functions, registers as many no-op notification
+   subscribers, and runs as many blockers (threads waiting, blocking and
+   releasing on every tick with a fixed identifier), then activates trigger
+   system in mode for duration.
+   
+   Parameters
+   ----------
+   functions : int, default=1
+      Number of functions to bind.
+   executor_workers : int, default=0
+      Number of executor workers, zero for dedicated thread per function.
+   duration : int, float, default=1.0
+      Duration (wall time) to run trigger system for.
+   mode : int, default=flags.MODE_AUTO
+      Execution mode to run trigger system in.
+   subscribers : int, default=0
+      Number of notification subscribers to register.
+   blockers : int, default=0
+      Number of blocking identifiers.
+   interval : int, float, default=0.0001
+      Duration of trigger's pre-active and active states, and minimum.
+   
+   Returns
+   -------
+   dict
+      Returns ticks, ticks per second, per-tick latency percentiles (in ms),
+      CPU usage (in cores) and number of threads used.
+   """
+   
+   functions      = max(0, int(functions))
+   subscribers    = max(0, int(subscribers))
+   blockers       = max(0, int(blockers))
+   
+   event_stop     = threading.Event()
+   
+   def bound_function ():
+      pass
+   
+   def subscriber (**kwargs):
+      pass
+   
+   def blocker (identifier):
+      while (not event_stop.is_set()):
+         trigger_system.wait(identifier=identifier)
+         trigger_system.block(identifier=identifier)
+         trigger_system.release(identifier)
+   
+   def driver ():
+      while (not event_stop.is_set()):
+         trigger_system.trigger(
+            non_blocking   = False,
+            thread_timeout = duration,
+         )
+   
+   executor       = (
+      ThreadPoolExecutor(max_workers=executor_workers)
+      if (executor_workers > 0)
+      else
+      None
+   )
+   threads_before = threading.active_count()
+   
+   trigger_system = trigger(
+      mode                            = mode,
+      
+      interval_trigger_activation     = interval,
+      interval_trigger                = interval,
+      interval_min                    = interval,
+      interval_max                    = 1,
+      interval_critical               = 2,
+      interval_trigger_auto_add       = 3,
+      
+      clock_interval                  = 0.0001,
+      clock_step                      = 0.0001,
+      
+      interval_exceed_action_min      = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+      interval_exceed_action_max      = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+      interval_exceed_action_critical = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+      
+      executor                        = executor,
+      
+      stats_ticks                     = 1 << 20,
+      
+      debug_trace                     = False,
+   )
+   
+   for _ in range(functions):
+      trigger_system.trigger_bind(
+         trigger_bound_function = bound_function,
+      )
+   
+   for _ in range(subscribers):
+      trigger_system.notification_alert(
+         callback = subscriber,
+      )
+   
+   for index in range(blockers):
+      threading.Thread(
+         target = blocker,
+         args   = ('bench.blocker.{0}'.format(index),),
+         daemon = True,
+      ).start()
+   
+   trigger_system.mode(activate=True)
+   
+   thread_driver  = threading.Thread(
+      target = driver,
+      daemon = True,
+   )
+   
+   if (mode & flags.MODE_MANUAL):
+      thread_driver.start()
+   
+   ticks_start    = trigger_system.stats()['ticks']
+   cpu_start      = time.process_time()
+   time_start     = time.perf_counter()
+   
+   time.sleep(duration)
+   
+   threads        = threading.active_count() - threads_before
+   stats          = trigger_system.stats()
+   cpu            = time.process_time() - cpu_start
+   time_elapsed   = time.perf_counter() - time_start
+   
+   event_stop.set()
+   trigger_system.mode(activate=False)
+   
+   if (thread_driver.is_alive()):
+      thread_driver.join(timeout=duration)
+   
+   if (executor is not None):
+      executor.shutdown(wait=True)
+   
+   ticks          = stats['ticks'] - ticks_start
+   latencies      = sorted(
+      (tick['duration'] * 1000)
+      for tick in stats['history']
+      if (tick['tick'] >= ticks_start)
+   )
+   
+   return {
+      'ticks'       : ticks,
+      'ticks_per_s' : (ticks / time_elapsed),
+      'latency_ms'  : {
+         'p50'       : percentile(latencies, 0.50),
+         'p90'       : percentile(latencies, 0.90),
+         'p99'       : percentile(latencies, 0.99),
+         'max'       : (latencies[-1] if (latencies) else 0.0),
+      },
+      'cpu'         : (cpu / time_elapsed),
+      'threads'     : threads,
+   }
+
+def execute (
+   modes            = ('auto', 'manual', 'hybrid'),
+   functions        = (1, 10, 100),
+   subscribers      = (10, 100),
+   blockers         = (10, 100),
+   executor_workers = (0, 4),
+   duration         = 1.0,
+   table            = False,
+):
+   """Run benchmark and print results as JSON (or table).
+   
+   For each mode and engine, number of bound functions is swept with no
+   subscribers or blockers, then subscribers and blockers are swept (each
+   on its own) with a single bound function.
+   
+   Parameters
+   ----------
+   modes : tuple, list, default=('auto', 'manual', 'hybrid')
+      Execution modes to benchmark in (see MODES).
+   functions : tuple, list, default=(1, 10, 100)
+      Numbers of bound functions to benchmark with.
+   subscribers : tuple, list, default=(10, 100)
+      Numbers of notification subscribers to benchmark with.
+   blockers : tuple, list, default=(10, 100)
+      Numbers of blocking identifiers to benchmark with.
+   executor_workers : tuple, list, default=(0, 4)
+      Numbers of executor workers, zero for dedicated thread per function.
+   duration : int, float, default=1.0
+      Duration (wall time) of each measurement.
+   table : bool, default=False
+      Print results as table, instead of JSON ?
+   
+   Returns
+   -------
+   dict
+      Returns environment and list of results, each with its load.
+   """
+   
+   loads   = (
+        [(function_count, 0, 0) for function_count in functions]
+      + [(1, subscriber_count, 0) for subscriber_count in subscribers]
+      + [(1, 0, blocker_count) for blocker_count in blockers]
+   )
+   results = list()
+   
+   if (table):
+      print('{0:<15}{1:<10}{2:>10}{3:>12}{4:>10}{5:>12}{6:>10}{7:>10}'
+         '{8:>8}{9:>9}'.format(
+         'mode', 'engine', 'functions', 'subscribers', 'blockers',
+         'ticks/s', 'p50 (ms)', 'p99 (ms)', 'cpu', 'threads',
+      ))
+   
+   for mode in modes:
+      for workers in executor_workers:
+         for function_count, subscriber_count, blocker_count in loads:
+            result = measure(
+               functions        = function_count,
+               executor_workers = workers,
+               duration         = duration,
+               mode             = MODES[mode],
+               subscribers      = subscriber_count,
+               blockers         = blocker_count,
+            )
+            result = dict({
+               'mode'        : mode,
+               'engine'      : ('executor' if (workers) else 'thread'),
+               'workers'     : workers,
+               'functions'   : function_count,
+               'subscribers' : subscriber_count,
+               'blockers'    : blocker_count,
+            }, **result)
+            
+            results.append(result)
+            
+            if (table):
+               print('{0:<15}{1:<10}{2:>10}{3:>12}{4:>10}{5:>12.1f}{6:>10.3f}'
+                  '{7:>10.3f}{8:>8.2f}{9:>9}'.format(
+                  result['mode'],
+                  result['engine'],
+                  result['functions'],
+                  result['subscribers'],
+                  result['blockers'],
+                  result['ticks_per_s'],
+                  result['latency_ms']['p50'],
+                  result['latency_ms']['p99'],
+                  result['cpu'],
+                  result['threads'],
+               ))
+   
+   report  = {
+      'benchmark' : 'libprogress.trigger',
+      'python'    : platform.python_version(),
+      'platform'  : platform.platform(),
+      'duration'  : duration,
+      'results'   : results,
+   }
+   
+   if (not table):
+      json.dump(report, sys.stdout, indent=2)
+      print()
+   
+   return report
+
+def check_virtual (
+   duration = 1.0,
+):
+   """Check virtual tick rate, printing each measurement's result.
+   
+   Checks that virtual modes cut trigger states short once all waiters
+   (bound functions, re-entering waiting list with a persistent identifier,
+   and blockers) passed them, rather than sleeping through them: with
+   states of 50 ms, tick rate is to exceed five times the rate of sleeping
+   through active states alone.
+   
+   Parameters
+   ----------
+   duration : int, float, default=1.0
+      Duration (wall time) of each measurement.
+   
+   Returns
+   -------
+   bool
+      Returns True if all checks passed.
+   """
+   
+   interval = 0.05
+   passed   = True
+   
+   for mode in ('auto_virtual', 'hybrid_virtual'):
+      for workers, blocker_count in ((0, 0), (0, 2), (4, 0)):
+         result  = measure(
+            functions        = 2,
+            executor_workers = workers,
+            duration         = duration,
+            mode             = MODES[mode],
+            blockers         = blocker_count,
+            interval         = interval,
+         )
+         success = (result['ticks_per_s'] > (5 / interval))
+         passed  = passed and success
+         
+         print('{0:<6}virtual tick rate: {1:<15}workers {2:<3}blockers {3:<3}'
+            '{4:>10.1f} ticks/s'.format(
+            ('ok' if (success) else 'FAIL'),
+            mode,
+            workers,
+            blocker_count,
+            result['ticks_per_s'],
+         ))
+   
+   return passed
+
+def check_wheel (
+   timers = 2000,
+   seed   = 0,
+):
+   """Check timing wheel against a reference, printing each run's result.
+   
+   Randomly schedules (biased towards cascading units and beyond wheel's
+   span), cancels and advances, for several wheel configurations, checking
+   that each advance expires exactly timers due by then, in due order, as
+   a plain (unit due per timer) reference does. Timers scheduled in the
+   past are due upon next unit.
+   
+   Parameters
+   ----------
+   timers : int, default=2000
+      Number of timers to schedule per configuration.
+   seed : int, default=0
+      Seed of randomizer, for reproducible runs.
+   
+   Returns
+   -------
+   bool
+      Returns True if all runs matched reference.
+   """
+   
+   randomizer = random.Random(seed)
+   passed     = True
+   
+   for slots, levels in ((2, 1), (4, 3), (8, 4), (64, 2)):
+      wheel      = timingwheel(
+         resolution = 0.5,
+         slots      = slots,
+         levels     = levels,
+      )
+      bits       = slots.bit_length() - 1
+      span       = slots ** levels
+      reference  = dict()  # {
+                           #    key: [unit_due, handle],
+                           # }
+      unit       = 0
+      scheduled  = 0
+      mismatches = 0
+      
+      while (
+            (scheduled < timers)
+         or reference
+      ):
+         for _ in range(randomizer.randint(0, 4)):
+            if (scheduled >= timers):
+               break
+            
+            unit_due = unit + randomizer.randint(-2, (2 * span))
+            
+            # Rounded up to a cascading unit of a random level.
+            if (randomizer.random() < 0.5):
+               shift    = bits * randomizer.randint(1, levels)
+               unit_due = ((unit_due >> shift) + 1) << shift
+            
+            reference[scheduled] = [
+               max(unit_due, (unit + 1)),
+               wheel.schedule(
+                  time_due = (unit_due * 0.5),
+                  callback = None,
+                  args     = [scheduled],
+               ),
+            ]
+            
+            scheduled += 1
+         
+         if (
+                reference
+            and (randomizer.random() < 0.1)
+         ):
+            wheel.cancel(reference.pop(
+               randomizer.choice(tuple(reference))
+            )[1])
+         
+         unit    += randomizer.choice((
+            0,
+            1,
+            randomizer.randint(1, slots),
+            randomizer.randint(1, span),
+         ))
+         expired  = [
+            args[0]
+            for _, args, _ in wheel.advance(unit * 0.5)
+         ]
+         due      = [
+            key
+            for key, timer in reference.items()
+            if (timer[0] <= unit)
+         ]
+         
+         if (
+               (sorted(expired) != sorted(due))
+            or any(
+                  reference[key_previous][0]
+                > reference[key][0]
+               for key_previous, key in zip(expired, expired[1:])
+            )
+         ):
+            mismatches += 1
+         
+         for key in due:
+            reference.pop(key)
+         
+         if (wheel.pending() != len(reference)):
+            mismatches += 1
+            
+            break
+      
+      passed = passed and (not mismatches)
+      
+      print('{0:<6}timing wheel: slots {1:<4}levels {2:<3}{3:>6} timers, '
+         '{4} mismatches'.format(
+         ('ok' if (not mismatches) else 'FAIL'),
+         slots,
+         levels,
+         scheduled,
+         mismatches,
+      ))
+   
+   return passed
+
+def check (
+   duration = 1.0,
+):
+   """Run regression checks, printing each one's result.
+   
+   Parameters
+   ----------
+   duration : int, float, default=1.0
+      Duration (wall time) of each measurement.
+   
+   Returns
+   -------
+   bool
+      Returns True if all checks passed.
+   """
+   
+   passed_wheel   = check_wheel()
+   passed_virtual = check_virtual(duration=duration)
+   
+   return (
+          passed_wheel
+      and passed_virtual
+   )
+
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(
+      description='Benchmark trigger tick throughput.',
+   )
+   parser.add_argument(
+      '--modes',
+      nargs   = '+',
+      choices = list(MODES.keys()),
+      default = ['auto', 'manual', 'hybrid'],
+      help    = 'execution modes to benchmark in',
+   )
+   parser.add_argument(
+      '--functions',
+      nargs   = '+',
+      type    = int,
+      default = [1, 10, 100],
+      help    = 'numbers of bound functions to benchmark with',
+   )
+   parser.add_argument(
+      '--subscribers',
+      nargs   = '*',
+      type    = int,
+      default = [10, 100],
+      help    = 'numbers of notification subscribers to benchmark with',
+   )
+   parser.add_argument(
+      '--blockers',
+      nargs   = '*',
+      type    = int,
+      default = [10, 100],
+      help    = 'numbers of blocking identifiers to benchmark with',
+   )
+   parser.add_argument(
+      '--workers',
+      nargs   = '+',
+      type    = int,
+      default = [0, 4],
+      help    = 'executor workers, zero for dedicated thread per function',
+   )
+   parser.add_argument(
+      '--duration',
+      type    = float,
+      default = 1.0,
+      help    = 'duration (wall time) of each measurement, in seconds',
+   )
+   parser.add_argument(
+      '--table',
+      action  = 'store_true',
+      help    = 'print results as table, instead of JSON',
+   )
+   parser.add_argument(
+      '--check',
+      action  = 'store_true',
+      help    = 'run regression checks instead, exiting non-zero on failure',
+   )
+   parsed = parser.parse_args()
+   
+   if (parsed.check):
+      sys.exit(0 if (check(duration=parsed.duration)) else 1)
+   
+   execute(
+      modes            = parsed.modes,
+      functions        = parsed.functions,
+      subscribers      = parsed.subscribers,
+      blockers         = parsed.blockers,
+      executor_workers = parsed.workers,
+      duration         = parsed.duration,
+      table            = parsed.table,
+   )
@@ -6,6 +6,9 @@ class Descriptors:
    MODE_AUTO                            = 'mode.auto'
    MODE_MANUAL                          = 'mode.manual'
    MODE_HYBRID                          = 'mode.hybrid'
+   MODE_VIRTUAL                         = 'mode.virtual'
+   MODE_AUTO_VIRTUAL                    = 'mode.auto.virtual'
+   MODE_HYBRID_VIRTUAL                  = 'mode.hybrid.virtual'
    
    MODE_SET_UNSET                       = 'mode.set.unset'
    MODE_SET_SUCCESS                     = 'mode.set.success'
@@ -42,5 +45,18 @@ class Descriptors:
    )
    ERROR_CLOCK_INTERVAL_INVALID         = 'error.clock.interval.invalid'
    ERROR_CLOCK_STEP_INVALID             = 'error.clock.step.invalid'
+   ERROR_CLOCK_SPIN_INVALID             = 'error.clock.spin.invalid'
    ERROR_INTERVAL_EXCEEDED              = 'error.interval.exceeded'
    ERROR_INTERVALS_NOT_MONOTONIC        = 'error.intervals.not_monotonic'
+   ERROR_EXECUTOR_WORKERS_INVALID       = 'error.executor.workers.invalid'
+   ERROR_NOTIFY_WORKERS_INVALID         = 'error.notify.workers.invalid'
+   ERROR_STATS_TICKS_INVALID            = 'error.stats.ticks.invalid'
+   (
+      ERROR_INTERVAL_ADAPTIVE_BOUNDS_INVALID
+   )                                    = (
+      'error.interval.adaptive.bounds.invalid'
+   )
+   ERROR_DEBUG_CAPACITY_INVALID         = 'error.debug.capacity.invalid'
+   ERROR_DEBUG_SAMPLE_INVALID           = 'error.debug.sample.invalid'
+   ERROR_TIMER_WHEEL_INVALID            = 'error.timer.wheel.invalid'
+   ERROR_FUNCTION_BOUND_FAILED          = 'error.function.bound.failed'
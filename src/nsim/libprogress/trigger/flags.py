@@ -6,6 +6,9 @@ class Flags:
    MODE_AUTO                                          =   2
    MODE_MANUAL                                        =   4
    MODE_HYBRID                                        =   6
+   MODE_VIRTUAL                                       =   8
+   MODE_AUTO_VIRTUAL                                  =  10
+   MODE_HYBRID_VIRTUAL                                =  14
    
    INTERVAL_EXCEED_ACTION_NONE                        =   1
    INTERVAL_EXCEED_ACTION_IGNORE                      =   2
@@ -0,0 +1,358 @@
+from .descriptors import Descriptors as descriptors
+
+from itertools import count
+from threading import Lock
+
+class TimingWheel:
+   """Hierarchical timing wheel, for timers on progress mechanism's clock.
+   
+   Timers are kept in levels of slots (wheels), each level's slot spanning
+   all of previous level, so that any timer is inserted into (and cancelled
+   from) a single slot in O(1). Wheel is advanced to a time, upon which
+   timers due by then are expired, cascading timers of higher levels down
+   as their slots come due. Timers beyond span of all levels are parked in
+   farthest slot of last level, and re-cascaded until due.
+   Time is in units of wheel's resolution, timers due in between expire
+   upon next (later) unit.
+   
+   Attributes
+   ----------
+   _resolution : float
+      Duration of a single unit of wheel.
+   _bits : int
+      Bits of slots of each level.
+   _mask : int
+      Mask of slots of each level.
+   _levels : int
+      Number of levels.
+   _span : int
+      Units spanned by all levels.
+   _wheel : list
+      Levels of slots, each slot mapping handles of its timers.
+   _timers : dict
+      Pending timers, by handle.
+   _handles : count
+      Sequence of timer handles.
+   _unit : int
+      Unit wheel is advanced to.
+   _lock_wheel : Lock
+      Concurrency lock for _wheel, _timers and _unit.
+   
+   Methods
+   -------
+   __init__ (resolution, slots, levels)
+      Init timing wheel with specified configuration.
+   schedule ()
+      Schedule a timer, due at specified time.
+   cancel ()
+      Cancel a pending timer.
+   advance ()
+      Advance wheel to specified time, expiring timers due by then.
+   pending ()
+      Query number of pending timers.
+   """
+   
+   def __init__ (
+      self,
+      resolution,
+      slots      = 64,
+      levels     =  4,
+   ):
+      """Init timing wheel with specified configuration.
+      
+      Parameters
+      ----------
+      resolution : int, float
+         Duration of a single unit of wheel.
+      slots : int, default=64
+         Slots of each level, a power of two (at least 2).
+      levels : int, default=4
+         Number of levels, spanning slots ** levels units.
+      
+      Raises
+      ------
+      Exception
+         *  Non positive resolution.
+         *  Slots not a power of two, or non positive levels.
+      """
+      
+      self._resolution = abs(float(resolution))
+      
+      slots            = int(slots)
+      levels           = int(levels)
+      
+      if (not (
+         0
+         <  self._resolution
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'resolution: {1}\n'
+            ).format(
+               descriptors.ERROR_TIMER_WHEEL_INVALID,
+               self._resolution,
+         ))
+      elif (
+            (slots < 2)
+         or (slots & (slots - 1))
+         or (levels < 1)
+      ):
+         raise Exception((
+                 '{0}::\n'
+              + 'slots : {1}\n'
+              + 'levels: {2}\n'
+            ).format(
+               descriptors.ERROR_TIMER_WHEEL_INVALID,
+               slots,
+               levels,
+         ))
+      
+      self._bits       = slots.bit_length() - 1
+      self._mask       = slots - 1
+      self._levels     = levels
+      self._span       = 1 << (self._bits * levels)
+      
+      self._wheel      = [
+         [dict() for _ in range(slots)]
+         for _ in range(levels)
+      ]                                # [
+                                       #    [
+                                       #       { handle: None },
+                                       #    ],
+                                       # ]
+      self._timers     = dict()        # {
+                                       #    handle: [
+                                       #       unit_due,
+                                       #       callback,
+                                       #       args,
+                                       #       kwargs,
+                                       #       slot,
+                                       #    ],
+                                       # }
+      self._handles    = count(1)
+      self._unit       = 0
+      
+      self._lock_wheel = Lock()
+   
+   def _units (
+      self,
+      time_at,
+   ):
+      """Convert time to wheel's units, rounding down.
+      
+      Parameters
+      ----------
+      time_at : int, float
+         Time to convert.
+      
+      Returns
+      -------
+      int
+         Returns whole units elapsed by time.
+      """
+      
+      # Rounded first, so that float error never loses (or adds) a unit.
+      return int(round((time_at / self._resolution), 6) // 1)
+   
+   def _insert (
+      self,
+      handle,
+      timer,
+   ):
+      """Insert timer into slot of level spanning its remaining units.
+      
+      Expects _lock_wheel to be held.
+      
+      Parameters
+      ----------
+      handle : int
+         Timer's handle.
+      timer : list
+         Timer, as kept in _timers.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      unit_due = max(timer[0], (self._unit + 1))
+      units    = unit_due - self._unit
+      level    = 0
+      
+      while (
+             (level < (self._levels - 1))
+         and (units >> (self._bits * (level + 1)))
+      ):
+         level += 1
+      
+      if (units >= self._span):
+         unit_due = self._unit + self._span - 1
+      
+      timer[4] = self._wheel[level][
+         (unit_due >> (self._bits * level)) & self._mask
+      ]
+      timer[4][handle] = None
+      
+      return None
+   
+   def schedule (
+      self,
+      time_due,
+      callback,
+      args     = [],
+      kwargs   = {},
+   ):
+      """Schedule a timer, due at specified time.
+      
+      Parameters
+      ----------
+      time_due : int, float
+         Time timer is due at, expiring upon first advance at or past it.
+      callback : callable
+         Callback, to be returned upon expiry.
+      args : tuple, list, default=[]
+         Args to be supplied to callback.
+      kwargs : dict, default={}
+         Kwargs to be supplied to callback.
+      
+      Returns
+      -------
+      int
+         Returns timer's handle.
+      """
+      
+      unit_due = -(-round((time_due / self._resolution), 6) // 1)
+      handle   = next(self._handles)
+      timer    = [int(unit_due), callback, args, kwargs, None]
+      
+      self._lock_wheel.acquire()
+      
+      try:
+         self._timers[handle] = timer
+         
+         self._insert(handle, timer)
+      finally:
+         self._lock_wheel.release()
+      
+      return handle
+   
+   def cancel (
+      self,
+      handle,
+   ):
+      """Cancel a pending timer.
+      
+      Parameters
+      ----------
+      handle : int
+         Timer's handle.
+      
+      Returns
+      -------
+      bool
+         Returns False if timer is not pending (expired or cancelled).
+      """
+      
+      self._lock_wheel.acquire()
+      
+      try:
+         timer = self._timers.pop(handle, None)
+         
+         if (timer is None):
+            return False
+         
+         timer[4].pop(handle, None)
+      finally:
+         self._lock_wheel.release()
+      
+      return True
+   
+   def advance (
+      self,
+      time_now,
+   ):
+      """Advance wheel to specified time, expiring timers due by then.
+      
+      Units are visited one by one while timers are pending, cascading
+      timers of each level (highest first) whose slot comes due - expiring
+      those due on unit itself - then expiring timers of first level's slot.
+      Without pending timers, wheel jumps to time right away.
+      
+      Parameters
+      ----------
+      time_now : int, float
+         Time to advance wheel to, ignored if not past wheel's time.
+      
+      Returns
+      -------
+      list
+         Returns expired timers as [callback, args, kwargs], in due order.
+      """
+      
+      unit_now = self._units(time_now)
+      expired  = list()
+      
+      self._lock_wheel.acquire()
+      
+      try:
+         while (
+                (self._unit < unit_now)
+            and self._timers
+         ):
+            self._unit += 1
+            
+            unit       = self._unit
+            level      = 1
+            
+            while (
+                   (level < self._levels)
+               and (not (unit & ((1 << (self._bits * level)) - 1)))
+            ):
+               level  += 1
+            
+            for level in range((level - 1), 0, -1):
+               slot    = self._wheel[level][
+                  (unit >> (self._bits * level)) & self._mask
+               ]
+               
+               for handle in tuple(slot):
+                  slot.pop(handle)
+                  
+                  # Due on cascading unit itself, as insert defers to next.
+                  if (self._timers[handle][0] <= unit):
+                     expired.append(self._timers.pop(handle)[1:4])
+                     
+                     continue
+                  
+                  self._insert(handle, self._timers[handle])
+            
+            slot       = self._wheel[0][unit & self._mask]
+            
+            for handle in tuple(slot):
+               slot.pop(handle)
+               
+               # Parked beyond span (single level only), not yet due.
+               if (self._timers[handle][0] > unit):
+                  self._insert(handle, self._timers[handle])
+                  
+                  continue
+               
+               expired.append(self._timers.pop(handle)[1:4])
+         
+         self._unit    = max(self._unit, unit_now)
+      finally:
+         self._lock_wheel.release()
+      
+      return expired
+   
+   def pending (self):
+      """Query number of pending timers.
+      
+      Returns
+      -------
+      int
+         Returns number of pending timers.
+      """
+      
+      return len(self._timers)
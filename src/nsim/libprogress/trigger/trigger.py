@@ -1,13 +1,23 @@
 from .flags import Flags as flags
 from .descriptors import Descriptors as descriptors
+from .timingwheel import TimingWheel as timingwheel
 
 import time
+import json
+from itertools import count
+from collections import deque
 from threading import (
    Lock,
    Event,
    Thread,
+   Condition,
+   current_thread,
+)
+from concurrent.futures import ThreadPoolExecutor
+from functools import (
+   wraps,
+   partial,
 )
-from functools import wraps
 
 import nsim as app
 
@@ -19,6 +29,10 @@ class Trigger:
    
    Attributes
    ----------
+   trigger_shared : dict
+      Mapping of group names to trigger systems shared within those groups.
+   _lock_trigger_shared : Lock
+      Concurrency lock for trigger_shared.
    _interval_trigger_activation : int, float
       Trigger's pre-active duration.
    _interval_trigger : int, float
@@ -31,12 +45,22 @@ class Trigger:
       Duration after which critical exceed event is fired.
    _interval_trigger_auto_add : int, float
       Duration after which a new trigger is queued if no trigger exists.
+   _interval_adaptive : bool
+      Tune intervals to bound functions' measured duration per tick ?
+   _interval_adaptive_bounds : tuple
+      Bounds (lower, upper) for tuned minimum duration.
+   _interval_adaptive_ratios : tuple
+      Configured ratios of max, critical and auto add durations to minimum.
+   _interval_adaptive_estimate : float
+      Estimated duration (clock time) of bound functions per tick.
    _retries_trigger_auto_add : int
       Number of retries for auto trigger queuing before firing error event.
    _clock_interval : int, float
       Duration after which clock is updated.
    _clock_step : int, float
       Amount by which clock is updated.
+   _clock_spin : float
+      Duration before each clock update to spin (instead of sleep) for.
    _interval_exceed_action_min : int
       Exceed action for min interval exceed.
    _interval_exceed_action_max : int
@@ -45,10 +69,33 @@ class Trigger:
       Exceed action for critical interval exceed.
    _list_notification : dict
       List of callbacks registered for notification.
+   _list_notification_index : dict
+      Index of identifiers registered for notification, by event bit.
    _list_blocking : dict
       List of identifiers holding block for next trigger event.
    _list_waiting : list
       List of identifiers waiting for next trigger event.
+   _list_owner : list
+      List of owners holding system active, for shared systems.
+   _list_bound : dict
+      List of functions bound for execution on executor, upon each trigger.
+   _list_bound_thread : dict
+      Unbind events of functions bound on a dedicated thread each.
+   _executor : Executor, NoneType
+      Executor running bound functions, None for a dedicated thread each.
+   _executor_workers : int
+      Number of workers of executor, if inited by system.
+   _executor_owned : bool
+      Executor inited by system (not supplied), to be shut down by it ?
+   _executors_stopped : list
+      Executors inited by system, stopped upon deactivation, pending
+      shutdown.
+   _list_activated : list
+      List of waiting identifiers past pre-active trigger, in virtual mode.
+   _list_transit : list
+      List of identifiers past trigger, yet to block or wait, in virtual mode.
+   _list_passed : set
+      Set of identifiers past current trigger, in virtual mode.
    _mode : int
       Current execution mode.
    _mode_next : int, NoneType
@@ -66,9 +113,40 @@ class Trigger:
    _lock_list_blocking : Lock
       Concurrency lock for _list_blocking.
    _lock_list_waiting : Lock
-      Concurrency lock for _list_waiting.
+      Concurrency lock for _list_waiting, _list_activated, _list_transit and
+      _list_passed.
+   _lock_list_owner : Lock
+      Concurrency lock for _list_owner.
+   _lock_list_bound : Lock
+      Concurrency lock for _list_bound and _list_bound_thread.
    _lock_notify : Lock
       Concurrency lock for _nofify.
+   _condition_notify : Condition
+      Concurrency condition for _queue_notify and notification latency.
+   _queue_notify : deque
+      Queue of notification callbacks pending delivery by dispatchers.
+   _threads_notify : list
+      Persistent dispatcher threads delivering notification callbacks.
+   _threads_notify_stopped : list
+      Dispatcher threads stopped upon deactivation, pending join.
+   _notify_generation : int
+      Generation of dispatcher threads, advanced to stop them.
+   _notify_workers : int
+      Number of dispatcher threads.
+   _notify_latency : list
+      Dispatch latency (event to callback start) as count, total and max.
+   _lock_stats : Lock
+      Concurrency lock for per-tick metrics.
+   _stats_ticks : int
+      Number of ticks fired since init.
+   _stats_history : deque
+      Ring buffer of metrics for last (up-to stats_ticks) ticks.
+   _stats_current : dict
+      Metrics of tick in progress.
+   _stats_blocking : dict
+      Start time and label of blocks held, for block attribution.
+   _stats_time_reset : float
+      Instantaneous (perf_counter) time of last clock reset.
    _lock_trigger : Lock
       Concurrency lock for _trigger.
    _lock_trigger_event : Lock
@@ -77,6 +155,12 @@ class Trigger:
       Concurrency lock for _error.
    _lock_mode : Lock
       Concurrency lock for _mode.
+   _lock_mode_switch : Lock
+      Concurrency lock for mode switches, acquired before _lock_mode.
+   _mode_latency : list
+      Mode switch latency (request to completion) as count, total and max.
+   _condition_trigger : Condition
+      Concurrency condition, notified upon change of pre-trigger conditions.
    _event_trigger_activation : Event
       Concurrent event variable for pre-active trigger.
    _event_trigger_trigger : Event
@@ -93,14 +177,26 @@ class Trigger:
       Concurrent event variable for trigger flush.
    _event_clock_reset : Event
       Concurrent event variable for clock reset.
-   _thread_trigger : Thread
-      Thread of last active trigger.
+   _thread_trigger : Thread, NoneType
+      Persistent trigger worker, processing requested triggers, while active.
+   _trigger_worker_active : bool
+      Keep trigger worker running ?
+   _trigger_requested : int
+      Number of triggers requested (by clock, or manually) from worker.
+   _trigger_completed : int
+      Number of requested triggers processed (fired, flushed or dropped).
    _thread_clock : Thread
       Thread of active clock.
    _clock_time : int, float
       Current system time (elapsed) since last trigger.
+   _clock_epoch : float
+      System time accumulated until last clock reset.
+   _timer_wheel : TimingWheel
+      Timing wheel of scheduled timers, keyed on system time.
    _clock_active : bool
       Clock's state.
+   _clock_halt : bool
+      Halt requested by interval exceed action, pending on clock thread ?
    _error_error : bool
       Active errors.
    _error_raisable : bool
@@ -111,11 +207,37 @@ class Trigger:
       Description of active errors.
    _error_values : dict
       Active custom description for errors.
+   _debug_allow_log : bool
+      Record debug traces into log (ring buffer) ?
+   _debug_allow_trace : bool
+      Record debug traces ?
+   _debug_sample : int
+      Record one in every debug_sample debug traces.
+   _debug_sequence : count
+      Sequence of debug traces, including ones skipped by sampling.
+   _debug_data_log : deque
+      Ring buffer of last (up-to debug_capacity) logged debug traces.
+   _debug_data_trace : dict
+      Last debug trace, by originator.
+   _debug_data_origin_tracker : dict
+      Sequence of last logged debug trace, by originator.
+   _debug_sink : str, object, NoneType
+      File path (or writable file object) logged debug traces are drained to.
+   _debug_queue_sink : deque
+      Queue of logged debug traces pending drain to sink.
+   _event_debug_sink : Event
+      Concurrent event variable for debug traces pending drain to sink.
+   _thread_debug_sink : Thread, NoneType
+      Thread draining logged debug traces to sink, while active.
+   _debug_sink_active : bool
+      Drain to sink (else drain pending traces and stop) ?
    
    Methods
    -------
    __init__ (mode, **intervals, **clock_resolution, **exceed_actions)
       Init trigger system with specified configurations.
+   shared ()
+      Retrieve trigger system shared within group, init if not existing.
    state ()
       Interact with system's state.
    mode ()
@@ -126,24 +248,59 @@ class Trigger:
       Binds functions to system for automated execution, threading capable.
    _trigger_bind ()
       Binds functions to system for automated execution.
+   trigger_unbind ()
+      Unbinds function bound to system with specified identifier.
    _trigger_bind_execute ()
       Execute function with trigger operations.
+   _trigger_bind_iterate ()
+      Iterate function within a single trigger.
+   _trigger_bind_error ()
+      Record exception raised by bound function.
    wait ()
       Wait for next trigger event to occur.
    block ()
       Add a block preventing next trigger event, until released.
    release ()
       Release the block for next trigger event.
+   schedule ()
+      Schedule a callback, to be run within first tick after delay.
+   cancel ()
+      Cancel a scheduled callback.
    notify ()
       Send a manual notification alert to all registered receivers.
+   notify_latency ()
+      Query dispatch latency of notification alerts.
+   mode_latency ()
+      Query latency of mode switches.
+   stats ()
+      Query per-tick timing metrics, as a single snapshot.
+   intervals ()
+      Query system's intervals, as currently in use.
+   traces ()
+      Query logged debug traces, as a single snapshot.
    trigger_force ()
       Force activate next trigger, overriding active blocks.
    trigger_flush ()
       Flush queued triggers.
    trigger ()
       Manually enqueue a trigger.
+   _trigger_request ()
+      Request a trigger from trigger worker.
+   _trigger_wait ()
+      Wait for requested trigger to be processed by trigger worker.
+   _trigger_worker_start ()
+      Start persistent trigger worker, upon activation.
+   _trigger_worker_stop ()
+      Stop and join persistent trigger worker, upon deactivation.
+   _trigger_thread ()
+      Persistent trigger worker, processing requested triggers in order.
    """
    
+   trigger_shared       = dict() # {
+                                 #    group: trigger,
+                                 # }
+   _lock_trigger_shared = Lock()
+   
    def __init__ (
       self,
       
@@ -169,15 +326,36 @@ class Trigger:
          | flags.INTERVAL_EXCEED_ACTION_HALT
       ),
       
+      executor                        = None,
+      executor_workers                =  0,
+      
+      notify_workers                  =  1,
+      
+      stats_ticks                     = 256,
+      
+      interval_adaptive               = False,
+      interval_adaptive_bounds        = None,
+      
+      clock_spin                      =  0.0,
+      
+      timer_slots                     = 64,
+      timer_levels                    =  4,
+      
       debug_log                       = False,
       debug_trace                     = True,
+      debug_capacity                  = 1024,
+      debug_sample                    =  1,
+      debug_sink                      = None,
    ):
       """Init trigger system with specified configurations.
       
       Parameters
       ----------
       mode : int, default=flags.MODE_NONE
-         Mode to queue for next activation.
+         Mode to queue for next activation. Automatic modes can be combined
+         with MODE_VIRTUAL (see MODE_AUTO_VIRTUAL and MODE_HYBRID_VIRTUAL) to
+         run clock on virtual time, stepping it forward as soon as all blocks
+         are released instead of sleeping clock_interval.
       interval_trigger_activation : int, float, default=0.1
          Trigger's pre-active duration.
       interval_trigger : int, float, default=0.4
@@ -202,12 +380,71 @@ class Trigger:
          Exceed action for max interval exceed.
       interval_exceed_action_critical : int, default=(IGNORE|NOTIFY|HALT)
          Exceed action for critical interval exceed.
+      executor : Executor, NoneType, default=None
+         Executor to submit bound functions to upon each trigger, instead of
+         running a dedicated thread for each (see trigger_bind).
+      executor_workers : int, default=0
+         Number of workers for ThreadPoolExecutor to init, if no executor is
+         supplied. Zero for a dedicated thread for each bound function.
+         Each system inits its own pool, shared only by systems within a
+         group (see shared), else supply one executor to all systems. Pool
+         is shut down upon each deactivation (replaced by a new one, whose
+         threads start upon use), supplied executor never is.
+      notify_workers : int, default=1
+         Number of persistent dispatcher threads delivering non-blocking
+         notification alerts (see notification_alert). With a single one,
+         callbacks are delivered one at a time, in order, so that a slow
+         callback delays others; raise for concurrent delivery. Dispatchers
+         are stopped and joined upon deactivation.
+      stats_ticks : int, default=256
+         Number of last ticks to retain metrics for (see stats).
+      interval_adaptive : bool, default=False
+         Tune intervals upon each tick to bound functions' measured duration,
+         keeping tick rate as high as possible without exceeding max interval
+         (see _interval_adapt). Configured intervals are used as start, and
+         their ratios are retained. Ignored in virtual mode. Duration is
+         measured as blocks held by bound functions, so that these are to
+         block for their actual work (e.g. iterations until idle), as non
+         blocking passes tune intervals down to lower bound.
+      interval_adaptive_bounds : tuple, list, NoneType, default=None
+         Bounds (lower, upper) for tuned minimum duration, None for
+         (interval_trigger_activation, interval_critical).
+      clock_spin : int, float, default=0.0
+         Duration before each clock update to spin (yielding) for, instead
+         of sleeping, for clock intervals finer than sleep's granularity
+         (sub-millisecond). Use clock_interval or more to spin throughout.
+      timer_slots : int, default=64
+         Slots of each level of timing wheel backing schedule, a power of
+         two. Wheel's resolution is clock_step.
+      timer_levels : int, default=4
+         Levels of timing wheel, spanning timer_slots ** timer_levels steps.
+      debug_log : bool, default=False
+         Record debug traces into log, a ring buffer (see traces) ?
+      debug_trace : bool, default=True
+         Record debug traces (last one per originator) ?
+      debug_capacity : int, default=1024
+         Number of last debug traces to retain in log.
+      debug_sample : int, default=1
+         Record one in every debug_sample debug traces, 1 for all.
+      debug_sink : str, object, NoneType, default=None
+         File path (or writable file object) to drain logged debug traces to,
+         as JSON lines, from a dedicated thread while system is active. File
+         path is opened upon activation and closed upon deactivation. Traces
+         not yet drained when more than debug_capacity are pending are
+         dropped.
       
       Raises
       ------
       Exception
          *  Non positive intervals.
          *  Non increasing intervals.
+         *  Negative executor workers.
+         *  Non positive notify workers.
+         *  Non positive stats ticks.
+         *  Adaptive bounds not increasing from interval_trigger_activation.
+         *  Negative clock spin.
+         *  Non positive debug capacity or sample.
+         *  Timer slots not a power of two, or non positive timer levels.
       """
       
       self._interval_trigger_activation     = abs(float(
@@ -227,6 +464,24 @@ class Trigger:
       
       self._clock_interval                  = abs(float(clock_interval))
       self._clock_step                      = abs(float(clock_step))
+      self._clock_spin                      = float(clock_spin)
+      
+      executor_workers                      = int(executor_workers)
+      notify_workers                        = int(notify_workers)
+      stats_ticks                           = int(stats_ticks)
+      debug_capacity                        = int(debug_capacity)
+      debug_sample                          = int(debug_sample)
+      
+      if (interval_adaptive_bounds is None):
+         interval_adaptive_bounds           = (
+            self._interval_trigger_activation,
+            self._interval_critical,
+         )
+      
+      interval_adaptive_bounds              = tuple(
+         abs(float(interval_adaptive_bound))
+         for interval_adaptive_bound in interval_adaptive_bounds
+      )
       
       if (not (
          0
@@ -298,6 +553,121 @@ class Trigger:
                descriptors.ERROR_CLOCK_STEP_INVALID,
                self._clock_step,
          ))
+      elif (not (
+         0
+         <= self._clock_spin
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'clock_spin: {1}\n'
+            ).format(
+               descriptors.ERROR_CLOCK_SPIN_INVALID,
+               self._clock_spin,
+         ))
+      elif (not (
+         0
+         <= executor_workers
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'executor_workers: {1}\n'
+            ).format(
+               descriptors.ERROR_EXECUTOR_WORKERS_INVALID,
+               executor_workers,
+         ))
+      elif (not (
+         0
+         <  notify_workers
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'notify_workers: {1}\n'
+            ).format(
+               descriptors.ERROR_NOTIFY_WORKERS_INVALID,
+               notify_workers,
+         ))
+      elif (not (
+         0
+         <  stats_ticks
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'stats_ticks: {1}\n'
+            ).format(
+               descriptors.ERROR_STATS_TICKS_INVALID,
+               stats_ticks,
+         ))
+      elif (
+            (len(interval_adaptive_bounds) != 2)
+         or (not (
+            self._interval_trigger_activation
+            <= interval_adaptive_bounds[0]
+            <= interval_adaptive_bounds[1]
+         ))
+      ):
+         raise Exception((
+                 '{0}::\n'
+              + 'interval_trigger_activation: {1}\n'
+              + 'interval_adaptive_bounds   : {2}\n'
+            ).format(
+               descriptors.ERROR_INTERVAL_ADAPTIVE_BOUNDS_INVALID,
+               self._interval_trigger_activation,
+               interval_adaptive_bounds,
+         ))
+      elif (not (
+         0
+         <  debug_capacity
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'debug_capacity: {1}\n'
+            ).format(
+               descriptors.ERROR_DEBUG_CAPACITY_INVALID,
+               debug_capacity,
+         ))
+      elif (not (
+         0
+         <  debug_sample
+      )):
+         raise Exception((
+                 '{0}::\n'
+              + 'debug_sample: {1}\n'
+            ).format(
+               descriptors.ERROR_DEBUG_SAMPLE_INVALID,
+               debug_sample,
+         ))
+      
+      self._interval_adaptive               = bool(interval_adaptive)
+      self._interval_adaptive_bounds        = interval_adaptive_bounds
+      self._interval_adaptive_ratios        = (
+         (self._interval_max              / self._interval_min),
+         (self._interval_critical         / self._interval_min),
+         (self._interval_trigger_auto_add / self._interval_min),
+      )
+      self._interval_adaptive_estimate      = 0.0
+      
+      self._timer_wheel                     = timingwheel(
+         resolution = self._clock_step,
+         slots      = timer_slots,
+         levels     = timer_levels,
+      )
+      
+      self._executor_workers                = executor_workers
+      self._executor_owned                  = (
+             (executor is None)
+         and bool(executor_workers)
+      )
+      self._executors_stopped               = list()
+      
+      if (executor is not None):
+         self._executor                     = executor
+      elif (executor_workers):
+         self._executor                     = ThreadPoolExecutor(
+            max_workers        = executor_workers,
+            thread_name_prefix = 'libprogress.trigger',
+         )
+      else:
+         self._executor                     = None
       
       self._interval_exceed_action_min      = interval_exceed_action_min
       self._interval_exceed_action_max      = interval_exceed_action_max
@@ -310,6 +680,11 @@ class Trigger:
                                                      #       callback,
                                                      #    ],
                                                      # }
+      self._list_notification_index         = dict() # {
+                                                     #    event: {
+                                                     #       id: None,
+                                                     #    },
+                                                     # }
       self._list_blocking                   = dict() # {
                                                      #    id: times_retain
                                                      #           # -1 : ULD
@@ -318,12 +693,49 @@ class Trigger:
                                                      #    id,
                                                      #    id,
                                                      # ]
+      self._list_activated                  = list() # [
+                                                     #    id,
+                                                     #    id,
+                                                     # ]
+      self._list_transit                    = list() # [
+                                                     #    id,
+                                                     #    id,
+                                                     # ]
+      self._list_passed                     = set()  # {
+                                                     #    id,
+                                                     #    id,
+                                                     # }
+      self._list_owner                      = list() # [
+                                                     #    owner,
+                                                     #    owner,
+                                                     # ]
+      self._list_bound                      = dict() # {
+                                                     #    id: [
+                                                     #       function,
+                                                     #       args,
+                                                     #       kwargs,
+                                                     #       times_retain,
+                                                     #       times_recurse,
+                                                     #                # -1 : ULD
+                                                     #       future,
+                                                     #       unbound, # Event
+                                                     #       generated,
+                                                     #       iterations,
+                                                     #                # -1 : ULD
+                                                     #       until_idle,
+                                                     #    ],
+                                                     # }
+      self._list_bound_thread               = dict() # {
+                                                     #    id: unbound, # Event
+                                                     # }
       
       if (mode not in (
          flags.MODE_NONE,
          flags.MODE_AUTO,
          flags.MODE_MANUAL,
          flags.MODE_HYBRID,
+         flags.MODE_AUTO_VIRTUAL,
+         flags.MODE_HYBRID_VIRTUAL,
       )):
          mode = flags.MODE_NONE
       
@@ -339,13 +751,54 @@ class Trigger:
       self._lock_list_notification          = Lock()
       self._lock_list_blocking              = Lock()
       self._lock_list_waiting               = Lock()
+      self._lock_list_owner                 = Lock()
+      self._lock_list_bound                 = Lock()
       self._lock_notify                     = Lock()
       self._lock_trigger                    = Lock()
       self._lock_trigger_event              = Lock()
       self._lock_error                      = Lock()
       self._lock_mode                       = Lock()
-      self._lock_debug_log                  = Lock()
-      self._lock_debug_trace                = Lock()
+      self._lock_mode_switch                = Lock()
+      
+      self._condition_trigger               = Condition(Lock())
+      self._condition_notify                = Condition(Lock())
+      
+      self._queue_notify                    = deque() # [
+                                                      #    [
+                                                      #       callback,
+                                                      #       kwargs,
+                                                      #       event_time,
+                                                      #       batch,
+                                                      #    ],
+                                                      # ]
+      self._threads_notify                  = list()
+      self._threads_notify_stopped          = list()
+      self._notify_generation               = 0
+      self._notify_workers                  = notify_workers
+      self._notify_latency                  = [0, 0.0, 0.0] # [
+                                                            #    count,
+                                                            #    total,
+                                                            #    max,
+                                                            # ]
+      
+      self._lock_stats                      = Lock()
+      
+      self._stats_ticks                     = 0
+      self._stats_history                   = deque(maxlen=stats_ticks)
+      self._stats_current                   = self._stats_tick_new(0)
+      self._stats_blocking                  = dict() # {
+                                                     #    id: [
+                                                     #       time_start,
+                                                     #       label,
+                                                     #    ],
+                                                     # }
+      self._stats_time_reset                = time.perf_counter()
+      
+      self._mode_latency                    = [0, 0.0, 0.0] # [
+                                                            #    count,
+                                                            #    total,
+                                                            #    max,
+                                                            # ]
       
       self._event_trigger_activation        = Event()
       self._event_trigger_trigger           = Event()
@@ -355,33 +808,42 @@ class Trigger:
       self._event_interval_trigger_force    = Event()
       self._event_interval_trigger_flush    = Event()
       self._event_clock_reset               = Event()
+      self._event_debug_sink                = Event()
       
       self._debug_allow_log                 = bool(debug_log)
       self._debug_allow_trace               = bool(debug_trace)
+      self._debug_sample                    = debug_sample
+      self._debug_sequence                  = count()
       
-      self._debug_data_log                  = list()  # [
-                                                      #    trace,
-                                                      #    trace,
-                                                      # ]
+      self._debug_data_log                  = deque(maxlen=debug_capacity)
       self._debug_data_trace                = dict()  # {
                                                       #    originator:
                                                       #       trace,
                                                       # }
       self._debug_data_origin_tracker       = dict()  # {
-                                                      #    originator: [
-                                                      #       log.index,
-                                                      #       log.index,
-                                                      #    ],
+                                                      #    originator:
+                                                      #       sequence,
                                                       # }
       
+      self._debug_sink                      = debug_sink
+      self._debug_queue_sink                = deque(maxlen=debug_capacity)
+      self._thread_debug_sink               = None
+      self._debug_sink_active               = False
+      
       self._debug_notify                    = None
       self._debug_trigger                   = None
       
       self._thread_trigger                  = None
       self._thread_clock                    = None
       
+      self._trigger_worker_active           = False
+      self._trigger_requested               = 0
+      self._trigger_completed               = 0
+      
       self._clock_time                      = 0.0
+      self._clock_epoch                     = 0.0
       self._clock_active                    = False
+      self._clock_halt                      = False
       
       self._error_error                     = False
       self._error_raisable                  = False
@@ -455,6 +917,47 @@ class Trigger:
                   multiple times
       '''
    
+   @classmethod
+   def shared (
+      cls,
+      group = 'default',
+       *args,
+      **kwargs,
+   ):
+      """Retrieve trigger system shared within group, init if not existing.
+      
+      Lets many users (like basesockets) drive their functions off a single
+      trigger system - one clock, in-sync triggers and one set of threads for
+      the whole group - instead of one system each.
+      Configuration is only used upon init, i.e. first retrieval for group.
+      Users are expected to activate and deactivate shared system through
+      state with owner set, so that it is kept active while any owner is.
+      
+      Parameters
+      ----------
+      group : object, default='default'
+         Group (hashable) within which trigger system is shared.
+      args : list
+         Configuration for trigger system's init as args.
+      kwargs : dict
+         Configuration for trigger system's init as kwargs.
+      
+      Returns
+      -------
+      Trigger
+         Returns trigger system shared within group.
+      """
+      
+      cls._lock_trigger_shared.acquire()
+      
+      try:
+         if (group not in cls.trigger_shared):
+            cls.trigger_shared[group] = cls(*args, **kwargs)
+         
+         return cls.trigger_shared[group]
+      finally:
+         cls._lock_trigger_shared.release()
+   
    def _identifier_validate (
       self,
       identifier      = None,
@@ -520,9 +1023,15 @@ class Trigger:
       errors         = False,
       errors_raise   = False,
       describe       = True,
+      owner          = None,
    ):
       """Interact with system's state.
       
+      Activation and deactivation on behalf of an owner are reference counted,
+      for shared systems - system is activated by first owner (if inactive)
+      and deactivated only by last one, others merely register or unregister
+      themselves. Without owner, system is activated or deactivated anyway.
+      
       Parameters
       ----------
       activate : bool, NoneType, default=None
@@ -539,6 +1048,8 @@ class Trigger:
          Surface active errors along with raisable ones ?
       describe : bool, default=True
          Describe system state using descriptors ?
+      owner : object, NoneType, default=None
+         Owner on whose behalf system is to be activated or deactivated.
       
       Raises
       ------
@@ -562,30 +1073,50 @@ class Trigger:
          )
       
       if (activate is not None):
-         self.mode(
-            activate        = bool(activate),
-         )
+         self._lock_list_owner.acquire()
+         
+         try:
+            owners         = [
+               owner_active
+               for owner_active in self._list_owner
+               if (
+                      (owner_active is not owner)
+                  and (activate or (owner is not None))
+               )
+            ]
+            
+            if (
+                   activate
+               and (owner is not None)
+            ):
+               owners.append(owner)
+            
+            if (
+                  (owner is None)
+               or (activate and (not self._active))
+               or ((not activate) and (not owners))
+            ):
+               self.mode(
+                  activate  = bool(activate),
+               )
+            
+            self._list_owner = owners
+         finally:
+            self._lock_list_owner.release()
          
          error_raisable    = self._errors(
             finalize        = True,
             return_raisable = errors_raise,
          )
       elif (reactivate):
-         mode              = self.modes()
-         
-         self.mode(
-            activate        = False,
-            non_blocking    = non_blocking,
-            thread_timeout  = thread_timeout,
-         )
-         
          error_raisable    = self._errors(
             finalize        = True,
             return_raisable = errors_raise,
          )
          
+         # Deactivates (if active) and activates, as a single switch.
          self.mode(
-            mode            = mode,
+            mode            = self.mode(describe=False),
             activate        = True,
             non_blocking    = non_blocking,
             thread_timeout  = thread_timeout,
@@ -622,6 +1153,12 @@ class Trigger:
    ):
       """Interact with system's operation mode.
       
+      Switches run synchronously on caller's thread (see _modes_switch), or
+      in non-blocking mode on a single helper thread, performing both
+      deactivation and activation in order when re-activating. Switches
+      requested from system's own clock or trigger threads always use helper
+      thread, as they join those.
+      
       Parameters
       ----------
       mode : int, NoneType, default=None
@@ -629,9 +1166,9 @@ class Trigger:
       activate : bool, NoneType, default=None
          Set True or False to activate or deactivate execution mode.
       non_blocking : bool, default=False
-         Run current interaction in non-blocking mode ?
+         Run current interaction in non-blocking mode (on helper thread) ?
       thread_timeout : int, float, NoneType, default=None
-         Thread timeout if running in blocking mode.
+         Unused, accepted for compatibility.
       describe : bool, default=True
          Describe system mode using descriptors ?
       ignore_active : bool, default=True
@@ -652,139 +1189,323 @@ class Trigger:
          flags.MODE_AUTO,
          flags.MODE_MANUAL,
          flags.MODE_HYBRID,
+         flags.MODE_AUTO_VIRTUAL,
+         flags.MODE_HYBRID_VIRTUAL,
       )):
          mode = None
       
       if (mode is not None):
          self._mode_next     = mode
       
-      mode_thread            = None
-      
-      if (activate):
-         '''
+      if (activate is not None):
          if (
-                (mode is not None)
-            and (self._active)
+                (not non_blocking)
+            and (current_thread() not in (
+               self._thread_clock,
+               self._thread_trigger,
+            ))
          ):
-         '''
-         if (self._active):
-            '''
-            self.mode(
-               activate       = False,
-               non_blocking   = non_blocking,
-               thread_timeout = thread_timeout,
+            self._modes_switch(
+               activate       = bool(activate),
             )
-            
-            self._mode_next  = mode
-            '''
-            
+         else:
             Thread(
-               target            = self._modes,
-               kwargs            = {
-                  'mode'          : flags.MODE_NONE,
+               target         = self._modes_switch,
+               kwargs         = {
+                  'activate'   : bool(activate),
                },
-               daemon            = False,
+               daemon         = False,
             ).start()
          
-         mode_thread         = Thread(
-            target            = self._modes,
-            kwargs            = {
-               'mode'          : (mode or None), # self._mode_next,
-            },
-            daemon            = False,
-         )
-         
-         mode_thread.start()
-      elif (activate is False):
-         '''
-         if (mode is None):
-            self._mode_next  = self._mode
-         elif (mode is not None):
-            self._mode_next  = mode
-         '''
-         
-         mode_thread         = Thread(
-            target            = self._modes,
-            kwargs            = {
-               'mode'          : flags.MODE_NONE,
-            },
-            daemon            = False,
-         )
-         
-         mode_thread.start()
-      else:
-         mode                = self._mode
-         
-         if (
-                 ignore_active
-            and (not self._active)
-         ):
-            mode             = self._mode_next
+         return True
+      
+      mode                   = self._mode
+      
+      if (
+              ignore_active
+         and (not self._active)
+      ):
+         mode                = self._mode_next
+      
+      if (describe):
+         if (mode           == flags.MODE_NONE):
+            mode             = descriptors.MODE_NONE
+         elif (mode         == flags.MODE_AUTO):
+            mode             = descriptors.MODE_AUTO
+         elif (mode         == flags.MODE_MANUAL):
+            mode             = descriptors.MODE_MANUAL
+         elif (mode         == flags.MODE_HYBRID):
+            mode             = descriptors.MODE_HYBRID
+         elif (mode         == flags.MODE_AUTO_VIRTUAL):
+            mode             = descriptors.MODE_AUTO_VIRTUAL
+         elif (mode         == flags.MODE_HYBRID_VIRTUAL):
+            mode             = descriptors.MODE_HYBRID_VIRTUAL
+         else:
+            mode             = descriptors.MODE_SET_UNSET
+      elif (mode is None):
+         mode                = flags.MODE_NONE
+      
+      return mode
+   
+   def _modes_switch (
+      self,
+      activate  = True,
+      lock_wait = True,
+   ):
+      """Switch system's operation mode, synchronously.
+      
+      Holds _lock_mode_switch throughout (before _lock_mode), so that
+      concurrent switches never interleave, and resolves target mode (queued
+      next mode) upfront. Re-activation, while active, deactivates first,
+      unless both modes are automatic, in which case running clock thread is
+      reused by restarting its cycle (see _modes_restart). Switch latency is
+      recorded (see mode_latency).
+      
+      Parameters
+      ----------
+      activate : bool, default=True
+         Activate queued next mode, else deactivate ?
+      lock_wait : bool, default=True
+         Wait for concurrent switch, else give up ?
+      
+      Returns
+      -------
+      NoneType
+         Returns None if given up upon concurrent switch.
+      bool
+         Returns switch's success.
+      """
+      
+      time_start     = time.perf_counter()
+      
+      if (not self._lock_mode_switch.acquire(blocking=lock_wait)):
+         return None
+      
+      try:
+         mode        = self._mode_next
          
-         if (describe):
-            if (mode        == flags.MODE_NONE):
-               mode          = descriptors.MODE_NONE
-            elif (mode      == flags.MODE_AUTO):
-               mode          = descriptors.MODE_AUTO
-            elif (mode      == flags.MODE_MANUAL):
-               mode          = descriptors.MODE_MANUAL
-            elif (mode      == flags.MODE_HYBRID):
-               mode          = descriptors.MODE_HYBRID
-            else:
-               mode          = descriptors.MODE_SET_UNSET
-         elif (mode is None):
-            mode             = flags.MODE_NONE
+         if (not activate):
+            result   = self._modes(mode=flags.MODE_NONE)
+         elif (not self._active):
+            result   = self._modes(mode=mode)
+         elif (self._modes_restart(mode=mode)):
+            result   = True
+         else:
+            self._modes(mode=flags.MODE_NONE)
+            
+            result   = self._modes(mode=mode)
          
-         return mode
+         self._mode_latency_record(time.perf_counter() - time_start)
+      finally:
+         self._lock_mode_switch.release()
       
-      if (mode_thread):
-         if (not non_blocking):
-            mode_thread.join(timeout=thread_timeout)
+      self._notify_join()
+      self._executor_shutdown()
       
-      return True
+      return result
    
-   def _modes (
+   def _modes_restart (
       self,
-      mode=flags.MODE_NONE,
+      mode = flags.MODE_AUTO,
    ):
-      """Switch system's operation mode.
+      """Switch between automatic modes, reusing running clock thread.
       
-      Performs switch operation only if the target mode is not active.
-      Can only switch to/from MODE_NONE to any other mode.
+      Flushes pending trigger (as deactivation does), but keeps clock thread
+      running, then switches mode and resets clock, so that clock thread
+      starts a new cycle (and trigger) right away in switched mode.
       
       Parameters
       ----------
-      mode : int, NoneType, default=flags.MODE_NONE
-         Execution mode, to switch to. Use None to switch to next queued mode.
+      mode : int, default=flags.MODE_AUTO
+         Automatic execution mode, to switch to.
       
       Returns
       -------
       bool
-         Returns switch's success.
+         Returns False if either mode is not automatic or clock is not
+         running (nothing done), else True.
       """
       
       self._lock_mode.acquire()
       
-      if (mode not in (
-         flags.MODE_NONE,
-         flags.MODE_AUTO,
-         flags.MODE_MANUAL,
-         flags.MODE_HYBRID,
-      )):
-         mode = None
+      try:
+         if (
+               (mode not in (
+                  flags.MODE_AUTO,
+                  flags.MODE_HYBRID,
+                  flags.MODE_AUTO_VIRTUAL,
+                  flags.MODE_HYBRID_VIRTUAL,
+               ))
+            or (not self._active)
+            or (not (self._mode & flags.MODE_AUTO))
+            or (not self._clock_active)
+            or (self._thread_clock is None)
+            or (not self._thread_clock.is_alive())
+         ):
+            return False
+         
+         self._event_trigger_pre_min_force.clear()
+         self._trigger_wake(self._event_trigger_pre_min_flush)
+         
+         self._event_interval_trigger_force.clear()
+         self._trigger_wake(self._event_interval_trigger_flush)
+         
+         self._trigger_wait(self._trigger_requested)
+         
+         self._errors(
+            reset = True,
+         )
+         self._trigger_events(
+            reset = True,
+         )
+         
+         self._event_trigger_activation.clear()
+         self._event_trigger_trigger.clear()
+         
+         self._event_trigger_pre_min_force.clear()
+         self._event_trigger_pre_min_flush.clear()
+         
+         self._event_interval_trigger_force.clear()
+         self._event_interval_trigger_flush.clear()
+         
+         self._event_interval_trigger.clear()
+         
+         self._lock_list_waiting.acquire()
+         
+         try:
+            self._list_activated.clear()
+            self._list_transit.clear()
+            self._list_passed.clear()
+         finally:
+            self._lock_list_waiting.release()
+         
+         self._mode_next             = self._mode
+         self._mode                  = mode
+         self._clock_halt            = False
+         
+         self._event_clock_reset.set()
+         
+         self._trigger_wake(self._event_trigger_pre_min_force)
+         self._trigger_wake(self._event_interval_trigger_force)
+      finally:
+         self._lock_mode.release()
       
-      if (mode is None):
-         mode = self._mode_next
+      return True
+   
+   def _mode_latency_record (
+      self,
+      latency,
+   ):
+      """Account latency of a mode switch.
+      
+      Parameters
+      ----------
+      latency : float
+         Switch's duration (s).
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._lock_stats.acquire()
       
       try:
-         if (mode not in (
-            flags.MODE_NONE,
-            flags.MODE_AUTO,
-            flags.MODE_MANUAL,
-            flags.MODE_HYBRID,
-         )):
-            return False
-         elif (mode           != self._mode):
+         self._mode_latency[0] += 1
+         self._mode_latency[1] += latency
+         self._mode_latency[2]  = max(self._mode_latency[2], latency)
+      finally:
+         self._lock_stats.release()
+      
+      return None
+   
+   def mode_latency (
+      self,
+      reset = False,
+   ):
+      """Query latency of mode switches.
+      
+      Latency is measured from switch request to its completion, including
+      wait for concurrent switches.
+      
+      Parameters
+      ----------
+      reset : bool, default=False
+         Reset counters after query ?
+      
+      Returns
+      -------
+      dict
+         Returns latency as:
+         
+         *  count : switches performed.
+         *  mean : mean latency (s).
+         *  max : maximum latency (s).
+      """
+      
+      self._lock_stats.acquire()
+      
+      try:
+         count, total, maximum = self._mode_latency
+         
+         if (reset):
+            self._mode_latency = [0, 0.0, 0.0]
+      finally:
+         self._lock_stats.release()
+      
+      return {
+         'count' : count,
+         'mean'  : ((total / count) if (count) else 0.0),
+         'max'   : maximum,
+      }
+   
+   def _modes (
+      self,
+      mode=flags.MODE_NONE,
+   ):
+      """Switch system's operation mode.
+      
+      Performs switch operation only if the target mode is not active.
+      Can only switch to/from MODE_NONE to any other mode.
+      
+      Parameters
+      ----------
+      mode : int, NoneType, default=flags.MODE_NONE
+         Execution mode, to switch to. Use None to switch to next queued mode.
+      
+      Returns
+      -------
+      bool
+         Returns switch's success.
+      """
+      
+      self._lock_mode.acquire()
+      
+      if (mode not in (
+         flags.MODE_NONE,
+         flags.MODE_AUTO,
+         flags.MODE_MANUAL,
+         flags.MODE_HYBRID,
+         flags.MODE_AUTO_VIRTUAL,
+         flags.MODE_HYBRID_VIRTUAL,
+      )):
+         mode = None
+      
+      if (mode is None):
+         mode = self._mode_next
+      
+      try:
+         if (mode not in (
+            flags.MODE_NONE,
+            flags.MODE_AUTO,
+            flags.MODE_MANUAL,
+            flags.MODE_HYBRID,
+            flags.MODE_AUTO_VIRTUAL,
+            flags.MODE_HYBRID_VIRTUAL,
+         )):
+            return False
+         elif (mode           != self._mode):
             if (mode          == flags.MODE_NONE):
                self._mode_next = self._mode
                
@@ -792,41 +1513,33 @@ class Trigger:
                   self._clock_active    = False
                   
                   self._event_trigger_pre_min_force.clear()
-                  self._event_trigger_pre_min_flush.set()
+                  self._trigger_wake(self._event_trigger_pre_min_flush)
                   
                   self._event_interval_trigger_force.clear()
-                  self._event_interval_trigger_flush.set()
+                  self._trigger_wake(self._event_interval_trigger_flush)
                   
                   try:
                      self._thread_clock.join()
                   except:
                      pass
                   
-                  try:
-                     self._thread_trigger.join()
-                  except:
-                     pass
+                  self._trigger_worker_stop()
                   
                   self._event_trigger_pre_min_flush.clear()
                   self._event_interval_trigger_flush.clear()
                   self._event_clock_reset.clear()
                   
+                  self._clock_epoch    += self._clock_time
                   self._clock_time      = 0.0
                   self._thread_clock    = None
-                  self._thread_trigger  = None
                
                if (self._mode  & flags.MODE_MANUAL):
                   self._event_interval_trigger_force.clear()
-                  self._event_interval_trigger_flush.set()
+                  self._trigger_wake(self._event_interval_trigger_flush)
                   
-                  try:
-                     self._thread_trigger.join()
-                  except:
-                     pass
+                  self._trigger_worker_stop()
                   
                   self._event_interval_trigger_flush.clear()
-                  
-                  self._thread_trigger  = None
                
                if (self._mode  & flags.MODE_HYBRID):
                   pass
@@ -842,6 +1555,19 @@ class Trigger:
                
                self._event_interval_trigger.clear()
                
+               self._lock_list_waiting.acquire()
+               
+               try:
+                  self._list_activated.clear()
+                  self._list_transit.clear()
+                  self._list_passed.clear()
+               finally:
+                  self._lock_list_waiting.release()
+               
+               self._notify_stop()
+               self._executor_stop()
+               self._debug_sink_stop()
+               
                self._active             = False
             elif (self._mode  != flags.MODE_NONE):
                return False
@@ -864,14 +1590,14 @@ class Trigger:
                
                self._event_interval_trigger.clear()
                
-               if (mode        & flags.MODE_MANUAL):
-                  self._thread_trigger  = None
+               self._trigger_worker_start()
                
                if (mode        & flags.MODE_AUTO):
                   self._event_clock_reset.set()
                   
                   self._clock_time      = 0.0
                   self._clock_active    = True
+                  self._clock_halt      = False
                   
                   thread_clock          = Thread(
                      target=self._clock_thread,
@@ -880,12 +1606,14 @@ class Trigger:
                   
                   thread_clock.start()
                   
-                  self._event_trigger_pre_min_force.set()
+                  self._trigger_wake(self._event_trigger_pre_min_force)
                
                if (mode        & flags.MODE_HYBRID):
                   pass
                
-               self._event_interval_trigger_force.set()
+               self._trigger_wake(self._event_interval_trigger_force)
+               
+               self._debug_sink_start()
                
                self._active             = True
             
@@ -908,7 +1636,8 @@ class Trigger:
       """Handles registration for event based notfications.
       
       Registers or un-registers for notification alert by appending or removing
-      details from notification list.
+      details from notification list, indexed by event bits so that alerts
+      only visit registrations for events at hand.
       
       Parameters
       ----------
@@ -942,9 +1671,14 @@ class Trigger:
          self._lock_list_notification.acquire()
          
          try:
-            self._list_notification.pop(identifier)
-         except:
-            pass
+            notification = self._list_notification.pop(identifier, None)
+            
+            if (notification is not None):
+               self._notification_index(
+                  identifier = identifier,
+                  events     = notification[0],
+                  index      = False,
+               )
          finally:
             self._lock_list_notification.release()
          
@@ -977,16 +1711,73 @@ class Trigger:
       self._lock_list_notification.acquire()
       
       try:
+         if (identifier in self._list_notification):
+            self._notification_index(
+               identifier = identifier,
+               events     = self._list_notification[identifier][0],
+               index      = False,
+            )
+         
          self._list_notification[identifier] = [
             events,
             times,
             callback,
          ]
+         
+         self._notification_index(
+            identifier = identifier,
+            events     = events,
+            index      = True,
+         )
       finally:
          self._lock_list_notification.release()
       
       return identifier
    
+   def _notification_index (
+      self,
+      identifier,
+      events,
+      index = True,
+   ):
+      """Index (or un-index) notification registration by event bits.
+      
+      Expects _lock_list_notification to be held.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier of registration.
+      events : int
+         Events registration is (to be) indexed under.
+      index : bool, default=True
+         Index registration, else un-index.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      events = int(events)
+      
+      while (events > 0):
+         event   = events & (-events)
+         events ^= event
+         
+         if (index):
+            self._list_notification_index.setdefault(event, dict())[
+               identifier
+            ] = None
+         else:
+            identifiers = self._list_notification_index.get(event, dict())
+            identifiers.pop(identifier, None)
+            
+            if (not identifiers):
+               self._list_notification_index.pop(event, None)
+      
+      return None
+   
    def trigger_bind (
       self,
       
@@ -998,6 +1789,9 @@ class Trigger:
       times_retain   = -1,
       times_recurse  = -1,
       
+      iterations     = 1,
+      until_idle     = False,
+      
       non_blocking   = True,
       thread_timeout = None,
       thread_daemon  = True,
@@ -1006,6 +1800,14 @@ class Trigger:
       
       Allows trigger_bound_function's repeated execution as per standard
       procedures of trigger mechanism.
+      Runs a dedicated thread for function, or, if system has an executor,
+      registers function for submission to it upon each trigger instead.
+      Function may run multiple iterations per trigger, within a single wait,
+      block and release cycle, for draining its input (like a queue) at once;
+      with until_idle, iterations stop early as soon as function reports idle
+      by returning a falsy value.
+      Function bound with a custom identifier can be unbound early, see
+      trigger_unbind.
       
       Parameters
       ----------
@@ -1021,6 +1823,11 @@ class Trigger:
          Times to force-retain block for next trigger, remove upon expiry.
       times_recurse : int, default=-1
          Number of times to execute function, upon expiry auto-unbound.
+      iterations : int, default=1
+         Iterations of function per trigger, -1 for unlimited (requires
+         until_idle).
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
       non_blocking : bool, default=True
          Execute function in non-blocking mode ?
       thread_timeout : int, float, NoneType, default=None
@@ -1031,9 +1838,39 @@ class Trigger:
       Returns
       -------
       bool
-         Returns True or alive status for executor thread.
+         Returns False if invalid iterations, else True or alive status for
+         executor thread (or unbound status for function, if system has an
+         executor).
       """
       
+      iterations          = int(iterations)
+      until_idle          = bool(until_idle)
+      
+      if (
+            (not iterations)
+         or ((iterations < 0) and (not until_idle))
+      ):
+         return False
+      
+      iterations          = max(-1, iterations)
+      
+      if (self._executor is not None):
+         return self._trigger_bind_executor(
+            trigger_bound_function = trigger_bound_function,
+            args                   = args,
+            kwargs                 = kwargs,
+            
+            identifier             = identifier,
+            times_retain           = times_retain,
+            times_recurse          = times_recurse,
+            
+            iterations             = iterations,
+            until_idle             = until_idle,
+            
+            non_blocking           = non_blocking,
+            thread_timeout         = thread_timeout,
+         )
+      
       thread_trigger_bind = Thread(
          target = self._trigger_bind,
          kwargs = {
@@ -1043,6 +1880,9 @@ class Trigger:
             'times_retain'           : times_retain,
             'times_recurse'          : times_recurse,
             
+            'iterations'             : iterations,
+            'until_idle'             : until_idle,
+            
             'args'                   : args,
             'kwargs'                 : kwargs,
          },
@@ -1067,11 +1907,17 @@ class Trigger:
       identifier     = None,
       times_retain   = -1,
       times_recurse  = -1,
+      
+      iterations     = 1,
+      until_idle     = False,
    ):
       """Binds functions to system for automated execution.
       
       Allows trigger_bound_function's repeated execution as per standard
       procedures of trigger mechanism.
+      Without a custom identifier, one is generated once and used as handle
+      for all its waits and blocks, deleted once function is unbound, instead
+      of generating (and deleting) one upon each trigger.
       
       Parameters
       ----------
@@ -1087,6 +1933,10 @@ class Trigger:
          Times to force-retain block for next trigger, remove upon expiry.
       times_recurse : int, default=-1
          Number of times to execute function, upon expiry auto-unbound.
+      iterations : int, default=1
+         Iterations of function per trigger, -1 for unlimited.
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
       
       Returns
       -------
@@ -1094,26 +1944,226 @@ class Trigger:
          Returns None.
       """
       
-      while (times_recurse):
-         times_recurse -= 1
-         
-         if (times_recurse < 0):
-            times_recurse = -1
+      identifier_handle = (identifier or app.libcommon.identifier.generate(
+         owner=(
+            'libprogress.trigger[{0}].trigger_bind.anonymous'.format(
+               self,
+            )
+         ),
+      ))
+      event_unbound     = Event()
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         self._list_bound_thread[identifier_handle] = event_unbound
+      finally:
+         self._lock_list_bound.release()
+      
+      try:
+         while (
+                times_recurse
+            and (not event_unbound.is_set())
+         ):
+            times_recurse -= 1
+            
+            if (times_recurse < 0):
+               times_recurse = -1
+            
+            try:
+               self._trigger_bind_execute(
+                  trigger_bound_function = trigger_bound_function,
+                  args                   = args,
+                  kwargs                 = kwargs,
+                  
+                  identifier             = identifier_handle,
+                  times_retain           = times_retain,
+                  
+                  iterations             = iterations,
+                  until_idle             = until_idle,
+                  
+                  event_unbound          = event_unbound,
+               )
+            except Exception as error:
+               self._trigger_bind_error(
+                  identifier = identifier_handle,
+                  function   = trigger_bound_function,
+                  error      = error,
+               )
+      finally:
+         self._lock_list_bound.acquire()
          
          try:
-            self._trigger_bind_execute(
-               trigger_bound_function = trigger_bound_function,
-               args                   = args,
-               kwargs                 = kwargs,
-               
-               identifier             = identifier,
-               times_retain           = times_retain,
-            )
-         except:
-            pass
+            if (
+                  self._list_bound_thread.get(identifier_handle)
+               is event_unbound
+            ):
+               self._list_bound_thread.pop(identifier_handle)
+         finally:
+            self._lock_list_bound.release()
+         
+         event_unbound.set()
+         
+         if (identifier_handle != identifier):
+            app.libcommon.identifier.delete(identifier_handle)
       
       return None
    
+   def trigger_unbind (
+      self,
+      identifier,
+   ):
+      """Unbinds function bound to system with specified identifier.
+      
+      Function is not run again: function on a dedicated thread stops right
+      after its pending wait, function on executor has its times_recurse
+      expired, being unbound at once, or upon completion if still running.
+      
+      Parameters
+      ----------
+      identifier : str
+         Custom identifier function is bound with.
+      
+      Returns
+      -------
+      bool
+         Returns True if a function was bound with identifier, else False.
+      """
+      
+      bound         = None
+      event_unbound = None
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         event_unbound = self._list_bound_thread.pop(identifier, None)
+         
+         if (identifier in self._list_bound):
+            bound    = self._list_bound[identifier]
+            bound[4] = 0
+            
+            if (
+                  (bound[5] is None)
+               or bound[5].done()
+            ):
+               self._list_bound.pop(identifier)
+            else:
+               # Unbound upon completion, see _trigger_submit_done.
+               bound = False
+      finally:
+         self._lock_list_bound.release()
+      
+      if (event_unbound is not None):
+         event_unbound.set()
+      
+      if (bound):
+         if (bound[7]):
+            app.libcommon.identifier.delete(identifier)
+         
+         bound[6].set()
+      
+      return (
+            (event_unbound is not None)
+         or (bound is not None)
+      )
+   
+   def _trigger_bind_executor (
+      self,
+      
+      trigger_bound_function,
+      args           = [],
+      kwargs         = {},
+      
+      identifier     = None,
+      times_retain   = -1,
+      times_recurse  = -1,
+      
+      iterations     = 1,
+      until_idle     = False,
+      
+      non_blocking   = True,
+      thread_timeout = None,
+   ):
+      """Binds functions to system for execution on executor.
+      
+      Registers trigger_bound_function for submission to system's executor
+      upon each trigger (see _trigger_submit), with block held on its behalf
+      until completion.
+      
+      Parameters
+      ----------
+      trigger_bound_function : callable
+         Function to be bound for automated execution.
+      args : tuple, list, default=[]
+         Args to be supplied to trigger_bound_function during execution.
+      kwargs : dict, default={}
+         Kwargs to be supplied to trigger_bound_function during execution.
+      identifier : str, NoneType, default=None
+         Custom identifier for binding and blocks, else auto-generate.
+      times_retain : int, default=-1
+         Times to force-retain block for next trigger, remove upon expiry.
+      times_recurse : int, default=-1
+         Number of times to execute function, upon expiry auto-unbound.
+      iterations : int, default=1
+         Iterations of function per trigger, -1 for unlimited.
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
+      non_blocking : bool, default=True
+         Return right away, instead of waiting for function to be unbound ?
+      thread_timeout : int, float, NoneType, default=None
+         Timeout for waiting if running in blocking mode.
+      
+      Returns
+      -------
+      bool
+         Returns False if invalid parameters, True or unbound status.
+      """
+      
+      times_recurse         = int(times_recurse)
+      
+      if (not times_recurse):
+         return True
+      
+      identifier_bound, proceed = self._identifier_validate(
+         identifier      = identifier,
+         required        = True,
+         regenerate      = True,
+         list_validation = self._list_bound.keys(),
+         owner           = (
+            'libprogress.trigger[{0}].trigger_bind.anonymous'.format(
+               self,
+            )
+         ),
+      )
+      
+      if (not proceed):
+         return False
+      
+      event_unbound         = Event()
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         self._list_bound[identifier_bound] = [
+            trigger_bound_function,
+            args,
+            kwargs,
+            int(times_retain),
+            max(-1, times_recurse),
+            None,
+            event_unbound,
+            (identifier_bound != identifier),
+            iterations,
+            until_idle,
+         ]
+      finally:
+         self._lock_list_bound.release()
+      
+      if (not non_blocking):
+         return event_unbound.wait(timeout=thread_timeout)
+      
+      return True
+   
    def _trigger_bind_execute (
       self,
       
@@ -1123,11 +2173,17 @@ class Trigger:
       
       identifier     = None,
       times_retain   = -1,
+      
+      iterations     = 1,
+      until_idle     = False,
+      
+      event_unbound  = None,
    ):
       """Execute function with trigger operations.
       
       Executes trigger_bound_function with trigger mechanism's standard
-      procedures - wait, block and release.
+      procedures - wait, block and release, iterating it within the block
+      (see _trigger_bind_iterate).
       
       Parameters
       ----------
@@ -1141,6 +2197,12 @@ class Trigger:
          Custom identifier for waits and blocks, else auto-generate.
       times_retain : int, default=-1
          Times to force-retain block for next trigger, remove upon expiry.
+      iterations : int, default=1
+         Iterations of function per trigger, -1 for unlimited.
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
+      event_unbound : Event, NoneType, default=None
+         Event set once function is unbound, skipping execution past wait.
       
       Raises
       ------
@@ -1150,7 +2212,7 @@ class Trigger:
       Returns
       -------
       object
-         Returns trigger_bound_function's return value.
+         Returns trigger_bound_function's (last) return value.
       NoneType
          Returns None on pre-mature termination.
       """
@@ -1162,6 +2224,15 @@ class Trigger:
       except:
          return None
       
+      if (
+             (event_unbound is not None)
+         and event_unbound.is_set()
+      ):
+         if (identifier  != identifier_wait):
+            app.libcommon.identifier.delete(identifier_wait)
+         
+         return None
+      
       try:
          identifier_block = self.block(
             identifier   = identifier_wait,
@@ -1173,8 +2244,20 @@ class Trigger:
          
          return None
       
+      self._stats_block(
+         identifier       = identifier_block,
+         function         = trigger_bound_function,
+      )
+      
       try:
-         return trigger_bound_function(*args, **kwargs)
+         return self._trigger_bind_iterate(
+            trigger_bound_function = trigger_bound_function,
+            args                   = args,
+            kwargs                 = kwargs,
+            
+            iterations             = iterations,
+            until_idle             = until_idle,
+         )
       finally:
          self.release(
             identifier = identifier_block,
@@ -1188,13 +2271,111 @@ class Trigger:
       
       return None
    
-   def wait (
+   def _trigger_bind_iterate (
       self,
-      identifier          = None,
-      identity_regenerate = False,
-      identity_force_use  = False,
-   ):
-      """Wait for next trigger event to occur.
+      
+      trigger_bound_function,
+      args           = [],
+      kwargs         = {},
+      
+      iterations     = 1,
+      until_idle     = False,
+   ):
+      """Iterate function within a single trigger.
+      
+      Calls trigger_bound_function up-to iterations times (unlimited if -1),
+      stopping early with until_idle as soon as it returns a falsy value.
+      
+      Parameters
+      ----------
+      trigger_bound_function : callable
+         Function to be iterated.
+      args : tuple, list, default=[]
+         Args to be supplied to trigger_bound_function during execution.
+      kwargs : dict, default={}
+         Kwargs to be supplied to trigger_bound_function during execution.
+      iterations : int, default=1
+         Iterations of function, -1 for unlimited.
+      until_idle : bool, default=False
+         Stop iterations early, once function returns a falsy value ?
+      
+      Raises
+      ------
+      Exception
+         Exceptions as raised by trigger_bound_function during execution.
+      
+      Returns
+      -------
+      object
+         Returns trigger_bound_function's last return value.
+      """
+      
+      result         = None
+      
+      while (iterations):
+         iterations -= 1
+         
+         if (iterations < 0):
+            iterations = -1
+         
+         result      = trigger_bound_function(*args, **kwargs)
+         
+         if (
+                until_idle
+            and (not result)
+         ):
+            break
+      
+      return result
+   
+   def _trigger_bind_error (
+      self,
+      identifier,
+      function,
+      error,
+   ):
+      """Record exception raised by bound function.
+      
+      Marks (non-raisable) error, with function and exception as its values,
+      and records a debug trace, instead of discarding exception.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier function is bound with.
+      function : callable, NoneType
+         Function which raised exception, None if already unbound.
+      error : BaseException
+         Exception raised by function.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._errors(
+         error_description = descriptors.ERROR_FUNCTION_BOUND_FAILED,
+         combine           = True,
+         function          = function,
+         exception         = repr(error),
+      )
+      self._debug(
+         debug_originator  = 'libprogress.trigger.trigger_bind.error',
+         identifier        = identifier,
+         function          = repr(function),
+         exception         = repr(error),
+      )
+      
+      return None
+   
+   def wait (
+      self,
+      identifier          = None,
+      identity_regenerate = False,
+      identity_force_use  = False,
+   ):
+      """Wait for next trigger event to occur.
       
       Waits are meant to ensure that all dependent functions wait for trigger
       event to start their tasks, providing synchronized progress.
@@ -1233,25 +2414,60 @@ class Trigger:
       if (not proceed):
          return False
       
+      virtual   = bool(self._mode & flags.MODE_VIRTUAL)
+      triggered = False
+      
       self._lock_list_waiting.acquire()
       
       try:
          self._list_waiting.append(identifier)
+         
+         if (identifier in self._list_transit):
+            self._list_transit.remove(identifier)
       finally:
          self._lock_list_waiting.release()
       
+      if (virtual):
+         self._trigger_wake()
+      
       try:
          self._event_trigger_activation.wait()
+         
+         if (virtual):
+            self._lock_list_waiting.acquire()
+            
+            try:
+               self._list_activated.append(identifier)
+            finally:
+               self._lock_list_waiting.release()
+            
+            self._trigger_wake()
+         
          self._event_trigger_trigger.wait()
+         
+         triggered = True
       finally:
          self._lock_list_waiting.acquire()
          
          try:
+            if (
+                   virtual
+               and triggered
+            ):
+               self._list_transit.append(identifier)
+               self._list_passed.add(identifier)
+            
             self._list_waiting.remove(identifier)
+            
+            if (identifier in self._list_activated):
+               self._list_activated.remove(identifier)
          except:
             pass
          finally:
             self._lock_list_waiting.release()
+         
+         if (virtual):
+            self._trigger_wake()
       
       return identifier
    
@@ -1313,6 +2529,17 @@ class Trigger:
       finally:
          self._lock_list_blocking.release()
       
+      self._stats_block(identifier)
+      
+      if (self._list_transit):
+         self._lock_list_waiting.acquire()
+         
+         try:
+            if (identifier in self._list_transit):
+               self._list_transit.remove(identifier)
+         finally:
+            self._lock_list_waiting.release()
+      
       return identifier
    
    def release (
@@ -1349,8 +2576,112 @@ class Trigger:
       finally:
          self._lock_list_blocking.release()
       
+      self._stats_release(identifier)
+      
+      self._trigger_wake()
+      
       return identifier
    
+   def schedule (
+      self,
+      delay,
+      callback,
+      args     = [],
+      kwargs   = {},
+   ):
+      """Schedule a callback, to be run within first tick after delay.
+      
+      Timers are kept on a hierarchical timing wheel (see TimingWheel) keyed
+      on system time (clock time, accumulated across triggers, hence virtual
+      in virtual modes), with O(1) scheduling and cancellation. Due
+      callbacks are run upon each trigger, on trigger's thread, hence are
+      expected not to block for long. As system time only elapses on clock,
+      timers only come due in automatic modes.
+      
+      Parameters
+      ----------
+      delay : int, float
+         Delay (in system time) after which callback is due.
+      callback : callable
+         Callback, to be run once due.
+      args : tuple, list, default=[]
+         Args to be supplied to callback.
+      kwargs : dict, default={}
+         Kwargs to be supplied to callback.
+      
+      Returns
+      -------
+      int
+         Returns handle of scheduled callback (see cancel).
+      bool
+         Returns False if invalid parameters.
+      """
+      
+      if (
+            (not callable(callback))
+         or (delay < 0)
+      ):
+         return False
+      
+      return self._timer_wheel.schedule(
+         time_due = (self._clock_epoch + self._clock_time + delay),
+         callback = callback,
+         args     = args,
+         kwargs   = kwargs,
+      )
+   
+   def cancel (
+      self,
+      handle,
+   ):
+      """Cancel a scheduled callback.
+      
+      Parameters
+      ----------
+      handle : int
+         Handle of scheduled callback.
+      
+      Returns
+      -------
+      bool
+         Returns False if callback is not pending (run or cancelled).
+      """
+      
+      return self._timer_wheel.cancel(handle)
+   
+   def _timer_fire (self):
+      """Run scheduled callbacks due by current system time, within tick.
+      
+      Exceptions raised by callbacks are consumed, so that tick proceeds.
+      
+      Returns
+      -------
+      int
+         Returns number of callbacks run.
+      """
+      
+      expired    = self._timer_wheel.advance(
+         self._clock_epoch + self._clock_time,
+      )
+      
+      if (not expired):
+         return 0
+      
+      time_start = time.perf_counter()
+      
+      for callback, args, kwargs in expired:
+         try:
+            callback(*args, **kwargs)
+         except:
+            pass
+      
+      self._stats_count(
+         'timers',
+         (time.perf_counter() - time_start),
+      )
+      
+      return len(expired)
+   
    def notify (self, *args, **kwargs):
       """Send a manual notification alert to all registered receivers.
       
@@ -1394,7 +2725,9 @@ class Trigger:
       """Send a notification alert to all registered receivers.
       
       Sends notification alerts to all registered receivers whose registered
-      events matches currently active events.
+      events matches currently active events, looked up through event index.
+      Non-blocking alerts are delivered by persistent dispatcher threads (see
+      _notify_thread), instead of a new thread for each callback.
       
       Parameters
       ----------
@@ -1404,10 +2737,11 @@ class Trigger:
          Instantaneous time for event.
       event_description : str, default=descriptors.INTERVAL_EVENT_NONE
          Description for event for which notification has to be triggered.
-      non_blocking : bool, default=True
-         Run notification callbacks in non-blocking mode ?
+      non_blocking : bool, NoneType, default=True
+         Run notification callbacks in non-blocking mode ? None to wait for
+         dispatched callbacks to complete.
       thread_timeout : int, float, NoneType, default=None
-         Thread timeout if running in blocking mode.
+         Timeout for waiting if running in blocking mode.
       
       Returns
       -------
@@ -1415,260 +2749,1176 @@ class Trigger:
          Returns True.
       """
       
-      self._lock_notify.acquire()
+      time_event             = time.perf_counter()
       
-      notification_threads   = list()
+      notification_batch     = None
       notification_callbacks = list()
       
+      self._lock_notify.acquire()
+      
       try:
          self._lock_list_notification.acquire()
          
          try:
-            for identifier in self._list_notification.keys():
+            identifiers = dict()
+            events      = int(event)
+            
+            while (events > 0):
+               event_bit  = events & (-events)
+               events    ^= event_bit
+               
+               identifiers.update(self._list_notification_index.get(
+                  event_bit,
+                  dict(),
+               ))
+            
+            for identifier in identifiers:
+               notification = self._list_notification.get(identifier)
+               
                if (
-                  (
-                     self._list_notification[identifier][0]
-                     & event
-                  )
-                  and self._list_notification[identifier][1]
+                     (notification is None)
+                  or (not notification[1])
                ):
-                  if (self._list_notification[identifier][1] < 0):
-                     self._list_notification[identifier][1]  = -1 # un_limited
-                  elif (self._list_notification[identifier][1] in (0, 1,)):
-                     if (self._list_notification[identifier][1] == 1):
-                        notification_callbacks.append(
-                           self._list_notification[identifier][-1],
-                        )
-                     
-                     try:
-                        self._list_notification.pop(identifier)
-                     except:
-                        pass
-                     
-                     continue
-                  else:
-                     self._list_notification[identifier][1] -=  1 #    limited
+                  continue
+               
+               if (notification[1] > 0):
+                  notification[1] -= 1 #    limited
                   
-                  notification_callbacks.append(
-                     self._list_notification[identifier][-1],
-                  )
+                  if (not notification[1]):
+                     self._list_notification.pop(identifier)
+                     self._notification_index(
+                        identifier = identifier,
+                        events     = notification[0],
+                        index      = False,
+                     )
+               
+               notification_callbacks.append(notification[2])
          finally:
             self._lock_list_notification.release()
          
-         for callback in notification_callbacks:
-            if (non_blocking is False):
-               callback(
-                  clock_time        = self._clock_time,
-                  event             = event,
-                  event_time        = event_time,
-                  event_description = event_description,
-               )
-            else:
-               notification_threads.append(Thread(
-                  target=callback,
-                  kwargs={
-                     'clock_time'       : self._clock_time,
-                     'event'            : event,
-                     'event_time'       : event_time,
-                     'event_description': event_description,
-                  },
-                  daemon=False,
-               ))
-               notification_threads[-1].start()
+         notification_kwargs = {
+            'clock_time'        : self._clock_time,
+            'event'             : event,
+            'event_time'        : event_time,
+            'event_description' : event_description,
+         }
+         
+         if (non_blocking is False):
+            for callback in notification_callbacks:
+               self._condition_notify.acquire()
+               
+               try:
+                  self._notify_latency_record(time_event)
+               finally:
+                  self._condition_notify.release()
+               
+               time_start = time.perf_counter()
+               
+               try:
+                  callback(**notification_kwargs)
+               finally:
+                  self._stats_count(
+                     'notify',
+                     (time.perf_counter() - time_start),
+                  )
+         elif (notification_callbacks):
+            if (non_blocking is None):
+               notification_batch = [len(notification_callbacks), Event()]
+            
+            self._notify_dispatch(
+               notification_callbacks,
+               notification_kwargs,
+               time_event,
+               notification_batch,
+            )
       finally:
          self._lock_notify.release()
       
-      if (non_blocking is None):
-         while (notification_threads):
-            notification_threads[-1].join(timeout=thread_timeout)
-            notification_threads.pop()
+      if (notification_batch is not None):
+         notification_batch[1].wait(timeout=thread_timeout)
       
       return True
    
-   def trigger_force (
+   def _notify_dispatch (
       self,
-      force         = None,
-      force_pre_min = None,
+      callbacks,
+      kwargs,
+      time_event,
+      batch = None,
    ):
-      """Force activate next trigger, overriding active blocks.
+      """Enqueue notification callbacks for delivery by dispatcher threads.
       
-      Used to force fire a trigger even if a task is blocking.
+      Starts dispatcher threads upon first use.
       
       Parameters
       ----------
-      force : bool, NoneType, default=None
-         If bool, enable or disable trigger's normal force state.
-      force_pre_min : bool, NoneType, default=None
-         If bool, enable or disable trigger's pre-min force state.
+      callbacks : list
+         Callbacks to be delivered.
+      kwargs : dict
+         Kwargs to be supplied to callbacks.
+      time_event : float
+         Instantaneous (perf_counter) time of event, for dispatch latency.
+      batch : list, NoneType, default=None
+         Pending callbacks count and Event, set once all are delivered.
       
       Returns
       -------
       NoneType
-         Returns None if incompatible mode.
-      bool
-         Returns True if success.
+         Returns None.
       """
       
-      if (not (self._mode & flags.MODE_MANUAL)):
-         return None
-      
-      if (force_pre_min):
-         self._event_trigger_pre_min_force.set()
-      elif (force_pre_min is False):
-         self._event_trigger_pre_min_force.clear()
+      self._condition_notify.acquire()
       
-      if (force):
-         self._event_interval_trigger_force.set()
-      elif (force is False):
-         self._event_interval_trigger_force.clear()
+      try:
+         while (len(self._threads_notify) < self._notify_workers):
+            self._threads_notify.append(Thread(
+               target = self._notify_thread,
+               kwargs = {'generation': self._notify_generation},
+               daemon = True,
+            ))
+            self._threads_notify[-1].start()
+         
+         for callback in callbacks:
+            self._queue_notify.append([
+               callback,
+               kwargs,
+               time_event,
+               batch,
+            ])
+         
+         self._condition_notify.notify(len(callbacks))
+      finally:
+         self._condition_notify.release()
       
-      return True
+      return None
    
-   def trigger_flush (
-      self,
-      flush         = None,
-      flush_pre_min = None,
-   ):
-      """Flush queued triggers.
-      
-      Used to cancel queued triggers if the need arise.
+   def _notify_stop (self):
+      """Stop dispatcher threads, once enqueued callbacks are delivered.
       
-      Parameters
-      ----------
-      flush : bool, NoneType, default=None
-         If bool, enable or disable trigger's normal flush state.
-      flush_pre_min : bool, NoneType, default=None
-         If bool, enable or disable trigger's pre-min flush state.
+      Advances dispatchers' generation and moves them to
+      _threads_notify_stopped, for _notify_join to join once mode switch
+      locks are released (callbacks may switch modes themselves). Later
+      notifications start new dispatchers.
       
       Returns
       -------
       NoneType
-         Returns None if incompatible mode.
-      bool
-         Returns True if success.
+         Returns None.
       """
       
-      if (not (self._mode & flags.MODE_MANUAL)):
-         return None
-      
-      if (flush_pre_min):
-         self._event_trigger_pre_min_flush.set()
-      elif (flush_pre_min is False):
-         self._event_trigger_pre_min_flush.clear()
+      self._condition_notify.acquire()
       
-      if (flush):
-         self._event_interval_trigger_flush.set()
-      elif (flush is False):
-         self._event_interval_trigger_flush.clear()
+      try:
+         self._notify_generation += 1
+         
+         self._threads_notify_stopped.extend(self._threads_notify)
+         self._threads_notify.clear()
+         
+         self._condition_notify.notify_all()
+      finally:
+         self._condition_notify.release()
       
-      return True
+      return None
    
-   def trigger (self, non_blocking=True, thread_timeout=None):
-      """Manually enqueue a trigger.
+   def _notify_join (self):
+      """Join dispatcher threads stopped by _notify_stop.
       
-      Parameters
-      ----------
-      non_blocking : bool, default=True
-         Run trigger process in non-blocking mode ?
-      thread_timeout : int, float, NoneType, default=None
-         Thread timeout if running in blocking mode.
+      Skips calling thread, if it is a stopped dispatcher itself (callback
+      deactivating the system).
       
       Returns
       -------
       NoneType
-         Returns None if incompatible mode.
-      bool
-         Returns True or alive status for executor thread if success.
+         Returns None.
       """
       
-      if (not (self._mode & flags.MODE_MANUAL)):
-         return None
-      
-      thread_trigger = Thread(
-         target = self._trigger,
-         daemon = False,
-      )
-      thread_trigger.start()
-      
-      self._thread_trigger = thread_trigger
+      self._condition_notify.acquire()
       
-      if (not non_blocking):
-         thread_trigger.join(timeout=thread_timeout)
+      try:
+         threads_notify = self._threads_notify_stopped
          
-         return (not thread_trigger.is_alive())
+         self._threads_notify_stopped = list()
+      finally:
+         self._condition_notify.release()
       
-      return True
+      for thread_notify in threads_notify:
+         if (thread_notify is not current_thread()):
+            thread_notify.join()
+      
+      return None
    
-   def _trigger (self):
-      """Processes individual trigger's pre-trigger process.
+   def _executor_stop (self):
+      """Stop executor inited by system, upon deactivation.
       
-      Keeps next trigger from firing until unti minimum duration is acheived
-      and until no task is blocking.
-      Also, keeps on checking whether trigger is to be flushed or force fired.
+      Replaces it with a new one (starting its threads only upon use), and
+      moves it to _executors_stopped, for _executor_shutdown to shut down
+      once mode switch locks are released (bound functions may still be
+      running). Supplied executor is left as is.
       
       Returns
       -------
       bool
-         Returns True or False depending on success.
+         Returns True if stopped.
+      NoneType
+         Returns None if executor is not inited by system.
       """
       
-      self._lock_trigger.acquire()
+      if (not self._executor_owned):
+         return None
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         self._executors_stopped.append(self._executor)
+         
+         self._executor = ThreadPoolExecutor(
+            max_workers        = self._executor_workers,
+            thread_name_prefix = 'libprogress.trigger',
+         )
+      finally:
+         self._lock_list_bound.release()
+      
+      return True
+   
+   def _executor_shutdown (self):
+      """Shut down executors stopped by _executor_stop.
+      
+      Waits for bound functions still running on them to complete, unless
+      called from one of their threads (bound function deactivating system).
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         executors = self._executors_stopped
+         
+         self._executors_stopped = list()
+      finally:
+         self._lock_list_bound.release()
+      
+      for executor in executors:
+         executor.shutdown(wait=(
+            current_thread() not in getattr(executor, '_threads', ())
+         ))
+      
+      return None
+   
+   def _notify_thread (
+      self,
+      generation = 0,
+   ):
+      """Persistent dispatcher, delivering enqueued notification callbacks.
+      
+      Exceptions raised by callbacks are consumed, so that dispatcher keeps
+      serving others. Returns once its generation is stopped (see
+      _notify_stop) and no callbacks are pending.
+      
+      Parameters
+      ----------
+      generation : int, default=0
+         Generation of dispatcher, compared against _notify_generation.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      while (True):
+         self._condition_notify.acquire()
+         
+         try:
+            self._condition_notify.wait_for(lambda: (
+                   self._queue_notify
+               or (generation != self._notify_generation)
+            ))
+            
+            if (not self._queue_notify):
+               return None
+            
+            callback, kwargs, time_event, batch = self._queue_notify.popleft()
+            
+            self._notify_latency_record(time_event)
+         finally:
+            self._condition_notify.release()
+         
+         time_start = time.perf_counter()
+         
+         try:
+            callback(**kwargs)
+         except:
+            pass
+         
+         self._stats_count(
+            'notify',
+            (time.perf_counter() - time_start),
+         )
+         
+         if (batch is not None):
+            self._condition_notify.acquire()
+            
+            try:
+               batch[0] -= 1
+               
+               if (not batch[0]):
+                  batch[1].set()
+            finally:
+               self._condition_notify.release()
+      
+      return None
+   
+   def _notify_latency_record (
+      self,
+      time_event,
+   ):
+      """Account dispatch latency of a notification callback, starting now.
+      
+      Expects _condition_notify to be held.
+      
+      Parameters
+      ----------
+      time_event : float
+         Instantaneous (perf_counter) time of event.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      latency                 = time.perf_counter() - time_event
+      
+      self._notify_latency[0] += 1
+      self._notify_latency[1] += latency
+      self._notify_latency[2]  = max(self._notify_latency[2], latency)
+      
+      return None
+   
+   def notify_latency (
+      self,
+      reset = False,
+   ):
+      """Query dispatch latency of notification alerts.
+      
+      Latency is measured from event (alert) to start of each callback.
+      
+      Parameters
+      ----------
+      reset : bool, default=False
+         Reset counters after query ?
+      
+      Returns
+      -------
+      dict
+         Returns latency as:
+         
+         *  count : callbacks delivered.
+         *  mean : mean latency (s).
+         *  max : maximum latency (s).
+      """
+      
+      self._condition_notify.acquire()
+      
+      try:
+         count, total, maximum = self._notify_latency
+         
+         if (reset):
+            self._notify_latency = [0, 0.0, 0.0]
+      finally:
+         self._condition_notify.release()
+      
+      return {
+         'count' : count,
+         'mean'  : ((total / count) if (count) else 0.0),
+         'max'   : maximum,
+      }
+   
+   def stats (self):
+      """Query per-tick timing metrics, as a single snapshot.
+      
+      Metrics are recorded for each tick (trigger) into a ring buffer of
+      last stats_ticks ticks, so that slow ticks can be attributed either to
+      blocks held by bound functions (by function name, else identifier), or
+      to clock, exceed events or notification callbacks.
+      
+      Returns
+      -------
+      dict
+         Returns metrics as:
+         
+         *  ticks : ticks fired since init.
+         *  history : metrics of last (up-to stats_ticks) ticks, oldest first.
+         *  current : metrics of tick in progress, including blocks still
+            held.
+         *  notify_latency : dispatch latency (see notify_latency).
+         *  mode_latency : mode switch latency (see mode_latency).
+         *  intervals : intervals in use (see intervals).
+         
+         Each tick's metrics are:
+         
+         *  tick : tick's number.
+         *  event : trigger's event, None for tick in progress.
+         *  clock_time : clock time at trigger, None for tick in progress.
+         *  duration : time (s) from clock reset to trigger (so far, for tick
+            in progress).
+         *  blocks : time (s) each block was held during tick, by label.
+         *  forces, flushes, exceeds : force, flush and exceed events.
+         *  notify : time (s) spent in notification callbacks.
+         *  timers : time (s) spent in scheduled callbacks (see schedule).
+      """
+      
+      self._lock_stats.acquire()
+      
+      try:
+         time_now = time.perf_counter()
+         
+         current  = self._stats_tick_copy(self._stats_current)
+         
+         current['duration'] = time_now - self._stats_time_reset
+         
+         for time_start, label in self._stats_blocking.values():
+            current['blocks'][label] = (
+                 current['blocks'].get(label, 0.0)
+               + (time_now - time_start)
+            )
+         
+         stats    = {
+            'ticks'   : self._stats_ticks,
+            'history' : [
+               self._stats_tick_copy(tick)
+               for tick in self._stats_history
+            ],
+            'current' : current,
+         }
+      finally:
+         self._lock_stats.release()
+      
+      stats['notify_latency'] = self.notify_latency()
+      stats['mode_latency']   = self.mode_latency()
+      stats['intervals']      = self.intervals()
+      
+      return stats
+   
+   def _stats_tick_new (
+      self,
+      tick,
+   ):
+      """Init metrics for a tick.
+      
+      Parameters
+      ----------
+      tick : int
+         Tick's number.
+      
+      Returns
+      -------
+      dict
+         Returns empty metrics for tick.
+      """
+      
+      return {
+         'tick'       : tick,
+         'event'      : None,
+         'clock_time' : None,
+         'duration'   : None,
+         'blocks'     : dict(),
+         'forces'     : 0,
+         'flushes'    : 0,
+         'exceeds'    : 0,
+         'notify'     : 0.0,
+         'timers'     : 0.0,
+      }
+   
+   def _stats_tick_copy (
+      self,
+      tick,
+   ):
+      """Copy metrics of a tick, for snapshot.
+      
+      Parameters
+      ----------
+      tick : dict
+         Metrics of tick.
+      
+      Returns
+      -------
+      dict
+         Returns copy of metrics.
+      """
+      
+      tick           = dict(tick)
+      tick['blocks'] = dict(tick['blocks'])
+      
+      return tick
+   
+   def _stats_tick (
+      self,
+      event      = flags.INTERVAL_EVENT_NONE,
+      event_time = 0.0,
+   ):
+      """Finalize metrics of tick in progress upon trigger, start next one.
+      
+      Blocks still held (forced or retained) are accounted for time held so
+      far, and continue to be accounted for in next tick.
+      
+      Parameters
+      ----------
+      event : int, default=flags.INTERVAL_EVENT_NONE
+         Trigger's event.
+      event_time : int, float, default=0.0
+         Clock time at trigger.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._lock_stats.acquire()
+      
+      try:
+         time_now                       = time.perf_counter()
+         
+         tick                           = self._stats_current
+         tick['event']                  = event
+         tick['clock_time']             = event_time
+         tick['duration']               = time_now - self._stats_time_reset
+         
+         for blocking in self._stats_blocking.values():
+            tick['blocks'][blocking[1]] = (
+                 tick['blocks'].get(blocking[1], 0.0)
+               + (time_now - blocking[0])
+            )
+            blocking[0]                 = time_now
+         
+         self._stats_history.append(tick)
+         
+         self._stats_ticks             += 1
+         self._stats_current            = self._stats_tick_new(
+            self._stats_ticks,
+         )
+         self._stats_time_reset         = time_now
+      finally:
+         self._lock_stats.release()
+      
+      if (self._interval_adaptive):
+         self._interval_adapt(tick)
+      
+      return None
+   
+   def intervals (self):
+      """Query system's intervals, as currently in use.
+      
+      Reports intervals as tuned, in adaptive mode.
+      
+      Returns
+      -------
+      dict
+         Returns intervals as:
+         
+         *  interval_min, interval_max, interval_critical,
+            interval_trigger_auto_add : respective durations.
+         *  adaptive : adaptive mode enabled ?
+         *  adaptive_bounds : bounds (lower, upper) for tuned minimum.
+         *  adaptive_estimate : estimated duration (clock time) of bound
+            functions per tick.
+      """
+      
+      return {
+         'interval_min'              : self._interval_min,
+         'interval_max'              : self._interval_max,
+         'interval_critical'         : self._interval_critical,
+         'interval_trigger_auto_add' : self._interval_trigger_auto_add,
+         'adaptive'                  : self._interval_adaptive,
+         'adaptive_bounds'           : self._interval_adaptive_bounds,
+         'adaptive_estimate'         : self._interval_adaptive_estimate,
+      }
+   
+   def _interval_adapt (
+      self,
+      tick,
+   ):
+      """Tune intervals to bound functions' measured duration, upon tick.
+      
+      Estimates per tick duration of bound functions as longest block held
+      during tick, converted to clock time - rising at once to slower ticks,
+      and decaying slowly (1/8 per tick) to faster ones, and doubling upon
+      forced ticks. Max interval is then set with headroom (1.5x estimate
+      plus a clock step) over estimate, so that bound functions complete
+      without forcing, with others following by their configured ratios to
+      minimum interval, bounded by adaptive bounds.
+      
+      Parameters
+      ----------
+      tick : dict
+         Metrics of finalized tick (see stats).
+      
+      Returns
+      -------
+      NoneType
+         Returns None if not tuned (virtual mode).
+      bool
+         Returns True if tuned.
+      """
+      
+      if (
+            (self._mode & flags.MODE_VIRTUAL)
+         or (not self._clock_interval)
+      ):
+         return None
+      
+      duration        = (
+           max(tick['blocks'].values(), default=0.0)
+         * (self._clock_step / self._clock_interval)
+      )
+      estimate        = self._interval_adaptive_estimate
+      
+      if (tick['event'] & flags.INTERVAL_EVENT_TRIGGER_FORCE):
+         estimate     = 2 * max(estimate, duration)
+      elif (duration >= estimate):
+         estimate     = duration
+      else:
+         estimate    += (duration - estimate) / 8
+      
+      interval_min    = min(
+         max(
+            (
+                 ((1.5 * estimate) + self._clock_step)
+               / self._interval_adaptive_ratios[0]
+            ),
+            self._interval_adaptive_bounds[0],
+         ),
+         self._interval_adaptive_bounds[1],
+      )
+      
+      self._interval_adaptive_estimate = estimate
+      
+      self._interval_min               = interval_min
+      self._interval_max               = (
+         interval_min * self._interval_adaptive_ratios[0]
+      )
+      self._interval_critical          = (
+         interval_min * self._interval_adaptive_ratios[1]
+      )
+      self._interval_trigger_auto_add  = (
+         interval_min * self._interval_adaptive_ratios[2]
+      )
+      
+      return True
+   
+   def _stats_block (
+      self,
+      identifier,
+      function = None,
+   ):
+      """Account start of block, for block attribution.
+      
+      Re-accounting a held block only updates its label.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier of block.
+      function : callable, NoneType, default=None
+         Function block is held on behalf of, to label block with its name,
+         else labelled with identifier.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      label = (
+         identifier
+         if (function is None)
+         else
+         str(getattr(function, '__qualname__', function))
+      )
+      
+      self._lock_stats.acquire()
+      
+      try:
+         if (identifier in self._stats_blocking):
+            if (function is not None):
+               self._stats_blocking[identifier][1] = label
+         else:
+            self._stats_blocking[identifier]    = [
+               time.perf_counter(),
+               label,
+            ]
+      finally:
+         self._lock_stats.release()
+      
+      return None
+   
+   def _stats_release (
+      self,
+      identifier,
+   ):
+      """Account release of block, for block attribution.
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier of block.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._lock_stats.acquire()
+      
+      try:
+         blocking = self._stats_blocking.pop(identifier, None)
+         
+         if (blocking is not None):
+            self._stats_current['blocks'][blocking[1]] = (
+                 self._stats_current['blocks'].get(blocking[1], 0.0)
+               + (time.perf_counter() - blocking[0])
+            )
+      finally:
+         self._lock_stats.release()
+      
+      return None
+   
+   def _stats_count (
+      self,
+      metric,
+      amount = 1,
+   ):
+      """Accumulate metric of tick in progress.
+      
+      Parameters
+      ----------
+      metric : str
+         Metric to accumulate - forces, flushes, exceeds, notify or timers.
+      amount : int, float, default=1
+         Amount to accumulate by.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._lock_stats.acquire()
+      
+      try:
+         self._stats_current[metric] += amount
+      finally:
+         self._lock_stats.release()
+      
+      return None
+   
+   def trigger_force (
+      self,
+      force         = None,
+      force_pre_min = None,
+   ):
+      """Force activate next trigger, overriding active blocks.
+      
+      Used to force fire a trigger even if a task is blocking.
+      
+      Parameters
+      ----------
+      force : bool, NoneType, default=None
+         If bool, enable or disable trigger's normal force state.
+      force_pre_min : bool, NoneType, default=None
+         If bool, enable or disable trigger's pre-min force state.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      if (force or force_pre_min):
+         self._stats_count('forces')
+      
+      if (force_pre_min):
+         self._trigger_wake(self._event_trigger_pre_min_force)
+      elif (force_pre_min is False):
+         self._event_trigger_pre_min_force.clear()
+      
+      if (force):
+         self._trigger_wake(self._event_interval_trigger_force)
+      elif (force is False):
+         self._event_interval_trigger_force.clear()
+      
+      return True
+   
+   def trigger_flush (
+      self,
+      flush         = None,
+      flush_pre_min = None,
+   ):
+      """Flush queued triggers.
+      
+      Used to cancel queued triggers if the need arise.
+      
+      Parameters
+      ----------
+      flush : bool, NoneType, default=None
+         If bool, enable or disable trigger's normal flush state.
+      flush_pre_min : bool, NoneType, default=None
+         If bool, enable or disable trigger's pre-min flush state.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      if (flush or flush_pre_min):
+         self._stats_count('flushes')
+      
+      if (flush_pre_min):
+         self._trigger_wake(self._event_trigger_pre_min_flush)
+      elif (flush_pre_min is False):
+         self._event_trigger_pre_min_flush.clear()
+      
+      if (flush):
+         self._trigger_wake(self._event_interval_trigger_flush)
+      elif (flush is False):
+         self._event_interval_trigger_flush.clear()
+      
+      return True
+   
+   def trigger (self, non_blocking=True, thread_timeout=None):
+      """Manually enqueue a trigger.
+      
+      Parameters
+      ----------
+      non_blocking : bool, default=True
+         Run trigger process in non-blocking mode ?
+      thread_timeout : int, float, NoneType, default=None
+         Thread timeout if running in blocking mode.
+      
+      Returns
+      -------
+      NoneType
+         Returns None if incompatible mode.
+      bool
+         Returns True if success, or whether trigger was processed (before
+         timeout) in blocking mode.
+      """
+      
+      if (not (self._mode & flags.MODE_MANUAL)):
+         return None
+      
+      ticket = self._trigger_request()
+      
+      if (not non_blocking):
+         return self._trigger_wait(
+            ticket,
+            timeout = thread_timeout,
+         )
+      
+      return True
+   
+   def _trigger_request (self):
+      """Request a trigger from trigger worker.
+      
+      Requests are processed in order, one at a time (see _trigger).
+      
+      Returns
+      -------
+      int
+         Returns ticket of request, to wait for (see _trigger_wait).
+      """
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         self._trigger_requested += 1
+         
+         ticket                   = self._trigger_requested
+         
+         self._condition_trigger.notify_all()
+      finally:
+         self._condition_trigger.release()
+      
+      return ticket
+   
+   def _trigger_wait (
+      self,
+      ticket,
+      timeout = None,
+   ):
+      """Wait for requested trigger to be processed by trigger worker.
+      
+      Parameters
+      ----------
+      ticket : int
+         Ticket of request (see _trigger_request).
+      timeout : int, float, NoneType, default=None
+         Maximum duration to wait for, None to wait forever.
+      
+      Returns
+      -------
+      bool
+         Returns True if processed, else False upon timeout.
+      """
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         return self._condition_trigger.wait_for(
+            lambda: (self._trigger_completed >= ticket),
+            timeout = timeout,
+         )
+      finally:
+         self._condition_trigger.release()
+   
+   def _trigger_worker_start (self):
+      """Start persistent trigger worker, upon activation.
+      
+      Requests left from an earlier activation are dropped.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         self._trigger_worker_active = True
+         self._trigger_completed     = self._trigger_requested
+      finally:
+         self._condition_trigger.release()
+      
+      self._thread_trigger           = Thread(
+         target = self._trigger_thread,
+         daemon = True,
+      )
+      self._thread_trigger.start()
+      
+      return None
+   
+   def _trigger_worker_stop (self):
+      """Stop and join persistent trigger worker, upon deactivation.
+      
+      Expects pending trigger to be flushed (woken) already. Requests still
+      pending are dropped, releasing their waiters.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      if (self._thread_trigger is None):
+         return None
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         self._trigger_worker_active = False
+         
+         self._condition_trigger.notify_all()
+      finally:
+         self._condition_trigger.release()
+      
+      if (self._thread_trigger is not current_thread()):
+         self._thread_trigger.join()
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         self._trigger_completed     = self._trigger_requested
+         
+         self._condition_trigger.notify_all()
+      finally:
+         self._condition_trigger.release()
+      
+      self._thread_trigger           = None
+      
+      return None
+   
+   def _trigger_thread (self):
+      """Persistent trigger worker, processing requested triggers in order.
+      
+      Sleeps on _condition_trigger until a trigger is requested (see
+      _trigger_request), instead of a new thread being started for each.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      while (True):
+         self._condition_trigger.acquire()
+         
+         try:
+            self._condition_trigger.wait_for(lambda: (
+                  (not self._trigger_worker_active)
+               or (self._trigger_requested > self._trigger_completed)
+            ))
+            
+            if (not self._trigger_worker_active):
+               return None
+         finally:
+            self._condition_trigger.release()
+         
+         try:
+            self._trigger()
+         finally:
+            self._condition_trigger.acquire()
+            
+            try:
+               self._trigger_completed += 1
+               
+               self._condition_trigger.notify_all()
+            finally:
+               self._condition_trigger.release()
+   
+   def _trigger (self):
+      """Processes individual trigger's pre-trigger process.
+      
+      Keeps next trigger from firing until unti minimum duration is acheived
+      and until no task is blocking.
+      Also, keeps on checking whether trigger is to be flushed or force fired.
+      Sleeps on _condition_trigger in between, to be woken (see
+      _trigger_wake) only upon change of these conditions.
+      
+      Returns
+      -------
+      bool
+         Returns True or False depending on success.
+      """
+      
+      self._lock_trigger.acquire()
       
       try:
          if (self._mode & flags.MODE_AUTO):
-            while (not self._event_interval_trigger.wait(timeout=0.0)):
-               if (self._event_trigger_pre_min_force.wait(timeout=0.0)):
-                  self._event_trigger_pre_min_force.clear()
-                  
-                  self._trigger_events(
-                     event             = (
-                        flags.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
-                     ),
-                     event_description = (
-                        descriptors.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
-                     ),
-                     combine           = True,
-                  )
-                  
-                  break
-               elif (self._event_trigger_pre_min_flush.wait(timeout=0.0)):
-                  return False
+            self._condition_trigger.acquire()
+            
+            try:
+               self._condition_trigger.wait_for(lambda: (
+                     self._event_interval_trigger.is_set()
+                  or self._event_trigger_pre_min_force.is_set()
+                  or self._event_trigger_pre_min_flush.is_set()
+               ))
+            finally:
+               self._condition_trigger.release()
+            
+            if (self._event_interval_trigger.is_set()):
+               pass
+            elif (self._event_trigger_pre_min_force.is_set()):
+               self._event_trigger_pre_min_force.clear()
+               
+               self._trigger_events(
+                  event             = (
+                     flags.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
+                  ),
+                  event_description = (
+                     descriptors.INTERVAL_EVENT_TRIGGER_PRE_MIN_FORCE
+                  ),
+                  combine           = True,
+               )
+            elif (self._event_trigger_pre_min_flush.is_set()):
+               return False
          
-         if (self._event_interval_trigger_flush.wait(timeout=0.0)):
+         if (self._event_interval_trigger_flush.is_set()):
             return False
          
+         self._condition_trigger.acquire()
+         
+         try:
+            self._condition_trigger.wait_for(lambda: (
+                  (not self._list_blocking)
+               or self._event_interval_trigger_force.is_set()
+               or self._event_interval_trigger_flush.is_set()
+            ))
+         finally:
+            self._condition_trigger.release()
+         
          self._lock_list_blocking.acquire()
          
          try:
-            while (self._list_blocking):
-               if (self._event_interval_trigger_force.wait(timeout=0.0)):
-                  self._event_interval_trigger_force.clear()
-                  
-                  self._trigger_events(
-                     event             = flags.INTERVAL_EVENT_TRIGGER_FORCE,
-                     event_description = (
-                        descriptors.INTERVAL_EVENT_TRIGGER_FORCE
-                     ),
-                     combine           = True,
-                  )
-                  
-                  for identifier, times_retain in self._list_blocking.items():
-                     if (times_retain < 0):
-                        self._list_blocking[identifier]  = -1
-                     elif (times_retain > 0):
-                        self._list_blocking[identifier] -=  1
-                     else:
-                        self._list_blocking.pop(identifier)
-                  
-                  break
-               elif (self._event_interval_trigger_flush.wait(timeout=0.0)):
-                  return False
+            if (not self._list_blocking):
+               pass
+            elif (self._event_interval_trigger_force.is_set()):
+               self._event_interval_trigger_force.clear()
+               
+               self._trigger_events(
+                  event             = flags.INTERVAL_EVENT_TRIGGER_FORCE,
+                  event_description = (
+                     descriptors.INTERVAL_EVENT_TRIGGER_FORCE
+                  ),
+                  combine           = True,
+               )
+               
+               for identifier, times_retain in list(
+                  self._list_blocking.items()
+               ):
+                  if (times_retain < 0):
+                     self._list_blocking[identifier]  = -1
+                  elif (times_retain > 0):
+                     self._list_blocking[identifier] -=  1
+                  else:
+                     self._list_blocking.pop(identifier)
+            elif (self._event_interval_trigger_flush.is_set()):
+               return False
          finally:
             self._lock_list_blocking.release()
          
          self._trigger_trigger()
       finally:
-         self._lock_trigger.release()
+         self._lock_trigger.release()
+      
+      return True
+   
+   def _trigger_wake (
+      self,
+      event = None,
+   ):
+      """Wake pre-trigger process, upon change of its conditions.
+      
+      Sets event (if any), then notifies all waiting on _condition_trigger,
+      so that pre-trigger process re-evaluates its conditions.
+      
+      Parameters
+      ----------
+      event : Event, NoneType, default=None
+         Event to be set before waking.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      if (event is not None):
+         event.set()
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         self._condition_trigger.notify_all()
+      finally:
+         self._condition_trigger.release()
       
       return True
    
@@ -1693,13 +3943,50 @@ class Trigger:
          except:
             pass
          
+         self._lock_list_waiting.acquire()
+         
+         try:
+            waiting = tuple(self._list_waiting)
+         finally:
+            self._lock_list_waiting.release()
+         
          self._event_trigger_activation.set()
          
-         time.sleep(self._interval_trigger)
+         self._trigger_sleep(
+            duration  = self._interval_trigger,
+            predicate = lambda: all(
+                  (identifier in self._list_activated)
+               or (identifier not in self._list_waiting)
+               for identifier in waiting
+            ),
+         )
+         
+         self._lock_list_waiting.acquire()
+         
+         try:
+            self._list_passed.clear()
+         finally:
+            self._lock_list_waiting.release()
          
          self._event_trigger_activation.clear()
          self._event_trigger_trigger.set()
          
+         self._stats_tick(
+            event      = event,
+            event_time = event_time,
+         )
+         
+         self._timer_fire()
+         
+         self._debug(
+            debug_originator  = 'libprogress.trigger.trigger',
+            event             = event,
+            event_description = event_description,
+         )
+         
+         if (self._executor is not None):
+            self._trigger_submit()
+         
          try:
             self._notify(
                event             = event,
@@ -1710,16 +3997,199 @@ class Trigger:
          except:
             pass
          
-         self._event_clock_reset.set()
-         time.sleep(self._interval_trigger_activation)
+         self._trigger_wake(self._event_clock_reset)
+         
+         # Passage tracked per trigger, as persistent identifiers (e.g.
+         # bound functions) re-enter waiting list right after passing.
+         self._trigger_sleep(
+            duration  = self._interval_trigger_activation,
+            predicate = lambda: all(
+                  (identifier in self._list_passed)
+               or (identifier not in self._list_waiting)
+               for identifier in waiting
+            ),
+         )
          
          self._event_trigger_trigger.clear()
       finally:
          self._event_trigger_activation.clear()
          self._event_trigger_trigger.clear()
+         
+         self._trigger_wake()
+      
+      return True
+   
+   def _trigger_sleep (
+      self,
+      duration,
+      predicate,
+   ):
+      """Sleep through trigger's pre-active or active duration.
+      
+      In virtual mode, sleep is cut short as soon as predicate holds, i.e.
+      once all waiters have passed the current trigger state, with duration
+      only acting as (wall time) upper bound.
+      
+      Parameters
+      ----------
+      duration : int, float
+         Duration to sleep for.
+      predicate : callable
+         Condition upon which sleep ends early, in virtual mode.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      """
+      
+      if (not (self._mode & flags.MODE_VIRTUAL)):
+         time.sleep(duration)
+         
+         return True
+      
+      self._condition_trigger.acquire()
+      
+      try:
+         self._condition_trigger.wait_for(predicate, timeout=duration)
+      finally:
+         self._condition_trigger.release()
       
       return True
    
+   def _trigger_submit (self):
+      """Submits bound functions to executor, upon trigger.
+      
+      Holds a block on behalf of each bound function (not still running from
+      an earlier trigger) and submits it to executor, with completion acting
+      as release (see _trigger_submit_done).
+      
+      Returns
+      -------
+      int
+         Returns number of functions submitted.
+      """
+      
+      submitted = list()
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         for identifier, bound in self._list_bound.items():
+            if (
+                   (not bound[4])
+               or ((bound[5] is not None) and (not bound[5].done()))
+            ):
+               continue
+            
+            if (bound[4] > 0):
+               bound[4] -= 1
+            
+            self._lock_list_blocking.acquire()
+            
+            try:
+               self._list_blocking[identifier] = bound[3]
+            finally:
+               self._lock_list_blocking.release()
+            
+            self._stats_block(
+               identifier = identifier,
+               function   = bound[0],
+            )
+            
+            try:
+               bound[5] = self._executor.submit(
+                  self._trigger_bind_iterate,
+                  
+                  trigger_bound_function = bound[0],
+                  args                   = bound[1],
+                  kwargs                 = bound[2],
+                  
+                  iterations             = bound[8],
+                  until_idle             = bound[9],
+               )
+            except:
+               bound[5] = None
+               
+               self.release(identifier)
+               
+               continue
+            
+            submitted.append((identifier, bound[5]))
+      finally:
+         self._lock_list_bound.release()
+      
+      # Outside lock, as callbacks run right away for completed futures.
+      for identifier, future in submitted:
+         future.add_done_callback(partial(
+            self._trigger_submit_done,
+            identifier,
+         ))
+      
+      return len(submitted)
+   
+   def _trigger_submit_done (
+      self,
+      identifier,
+      future,
+   ):
+      """Receive point (callback) for completion of submitted function.
+      
+      Releases block held on behalf of function, and unbinds it if its
+      times_recurse has expired. Exception raised by function is recorded
+      (see _trigger_bind_error).
+      
+      Parameters
+      ----------
+      identifier : str
+         Identifier function is bound with.
+      future : Future
+         Future of completed function.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      bound = None
+      error = (
+         None
+         if (future.cancelled())
+         else
+         future.exception()
+      )
+      
+      self._lock_list_bound.acquire()
+      
+      try:
+         function = self._list_bound.get(identifier, [None])[0]
+         
+         if (
+                (identifier in self._list_bound)
+            and (not self._list_bound[identifier][4])
+         ):
+            bound = self._list_bound.pop(identifier)
+      finally:
+         self._lock_list_bound.release()
+      
+      if (error is not None):
+         self._trigger_bind_error(
+            identifier = identifier,
+            function   = function,
+            error      = error,
+         )
+      
+      self.release(identifier)
+      
+      if (bound is not None):
+         if (bound[7]):
+            app.libcommon.identifier.delete(identifier)
+         
+         bound[6].set()
+      
+      return None
+   
    def _trigger_events (
       self,
       event             =       flags.INTERVAL_EVENT_NONE,
@@ -1833,6 +4303,11 @@ class Trigger:
       Core clock functionality for automatic operation modes.
       Responsible for most of the automated operations like firing trigger,
       resetting clock on trigger, checking when to fire which event, and more.
+      Clock updates are scheduled against perf_counter deadlines, one every
+      clock_interval since clock reset, with clock time derived from elapsed
+      time (in whole steps), so that overheads and sleep overshoots do not
+      accumulate as drift. Virtual mode, and zero clock_interval (busy
+      loop), step clock per update instead.
       
       Returns
       -------
@@ -1842,6 +4317,9 @@ class Trigger:
       
       retries_trigger_auto_add = self._retries_trigger_auto_add
       
+      time_reset               = time.perf_counter()
+      clock_steps              = 0
+      
       while (self._clock_active):
          event             =       flags.INTERVAL_EVENT_NONE
          event_description = descriptors.INTERVAL_EVENT_NONE
@@ -1851,14 +4329,12 @@ class Trigger:
             self._event_clock_reset.clear()
             self._event_interval_trigger.clear()
             
+            self._clock_epoch       += self._clock_time
             self._clock_time         = 0.0
             retries_trigger_auto_add = self._retries_trigger_auto_add
             
-            thread_trigger           = Thread(
-               target = self._trigger,
-               daemon = False,
-            )
-            self._thread_trigger     = thread_trigger
+            time_reset               = time.perf_counter()
+            clock_steps              = 0
             
             self._trigger_events(
                event             =       flags.INTERVAL_EVENT_TRIGGER,
@@ -1869,10 +4345,10 @@ class Trigger:
                reset             = True,
             )
             
-            thread_trigger.start()
+            self._trigger_request()
          elif (
                 (self._clock_time >= self._interval_trigger_auto_add)
-            and (not self._lock_trigger.locked())
+            and (self._trigger_completed == self._trigger_requested)
             and (not retries_trigger_auto_add)
          ):
             error_description = (
@@ -1880,7 +4356,7 @@ class Trigger:
             )
          elif (
                 (self._clock_time >= self._interval_trigger_auto_add)
-            and (not self._lock_trigger.locked())
+            and (self._trigger_completed == self._trigger_requested)
             and retries_trigger_auto_add
          ):
             retries_trigger_auto_add -= 1
@@ -1891,19 +4367,13 @@ class Trigger:
             self._event_interval_trigger_force.clear()
             self._event_interval_trigger_flush.clear()
             
-            thread_trigger       = Thread(
-               target = self._trigger,
-               daemon = False,
-            )
-            self._thread_trigger = thread_trigger
-            
             self._trigger_events(
                event             =       flags.INTERVAL_EVENT_TRIGGER,
                event_description = descriptors.INTERVAL_EVENT_TRIGGER,
                change            = True,
             )
             
-            thread_trigger.start()
+            self._trigger_request()
          elif (
                 (self._clock_time >= self._interval_min)
             and (not self._trigger_events(
@@ -1914,7 +4384,7 @@ class Trigger:
             event             =       flags.INTERVAL_EVENT_EXCEED_MIN
             event_description = descriptors.INTERVAL_EVENT_EXCEED_MIN
             
-            self._event_interval_trigger.set()
+            self._trigger_wake(self._event_interval_trigger)
          elif (
                 (self._clock_time >= self._interval_max)
             and (not self._trigger_events(
@@ -1956,11 +4426,108 @@ class Trigger:
                event_description = event_description,
             )
          
-         time.sleep(self._clock_interval)
-         self._clock_time += self._clock_step
+         # Halts inline (joining itself is skipped), unless a concurrent
+         # switch holds on, which stops (or restarts) clock itself anyway.
+         if (
+                self._clock_halt
+            and (self._modes_switch(
+               activate          = False,
+               lock_wait         = False,
+            ) is not None)
+         ):
+            self._clock_halt  = False
+            
+            continue
+         
+         if (self._mode & flags.MODE_VIRTUAL):
+            self._condition_trigger.acquire()
+            
+            try:
+               self._condition_trigger.wait_for(
+                  self._clock_idle,
+                  timeout = self._clock_interval,
+               )
+            finally:
+               self._condition_trigger.release()
+            
+            self._clock_time += self._clock_step
+         elif (not self._clock_interval):
+            time.sleep(0)
+            
+            self._clock_time += self._clock_step
+         else:
+            clock_steps      += 1
+            
+            self._clock_sleep(
+               time_reset + (clock_steps * self._clock_interval),
+            )
+            
+            clock_steps       = max(
+               clock_steps,
+               int((time.perf_counter() - time_reset) / self._clock_interval),
+            )
+            
+            self._clock_time  = clock_steps * self._clock_step
       
       return None
    
+   def _clock_sleep (
+      self,
+      time_due,
+   ):
+      """Sleep until deadline, spinning for last clock_spin duration.
+      
+      Spinning yields (sleep(0)) on each check, so that other threads keep
+      running meanwhile.
+      
+      Parameters
+      ----------
+      time_due : float
+         Deadline, as instantaneous (perf_counter) time.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
+      duration = time_due - time.perf_counter() - self._clock_spin
+      
+      if (duration > 0):
+         time.sleep(duration)
+      
+      while (time.perf_counter() < time_due):
+         time.sleep(0)
+      
+      return None
+   
+   def _clock_idle (self):
+      """Check whether virtual clock can step forward without sleeping.
+      
+      System is idle when no block is held, no waiter is in transit between
+      trigger and block, and no trigger is pending or in progress; virtual
+      time then jumps ahead, else clock steps at wall time pace.
+      Also holds upon clock reset or deactivation, for clock to process them.
+      
+      Returns
+      -------
+      bool
+         Returns True if clock can step forward right away.
+      """
+      
+      return (
+            (not self._clock_active)
+         or self._event_clock_reset.is_set()
+         or (
+                (not self._list_blocking)
+            and (not self._list_transit)
+            and (not self._event_interval_trigger.is_set())
+            and (not self._event_trigger_pre_min_force.is_set())
+            and (not self._event_trigger_activation.is_set())
+            and (not self._event_trigger_trigger.is_set())
+         )
+      )
+   
    def _clock_interval_exceed_action (
       self,
       event             =       flags.INTERVAL_EVENT_NONE,
@@ -1996,6 +4563,8 @@ class Trigger:
       else:
          return None
       
+      self._stats_count('exceeds')
+      
       if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_NONE):
          return None
       
@@ -2011,7 +4580,9 @@ class Trigger:
          )
       
       if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_TRIGGER_FORCE):
-         self._event_interval_trigger_force.set()
+         self._stats_count('forces')
+         
+         self._trigger_wake(self._event_interval_trigger_force)
       
       if (interval_exceed_actions & flags.INTERVAL_EXCEED_ACTION_ERROR_RAISE):
          self._errors(
@@ -2036,15 +4607,8 @@ class Trigger:
             combine                = True,
          )
          
-         Thread(
-            target                 = self.state,
-            kwargs                 = {
-               'activate'           : False,
-               'non_blocking'       : False,
-               'errors'             : True,
-            },
-            daemon                 = False,
-         ).start()
+         # Processed by clock thread itself (see _clock_thread).
+         self._clock_halt          = True
       
       return True
    
@@ -2206,32 +4770,53 @@ class Trigger:
       debug_originator='libprogress.trigger.debug.trace.anonymous',
       **kwargs,
    ):
+      """Record a debug trace, as last one of its originator.
+      
+      Only one in every debug_sample traces is recorded. Recorded traces are
+      also logged (see _debug_log).
+      
+      Parameters
+      ----------
+      debug_originator : object, default='...debug.trace.anonymous'
+         Originator of trace.
+      **kwargs : dict
+         Data of trace.
+      
+      Returns
+      -------
+      bool
+         Returns False if originator is invalid, else True.
+      NoneType
+         Returns None if not recorded (disabled or skipped by sampling).
+      """
+      
       if (not self._debug_allow_trace):
          return None
       
+      sequence         = next(self._debug_sequence)
+      
+      if (sequence % self._debug_sample):
+         return None
+      
       try:
          debug_originator = str(debug_originator)
       except:
          self._debug(
             debug_originator = 'libprogress.trigger.debug.trace.str_failure',
-            originator       = debug_originator,
             **kwargs,
          )
          
          return False
       
-      debug_trace = {
+      debug_trace      = {
+         'sequence'  : sequence,
          'clock_time': self._clock_time,
          'originator': debug_originator,
          'data'      : kwargs,
       }
       
-      self._lock_debug_trace.acquire()
-      
-      try:
-         self._debug_data_trace[originator] = debug_trace
-      finally:
-         self._lock_debug_trace.release()
+      # Lock-free, single item assignments and deque appends being atomic.
+      self._debug_data_trace[debug_originator] = debug_trace
       
       self._debug_log(
          originator  = debug_originator,
@@ -2245,33 +4830,163 @@ class Trigger:
       originator,
       debug_trace,
    ):
+      """Log a debug trace into ring buffer, and enqueue it for sink.
+      
+      Parameters
+      ----------
+      originator : str
+         Originator of trace.
+      debug_trace : dict
+         Trace to log.
+      
+      Returns
+      -------
+      bool
+         Returns True.
+      NoneType
+         Returns None if log is disabled.
+      """
+      
       if (not self._debug_allow_log):
          return None
       
+      self._debug_data_origin_tracker[originator] = debug_trace['sequence']
+      self._debug_data_log.append(debug_trace)
+      
+      if (self._debug_sink is not None):
+         self._debug_queue_sink.append(debug_trace)
+         self._event_debug_sink.set()
+      
+      return True
+   
+   def _debug_sink_start (self):
+      """Start thread draining logged debug traces to sink, upon activation.
+      
+      Traces logged while inactive remain pending (up-to debug_capacity),
+      for drain upon activation.
+      
+      Returns
+      -------
+      bool
+         Returns True if started.
+      NoneType
+         Returns None if log is disabled, or no sink is set.
+      """
+      
+      if (
+            (not self._debug_allow_log)
+         or (self._debug_sink is None)
+      ):
+         return None
+      
+      self._debug_sink_active       = True
+      
+      self._thread_debug_sink       = Thread(
+         target = self._debug_sink_thread,
+         daemon = True,
+      )
+      self._thread_debug_sink.start()
+      
+      return True
+   
+   def _debug_sink_stop (self):
+      """Stop and join thread draining logged debug traces to sink.
+      
+      Thread drains pending traces, then closes sink (if a file path) before
+      returning.
+      
+      Returns
+      -------
+      bool
+         Returns True if stopped.
+      NoneType
+         Returns None if not started.
+      """
+      
+      if (self._thread_debug_sink is None):
+         return None
+      
+      self._debug_sink_active       = False
+      self._event_debug_sink.set()
+      
+      self._thread_debug_sink.join()
+      
+      self._thread_debug_sink       = None
+      
+      return True
+   
+   def _debug_sink_thread (self):
+      """Drain logged debug traces to sink, as JSON lines.
+      
+      Sink (if a file path) is opened in append mode, and closed once
+      stopped (see _debug_sink_stop), after draining pending traces. Non
+      serializable data is written as its string. Exceptions raised while
+      writing are consumed, dropping traces, so that tracing never stalls
+      system.
+      
+      Returns
+      -------
+      NoneType
+         Returns None.
+      """
+      
       try:
-         originator = str(originator)
-      except:
-         self._debug(
-            debug_originator = 'libprogress.trigger.debug.log.str_failure',
-            originator       = originator,
-            debug_trace      = debug_trace,
+         sink = (
+            open(self._debug_sink, 'a')
+            if (isinstance(self._debug_sink, str))
+            else
+            self._debug_sink
          )
-         
-         return False
-      
-      self._lock_debug_log.acquire()
+      except:
+         return None
       
       try:
-         if (type(self._debug_data_origin_tracker[originator]).__name__
-            not in ('list',)
-         ):
-            self._debug_data_origin_tracker[originator] = list()
+         active = True
          
-         self._debug_data_origin_tracker[originator].append(
-            len(self._debug_data_log)
-         )
-         self._debug_data_log.append(debug_trace)
+         while (active):
+            self._event_debug_sink.wait()
+            self._event_debug_sink.clear()
+            
+            active = self._debug_sink_active
+            
+            try:
+               while (self._debug_queue_sink):
+                  sink.write(json.dumps(
+                     self._debug_queue_sink.popleft(),
+                     default = str,
+                  ) + '\n')
+               
+               sink.flush()
+            except:
+               pass
       finally:
-         self._lock_debug_log.release()
+         if (sink is not self._debug_sink):
+            sink.close()
       
-      return True
+      return None
+   
+   def traces (
+      self,
+      originator = None,
+   ):
+      """Query logged debug traces, as a single snapshot.
+      
+      Parameters
+      ----------
+      originator : str, NoneType, default=None
+         Originator to filter traces for, None for all.
+      
+      Returns
+      -------
+      list
+         Returns last (up-to debug_capacity) logged traces, oldest first.
+      """
+      
+      return [
+         debug_trace
+         for debug_trace in tuple(self._debug_data_log)
+         if (
+               (originator is None)
+            or (debug_trace['originator'] == originator)
+         )
+      ]
@@ -0,0 +1,10 @@
+"""Test configuration - sources are imported from src, without installing."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(
+   os.path.dirname(os.path.abspath(__file__)),
+   os.pardir,
+   'src',
+))
@@ -0,0 +1,87 @@
+"""Tests - queue (stream) objects."""
+
+from nsim.libhardwareinterface import queue as Q
+from nsim.libcommon.identifier import Identifier as identifier
+
+def test_notification_identifier_leak ():
+   """One-shot anonymous alerts leave no identifiers active once sent."""
+   
+   stream            = Q.queue(capacity=1)
+   identities_active = len(identifier.identity_active)
+   
+   for _ in range(1000):
+      stream.flow_in(data=[b'x'])
+      stream.notification_alert(
+         callback = (lambda **kwargs: None),
+         events   = Q.flags.QUEUE_EVENT_WRITABLE,
+         times    = 1,
+      )
+      stream.flow_out(data_length=1)
+   
+   assert len(identifier.identity_active) == identities_active
+
+def test_stream_park_identifier_leak ():
+   """Parking layer's transfers registers no identifiers, one alert only."""
+   
+   class Layer (Q.streampark):
+      pass
+   
+   layer             = Layer()
+   stream            = Q.queue(capacity=1)
+   identities_active = len(identifier.identity_active)
+   
+   stream.flow_in(data=[b'x'])
+   
+   for _ in range(1000):
+      assert not layer._stream_flow_in(stream, bytearray(b'y'))
+      assert layer._stream_parked(stream)
+      
+      stream.flow_out(data_length=1)
+      
+      assert not layer._stream_parked(stream)
+      assert layer._stream_flow_in(stream, bytearray(b'x'))
+   
+   assert len(identifier.identity_active) == identities_active
+
+def test_flow_in_generator ():
+   """Iterables without length are pushed as lists, for all engines."""
+   
+   for queue_engine in (
+      Q.flags.QUEUE_ENGINE_LINEAR,
+      Q.flags.QUEUE_ENGINE_RING,
+      Q.flags.QUEUE_ENGINE_SPSC,
+   ):
+      stream = Q.queue(
+         capacity     = 3,
+         queue_engine = queue_engine,
+      )
+      
+      assert stream.flow_in(
+         data = (bytearray([index]) for index in range(5)),
+      ) == 3
+      assert stream.flow_in(data=iter(())) is None
+      assert stream.flow_out(data_length=-1) == [
+         bytearray([index])
+         for index in range(3)
+      ]
+      assert stream.flow_in(
+         data    = (bytearray([index]) for index in range(2)),
+         block   = True,
+         timeout = 0.1,
+      ) == 2
+
+def test_flow_in_generator_shared ():
+   """Iterables without length are pushed as lists, into shared queue."""
+   
+   stream = Q.sharedqueue(capacity=3)
+   
+   try:
+      assert stream.flow_in(
+         data = (bytes([index]) for index in range(5)),
+      ) == 3
+      assert stream.flow_out(data_length=-1) == [
+         bytearray([index])
+         for index in range(3)
+      ]
+   finally:
+      stream.close()
@@ -0,0 +1,103 @@
+"""Tests - timing wheel backing trigger system's schedule."""
+
+import random
+
+from nsim.libprogress.trigger.timingwheel import TimingWheel as timingwheel
+
+def test_cascade_boundary_expiry ():
+   """Timer due on a cascading unit expires on that unit, not a cycle late."""
+   
+   for slots, levels in ((64, 2), (4, 3), (2, 4)):
+      wheel     = timingwheel(
+         resolution = 1,
+         slots      = slots,
+         levels     = levels,
+      )
+      
+      for level in range(1, levels):
+         unit_due = slots ** level
+         
+         wheel.schedule(
+            time_due = unit_due,
+            callback = None,
+            args     = [unit_due],
+         )
+      
+      for unit in range(1, (slots ** (levels - 1)) + 1):
+         expired = [
+            args[0]
+            for _, args, _ in wheel.advance(unit)
+         ]
+         
+         assert expired == [
+            unit_due
+            for unit_due in (slots ** level for level in range(1, levels))
+            if (unit_due == unit)
+         ], (slots, levels, unit)
+      
+      assert wheel.pending() == 0
+
+def test_reference ():
+   """Expiry matches a plain (unit due per timer) reference, in due order."""
+   
+   randomizer = random.Random(0)
+   
+   for slots, levels in ((2, 1), (4, 3), (8, 4), (64, 2)):
+      wheel     = timingwheel(
+         resolution = 0.5,
+         slots      = slots,
+         levels     = levels,
+      )
+      bits      = slots.bit_length() - 1
+      span      = slots ** levels
+      reference = dict()  # {
+                          #    key: [unit_due, handle],
+                          # }
+      unit      = 0
+      
+      for key in range(1000):
+         unit_due = unit + randomizer.randint(-2, (2 * span))
+         
+         # Rounded up to a cascading unit of a random level.
+         if (randomizer.random() < 0.5):
+            shift    = bits * randomizer.randint(1, levels)
+            unit_due = ((unit_due >> shift) + 1) << shift
+         
+         reference[key] = [
+            max(unit_due, (unit + 1)),
+            wheel.schedule(
+               time_due = (unit_due * 0.5),
+               callback = None,
+               args     = [key],
+            ),
+         ]
+         
+         if (randomizer.random() < 0.1):
+            wheel.cancel(reference.pop(
+               randomizer.choice(tuple(reference))
+            )[1])
+         
+         unit    += randomizer.choice((
+            0,
+            1,
+            randomizer.randint(1, slots),
+         ))
+         expired  = [
+            args[0]
+            for _, args, _ in wheel.advance(unit * 0.5)
+         ]
+         
+         assert sorted(expired) == sorted(
+            key_due
+            for key_due, timer in reference.items()
+            if (timer[0] <= unit)
+         ), (slots, levels, unit)
+         assert [reference[key_due][0] for key_due in expired] == sorted(
+            reference[key_due][0]
+            for key_due in expired
+         ), (slots, levels, unit)
+         
+         for key_due in expired:
+            reference.pop(key_due)
+         
+         assert wheel.pending() == len(reference)
@@ -0,0 +1,83 @@
+"""Tests - trigger system."""
+
+import time
+import threading
+
+from nsim.libprogress.trigger.trigger import Trigger as trigger
+from nsim.libprogress.trigger.flags import Flags as flags
+
+def _ticks_per_s (
+   mode,
+   blockers = 0,
+   interval = 0.05,
+   duration = 0.5,
+):
+   """Run trigger system with two bound functions, measuring tick rate."""
+   
+   event_stop     = threading.Event()
+   
+   def blocker (identifier):
+      while (not event_stop.is_set()):
+         trigger_system.wait(identifier=identifier)
+         trigger_system.block(identifier=identifier)
+         trigger_system.release(identifier)
+   
+   trigger_system = trigger(
+      mode                            = mode,
+      
+      interval_trigger_activation     = interval,
+      interval_trigger                = interval,
+      interval_min                    = interval,
+      interval_max                    = 1,
+      interval_critical               = 2,
+      interval_trigger_auto_add       = 3,
+      
+      clock_interval                  = 0.0001,
+      clock_step                      = 0.0001,
+      
+      interval_exceed_action_min      = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+      interval_exceed_action_max      = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+      interval_exceed_action_critical = flags.INTERVAL_EXCEED_ACTION_IGNORE,
+   )
+   
+   for _ in range(2):
+      trigger_system.trigger_bind(
+         trigger_bound_function = (lambda: None),
+      )
+   
+   for index in range(blockers):
+      threading.Thread(
+         target = blocker,
+         args   = ('test.blocker.{0}'.format(index),),
+         daemon = True,
+      ).start()
+   
+   trigger_system.mode(activate=True)
+   
+   ticks_start    = trigger_system.stats()['ticks']
+   time_start     = time.perf_counter()
+   
+   time.sleep(duration)
+   
+   ticks          = trigger_system.stats()['ticks'] - ticks_start
+   time_elapsed   = time.perf_counter() - time_start
+   
+   event_stop.set()
+   trigger_system.mode(activate=False)
+   
+   return (ticks / time_elapsed)
+
+def test_virtual_passage ():
+   """Virtual modes cut states short once all waiters passed each trigger.
+   
+   Sleeping through active states alone would cap rate at 1 / interval.
+   """
+   
+   for mode in (flags.MODE_AUTO_VIRTUAL, flags.MODE_HYBRID_VIRTUAL):
+      for blockers in (0, 2):
+         ticks_per_s = _ticks_per_s(
+            mode     = mode,
+            blockers = blockers,
+         )
+         
+         assert ticks_per_s > (5 / 0.05), (mode, blockers, ticks_per_s)